@@ -0,0 +1,383 @@
+"""Benchmarks for the configs package, compared against a baseline
+
+Usage:
+    python benchmarks/config_benchmarks.py [--baseline FILE] [--threshold N]
+        [--repeat N] [--save-baseline] [NAME ...]
+
+Each benchmark is timed several times and the fastest time per call is kept,
+as that is the one least affected by whatever else the machine was doing. A
+benchmark is flagged as a regression if it is more than --threshold (a
+fraction) slower than its baseline. The exit status is 1 if there are any
+regressions.
+
+Timings depend on the machine, so baselines are not kept in the repository.
+If the baseline file doesn't exist yet the results are saved as the baseline.
+Otherwise, record a new baseline with --save-baseline before changing
+anything.
+"""
+# pytype dislikes this import. Making resources a package caused strange pytest
+# errors, so that isn't a solution.
+# pytype: disable=import-error
+
+from collections import OrderedDict
+from StringIO import StringIO
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+
+try:
+    # typing not available on XBMC4XBOX
+    from typing import Any, Callable, Dict, List, Optional, Tuple
+except:
+    pass
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_ROOT, "script.ind_bios_config_editor", "resources"))
+
+from lib.configs import IndBiosConfig
+
+# pytype: enable=import-error
+
+_TEST_CONFIGS_DIRECTORY = os.path.join(_ROOT, "tests", "configs", "test_configs")
+_DEFAULT_BASELINE_FILENAME = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baselines.json"
+)
+# Each benchmark is called enough times to take at least this many seconds,
+# so that the resolution of the clock doesn't matter
+_MIN_TIME = 0.2
+
+# Maps the name of each benchmark to a function that does any setup and
+# returns the function to time
+_BENCHMARKS = OrderedDict()  # type: Dict[str, Callable[[], Callable[[], Any]]]
+
+
+def _benchmark(name):
+    """Decorator that adds a benchmark"""
+    # type: (str) -> Callable
+
+    def decorator(setup):
+        _BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+def _get_test_config_filenames():
+    # type: () -> List[str]
+    return sorted(
+        os.path.join(_TEST_CONFIGS_DIRECTORY, filename)
+        for filename in os.listdir(_TEST_CONFIGS_DIRECTORY)
+        if filename.endswith(".cfg")
+    )
+
+
+def _get_valid_config():
+    """:returns: a config with (mostly) non default values"""
+    # type: () -> IndBiosConfig
+    config = IndBiosConfig()
+    config.read(os.path.join(_TEST_CONFIGS_DIRECTORY, "valid1.cfg"))
+    return config
+
+
+def _generate_config_text(rng, lines_between_fields):
+    """:returns: a config file containing every field, in a random order,\
+            with comments and blank lines between them
+    """
+    # type: (random.Random, int) -> str
+    output = StringIO()
+    _get_valid_config().write(output, dont_write_option_if_value_default=False)
+    field_lines = output.getvalue().splitlines()
+    rng.shuffle(field_lines)
+
+    lines = []
+    for field_line in field_lines:
+        lines.append(field_line + "\t;a comment after the value")
+        for _ in range(lines_between_fields):
+            lines.append(rng.choice(("", ";a comment on its own", "   ")))
+    return "\n".join(lines) + "\n"
+
+
+@_benchmark("construct")
+def _construct():
+    return IndBiosConfig
+
+
+@_benchmark("read_test_configs")
+def _read_test_configs():
+    filenames = _get_test_config_filenames()
+
+    def read_test_configs():
+        for filename in filenames:
+            IndBiosConfig().read(filename)
+
+    return read_test_configs
+
+
+@_benchmark("readfp_generated_large")
+def _readfp_generated_large():
+    # Several thousand lines
+    text = _generate_config_text(random.Random(0), 100)
+    return lambda: IndBiosConfig().readfp(StringIO(text))
+
+
+@_benchmark("readfp_generated_corpus")
+def _readfp_generated_corpus():
+    rng = random.Random(0)
+    texts = [_generate_config_text(rng, rng.randint(0, 3)) for _ in range(100)]
+
+    def readfp_generated_corpus():
+        for text in texts:
+            IndBiosConfig().readfp(StringIO(text))
+
+    return readfp_generated_corpus
+
+
+@_benchmark("get_all_fields")
+def _get_all_fields():
+    config = _get_valid_config()
+    options = config.options()
+
+    def get_all_fields():
+        for option in options:
+            config.get(option)
+
+    return get_all_fields
+
+
+def _set_all_fields(validate):
+    # type: (bool) -> Callable[[], None]
+    config = IndBiosConfig()
+    # Alternate between two sets of values so that every set changes the value
+    values = [_get_valid_config().get_many(config.options()), config.defaults()]
+
+    def set_all_fields():
+        for option_values in values:
+            for option, value in option_values.iteritems():
+                config.set(option, value, validate_option_name_and_value=validate)
+
+    return set_all_fields
+
+
+@_benchmark("set_all_fields")
+def _set_all_fields_validated():
+    return _set_all_fields(True)
+
+
+@_benchmark("set_all_fields_without_validation")
+def _set_all_fields_without_validation():
+    return _set_all_fields(False)
+
+
+def _write(dont_write_option_if_value_default):
+    # type: (bool) -> Callable[[], None]
+    config = _get_valid_config()
+    return lambda: config.write(
+        StringIO(),
+        dont_write_option_if_value_default=dont_write_option_if_value_default,
+    )
+
+
+@_benchmark("write_skipping_defaults")
+def _write_skipping_defaults():
+    return _write(True)
+
+
+@_benchmark("write_all_fields")
+def _write_all_fields():
+    return _write(False)
+
+
+# The fields in the Flubber tab, which is what a preset is usually loaded into
+_FLUBBER_TAB_FIELDS = (
+    "GLOWCOLOR",
+    "IOGLOWCOLOR",
+    "FOGON",
+    "FOG1COLOR",
+    "FOG2COLOR",
+    "SHOWFLUB",
+    "NOSOUND",
+    "480P",
+    "FASTANI",
+    "CAMERAVIEW",
+    "IFILTER",
+    "BLOBBGC",
+    "BLOBSDEAD",
+    "WIREFRAMEBLOB",
+    "BLOBTHROB",
+    "SLOWMOBLOB",
+    "SPIKEYBLOB",
+    "BLOBCOLOR",
+    "BLOBRADI",
+    "CUSTOMBLOB",
+    "NOFLUBBG",
+    "SCENECOLOR1",
+    "SCENECOLOR2",
+    "SCENECOLOR3",
+)
+
+
+def _load_preset(fields):
+    """:param fields: the fields to load, or None for every field"""
+    # type: (Optional[Tuple[str, ...]]) -> Callable[[], None]
+    config = IndBiosConfig()
+    preset_filename = os.path.join(_TEST_CONFIGS_DIRECTORY, "valid2.cfg")
+    if fields is None:
+        fields = tuple(config.options())
+    return lambda: config.load_preset(preset_filename, fields)
+
+
+@_benchmark("load_preset")
+def _load_preset_into_tab():
+    return _load_preset(_FLUBBER_TAB_FIELDS)
+
+
+@_benchmark("load_preset_all_fields")
+def _load_preset_all_fields():
+    return _load_preset(None)
+
+
+def _time(function, repeat):
+    """:returns: the fastest time (in seconds) that function took per call"""
+    # type: (Callable[[], Any], int) -> float
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        time_taken = timer.timeit(number)
+        if time_taken >= _MIN_TIME:
+            break
+        number *= 10 if time_taken < _MIN_TIME / 10 else 2
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run_benchmarks(names, repeat):
+    """:param names: the benchmarks to run
+    :returns: the time per call (in seconds) of each benchmark
+    """
+    # type: (List[str], int) -> Dict[str, float]
+    results = OrderedDict()
+    for name in names:
+        results[name] = _time(_BENCHMARKS[name](), repeat)
+    return results
+
+
+def compare_to_baseline(results, baseline, threshold):
+    """:param threshold: fraction slower than the baseline that a benchmark\
+            must be to be a regression e.g. 0.2 for 20%
+    :returns: a row for each benchmark with its name, time, baseline time\
+            (None if it has no baseline), the ratio between them and whether\
+            it is a regression
+    """
+    # type: (Dict[str, float], Dict[str, float], float) -> List[Dict[str, Any]]
+    rows = []
+    for name, time_taken in results.iteritems():
+        baseline_time = baseline.get(name)
+        ratio = None if not baseline_time else time_taken / baseline_time
+        rows.append(
+            {
+                "name": name,
+                "time": time_taken,
+                "baseline": baseline_time,
+                "ratio": ratio,
+                "regression": ratio is not None and ratio > 1 + threshold,
+            }
+        )
+    return rows
+
+
+def _format_row(row):
+    # type: (Dict[str, Any]) -> str
+    def format_time(seconds):
+        return "-" if seconds is None else "%.1fus" % (seconds * 1000000)
+
+    return "%-36s %12s %12s %8s %s" % (
+        row["name"],
+        format_time(row["time"]),
+        format_time(row["baseline"]),
+        "-" if row["ratio"] is None else "%.2fx" % row["ratio"],
+        "REGRESSION" if row["regression"] else "",
+    )
+
+
+def _load_baseline(filename):
+    # type: (str) -> Dict[str, float]
+    try:
+        with open(filename) as fp:
+            return json.load(fp)
+    except EnvironmentError:
+        return {}
+
+
+def _save_baseline(filename, results):
+    # type: (str, Dict[str, float]) -> None
+    # Keep the baselines of benchmarks that weren't run this time
+    baseline = _load_baseline(filename)
+    baseline.update(results)
+    with open(filename, "w") as fp:
+        json.dump(baseline, fp, indent=2, separators=(",", ": "), sort_keys=True)
+        fp.write("\n")
+
+
+def _create_argument_parser():
+    # type: () -> argparse.ArgumentParser
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--baseline",
+        default=_DEFAULT_BASELINE_FILENAME,
+        help="JSON file containing the baseline time of each benchmark. It is "
+        "created from the results if it doesn't exist (defaults to "
+        "benchmarks/baselines.json, which is not committed)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="fraction slower than the baseline that counts as a regression "
+        "(defaults to 0.25)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=7,
+        help="number of times to time each benchmark (defaults to 7)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="store the results as the new baseline",
+    )
+    parser.add_argument(
+        "names",
+        nargs="*",
+        metavar="NAME",
+        help="benchmarks to run (defaults to all of them): " + ", ".join(_BENCHMARKS),
+    )
+    return parser
+
+
+def main(argv=None):
+    """:returns: the exit status"""
+    # type: (Optional[List[str]]) -> int
+    parser = _create_argument_parser()
+    args = parser.parse_args(argv)
+    for name in args.names:
+        if name not in _BENCHMARKS:
+            parser.error("unknown benchmark '" + name + "'")
+
+    results = run_benchmarks(args.names or list(_BENCHMARKS), args.repeat)
+    rows = compare_to_baseline(results, _load_baseline(args.baseline), args.threshold)
+    print("%-36s %12s %12s %8s" % ("benchmark", "time", "baseline", "ratio"))
+    for row in rows:
+        print(_format_row(row))
+
+    if args.save_baseline or not os.path.exists(args.baseline):
+        _save_baseline(args.baseline, results)
+        print("Saved the results as the baseline in " + args.baseline)
+        return 0
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""Command line tool for working with lots of iND-BiOS config files at once,
+without XBMC (e.g. config backups from many consoles)
+
+Usage:
+    python config_tool.py validate [--all] PATH [PATH ...]
+    python config_tool.py rewrite [--set FIELD=VALUE ...] [--preset FILE
+        [--preset-field FIELD ...]] [--write-defaults] [--fix-invalid] [--all]
+        PATH [PATH ...]
+
+Values given to --set are in config file format. A JSON report is written to
+stdout. The exit status is 1 if any file is invalid (validate) or could not
+be rewritten (rewrite). Files with invalid fields or lines are not rewritten
+unless --fix-invalid is given.
+"""
+# pytype dislikes this import. Making resources a package caused strange pytest
+# errors, so that isn't a solution.
+# pytype: disable=import-error
+
+import argparse
+import json
+import os
+import sys
+
+try:
+    # typing not available on XBMC4XBOX
+    from typing import Any, Dict, List, Optional, Tuple
+except:
+    pass
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "resources"))
+
+from lib.batch import (
+    find_config_files,
+    load_assignments,
+    rewrite_config_files,
+    validate_config_files,
+)
+from lib.configs import ConfigError
+
+# pytype: enable=import-error
+
+
+def _find_all_config_files(paths, extensions):
+    """:returns: every config file in paths, which may be files or directories"""
+    # type: (List[str], List[str]) -> List[str]
+    filenames = []
+    for path in paths:
+        filenames.extend(find_config_files(path, extensions=tuple(extensions)))
+    return filenames
+
+
+def _write_report(report):
+    """Write a report to stdout as JSON"""
+    # type: (Dict[str, Any]) -> None
+    json.dump(report, sys.stdout, indent=2, separators=(",", ": "), sort_keys=True)
+    sys.stdout.write("\n")
+
+
+def _validate(args):
+    """Validate config files and write the report to stdout
+
+    :returns: the exit status
+    """
+    # type: (argparse.Namespace) -> int
+    reports = validate_config_files(
+        _find_all_config_files(args.paths, args.extensions), processes=args.processes
+    )
+    invalid_reports = [report for report in reports if not report["valid"]]
+    _write_report(
+        {
+            "files_checked": len(reports),
+            "invalid_files": len(invalid_reports),
+            "files": reports if args.all else invalid_reports,
+        }
+    )
+    return 1 if invalid_reports else 0
+
+
+def _get_assignments(args):
+    """:returns: the assignments from --preset followed by those from --set"""
+    # type: (argparse.Namespace) -> List[Tuple[str, Any]]
+    assignments = []
+    if args.preset:
+        with open(args.preset) as fp:
+            assignments.extend(load_assignments(fp, fields=args.preset_fields))
+    assignments.extend(load_assignments(line + "\n" for line in args.set))
+    return assignments
+
+
+def _rewrite(args):
+    """Set fields in config files and write the report to stdout
+
+    :returns: the exit status
+    """
+    # type: (argparse.Namespace) -> int
+    try:
+        assignments = _get_assignments(args)
+        reports = rewrite_config_files(
+            _find_all_config_files(args.paths, args.extensions),
+            assignments,
+            dont_write_option_if_value_default=not args.write_defaults,
+            fix_invalid=args.fix_invalid,
+            processes=args.processes,
+        )
+    except (ConfigError, EnvironmentError) as e:
+        sys.stderr.write(str(e) + "\n")
+        return 2
+
+    failed_reports = [report for report in reports if report["error"] is not None]
+    _write_report(
+        {
+            "files_checked": len(reports),
+            "files_changed": sum(1 for report in reports if report["changed"]),
+            "files_failed": len(failed_reports),
+            "files": reports
+            if args.all
+            else [
+                report
+                for report in reports
+                if report["changed"]
+                or report["error"]
+                or report["invalid_fields"]
+                or report["malformed_lines"]
+            ],
+        }
+    )
+    return 1 if failed_reports else 0
+
+
+def _create_argument_parser():
+    # type: () -> argparse.ArgumentParser
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="number of processes to use (defaults to the number of CPUs)",
+    )
+    parser.add_argument(
+        "--extension",
+        dest="extensions",
+        action="append",
+        default=None,
+        help="extension of the config files to look for in directories "
+        "(can be given more than once, defaults to .cfg)",
+    )
+    subparsers = parser.add_subparsers()
+
+    validate_parser = subparsers.add_parser(
+        "validate", help="check that every line and field in each config file is valid",
+    )
+    validate_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="include valid files in the report as well as invalid ones",
+    )
+    validate_parser.add_argument(
+        "paths", nargs="+", help="config files or directories to search"
+    )
+    validate_parser.set_defaults(function=_validate)
+
+    rewrite_parser = subparsers.add_parser(
+        "rewrite",
+        help="set fields in each config file, only changing the lines that need to",
+    )
+    rewrite_parser.add_argument(
+        "--set",
+        metavar="FIELD=VALUE",
+        action="append",
+        default=[],
+        help="value (in config file format) to give a field (can be given more "
+        "than once)",
+    )
+    rewrite_parser.add_argument(
+        "--preset", help="config file (e.g. a preset) to take values from"
+    )
+    rewrite_parser.add_argument(
+        "--preset-field",
+        dest="preset_fields",
+        metavar="FIELD",
+        action="append",
+        default=None,
+        help="field to take from the preset (can be given more than once, "
+        "defaults to every field in the preset)",
+    )
+    rewrite_parser.add_argument(
+        "--write-defaults",
+        action="store_true",
+        help="add every field to the files, even if it has its default value",
+    )
+    rewrite_parser.add_argument(
+        "--fix-invalid",
+        action="store_true",
+        help="rewrite files that have invalid fields or lines, resetting the "
+        "invalid fields to their default values (by default these files are "
+        "left alone and reported as errors)",
+    )
+    rewrite_parser.add_argument(
+        "--all", action="store_true", help="include unchanged files in the report",
+    )
+    rewrite_parser.add_argument(
+        "paths", nargs="+", help="config files or directories to search"
+    )
+    rewrite_parser.set_defaults(function=_rewrite)
+
+    return parser
+
+
+def main(argv=None):
+    """:returns: the exit status"""
+    # type: (Optional[List[str]]) -> int
+    args = _create_argument_parser().parse_args(argv)
+    if args.extensions is None:
+        args.extensions = [".cfg"]
+    return args.function(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
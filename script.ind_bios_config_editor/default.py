@@ -9,17 +9,24 @@ import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "resources"))
 
+from lib import tracing
+from lib.addon_info import get_setting
 from lib.windows.config_editors import IndBiosConfigEditor
 
 # pytype: enable=import-error
 import pyxbmct
+import xbmc
 
 # Enable or disable Estuary-based design explicitly
 pyxbmct.skin.estuary = True
 
 if __name__ == "__main__":
+    # Only wanted when working out what to optimise
+    tracing.set_enabled(get_setting("tracing") == "true")
     window = IndBiosConfigEditor("F:\\test_ind_bios.cfg")
     window.doModal()
     # Destroy the instance explicitly because
     # underlying xbmcgui classes are not garbage-collected on exit.
     del window
+    # How long everything took (nothing if tracing is off)
+    tracing.dump(lambda line: xbmc.log(line, xbmc.LOGDEBUG))
@@ -0,0 +1,61 @@
+"""Lets a package expose classes from its modules without importing every
+module up front. Each module is only imported the first time that something
+from it is used.
+
+Python 2 doesn't support __getattr__ on modules, so the package is replaced in
+sys.modules with an instance of a module subclass that does.
+"""
+import importlib
+import sys
+import types
+
+try:
+    # typing not available on XBMC4Xbox
+    from typing import Any, Dict
+except:
+    pass
+
+
+class _LazyModule(types.ModuleType):
+    """Module that imports its attributes from other modules when they are
+    first accessed
+    """
+
+    def __init__(self, module, lazy_attributes):
+        # type: (types.ModuleType, Dict[str, str]) -> None
+        super(_LazyModule, self).__init__(module.__name__, module.__doc__)
+        self.__dict__.update(module.__dict__)
+        # Python 2 sets the globals of a module to None when it is garbage
+        # collected, which would break anything defined in it
+        self._original_module = module
+        self._lazy_attributes = lazy_attributes
+        self.__all__ = sorted(lazy_attributes)
+
+    def __getattr__(self, name):
+        # Only called if the attribute hasn't been imported yet
+        # type: (str) -> Any
+        try:
+            module_name = self.__dict__["_lazy_attributes"][name]
+        except KeyError:
+            raise AttributeError(
+                "'" + self.__name__ + "' module has no attribute '" + name + "'"
+            )
+        module = importlib.import_module(module_name, self.__name__)
+        value = getattr(module, name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self._lazy_attributes))
+
+
+def make_module_lazy(module_name, lazy_attributes):
+    """Replace a module that has already been imported (normally a package
+    from its __init__.py) with one that imports its attributes lazily
+
+    :param lazy_attributes: maps each attribute name to the (relative) name\
+            of the module that it is imported from e.g.\
+            {"FakeSlider": ".fake_slider"}
+    """
+    # type: (str, Dict[str, str]) -> None
+    sys.modules[module_name] = _LazyModule(sys.modules[module_name], lazy_attributes)
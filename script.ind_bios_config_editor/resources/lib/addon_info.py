@@ -0,0 +1,53 @@
+"""Information about the addon (e.g. where it is installed)
+
+Creating an xbmcaddon.Addon is slow on the Xbox, so each piece of information
+is only looked up once, the first time that it is needed.
+"""
+import os
+
+import xbmc
+import xbmcaddon
+
+try:
+    # typing not available on XBMC4Xbox
+    from typing import Dict
+except:
+    pass
+
+_ADDON_INFO = {}  # type: Dict[str, str]
+
+
+def get_addon_info(key):
+    """:returns: the same as xbmcaddon.Addon().getAddonInfo(key)"""
+    # type: (str) -> str
+    value = _ADDON_INFO.get(key)
+    if value is None:
+        value = xbmcaddon.Addon().getAddonInfo(key)
+        _ADDON_INFO[key] = value
+    return value
+
+
+def get_addon_path():
+    """:returns: the directory that the addon is installed in"""
+    # type: () -> str
+    return get_addon_info("path")
+
+
+def get_media_filename(filename):
+    """:returns: the full path of a file in resources/media"""
+    # type: (str) -> str
+    return os.path.join(get_addon_path(), "resources", "media", filename)
+
+
+def get_profile_path():
+    """:returns: the directory that the addon can store its own data in"""
+    # type: () -> str
+    return xbmc.translatePath(get_addon_info("profile"))
+
+
+def get_setting(setting_id):
+    """:returns: the current value of one of the addon's settings (always a\
+            string e.g. "true" for a bool setting that is on)
+    """
+    # type: (str) -> str
+    return xbmcaddon.Addon().getSetting(setting_id)
@@ -0,0 +1,7 @@
+"""Used to process lots of config files at once (e.g. backups from many
+consoles) without XBMC
+"""
+
+from .find_config_files import find_config_files
+from .validate import validate_config_file, validate_config_files
+from .rewrite import load_assignments, rewrite_config_file, rewrite_config_files
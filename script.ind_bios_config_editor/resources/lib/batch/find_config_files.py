@@ -0,0 +1,29 @@
+"""Find the config files in a directory tree"""
+import os
+
+try:
+    # typing not available on XBMC4XBOX
+    from typing import Iterator, Tuple
+except:
+    pass
+
+
+def find_config_files(path, extensions=(".cfg",)):
+    """Find every config file in a directory tree, in a consistent order
+
+    :param path: a directory to search or a single config file
+    :param extensions: only files ending in one of these (ignoring case)\
+            are returned
+    """
+    # type: (str, Tuple[str, ...]) -> Iterator[str]
+    if not os.path.isdir(path):
+        yield path
+        return
+
+    extensions = tuple(extension.lower() for extension in extensions)
+    for directory, subdirectories, filenames in os.walk(path):
+        # Sorted in place so that os.walk visits them in order
+        subdirectories.sort()
+        for filename in sorted(filenames):
+            if filename.lower().endswith(extensions):
+                yield os.path.join(directory, filename)
@@ -0,0 +1,30 @@
+"""Spread work across a pool of processes"""
+import multiprocessing
+
+try:
+    # typing not available on XBMC4XBOX
+    from typing import Any, Callable, Iterable, List, Optional
+except:
+    pass
+
+
+def map_in_processes(function, items, processes=None, chunksize=16):
+    """Call function on every item using a pool of processes
+
+    :param function: must be defined at the top level of a module so that\
+            it can be sent to other processes
+    :param processes: the number of processes to use, defaults to the number\
+            of CPUs. If it is 1 then everything is done in this process
+    :param chunksize: how many items are sent to a process at once
+    :returns: the results in the same order as items
+    """
+    # type: (Callable[[Any], Any], Iterable[Any], Optional[int], int) -> List[Any]
+    if processes == 1:
+        return [function(item) for item in items]
+
+    pool = multiprocessing.Pool(processes)
+    try:
+        return pool.map(function, items, chunksize)
+    finally:
+        pool.close()
+        pool.join()
@@ -0,0 +1,181 @@
+"""Change fields in lots of config files at once"""
+from collections import OrderedDict
+import functools
+import os
+import shutil
+from StringIO import StringIO
+import tempfile
+
+try:
+    # typing not available on XBMC4XBOX
+    from typing import Any, Dict, Iterable, List, Optional, Tuple
+except:
+    pass
+
+from ..configs import ConfigError, ConfigFieldValueError, IndBiosConfig
+from ..configs.config_file_tokenizer import tokenize_config_file
+from .process_pool import map_in_processes
+from .validate import find_problems
+
+
+def load_assignments(fp, fields=None):
+    """Read the values to give fields from a config file (e.g. a preset)
+
+    :param fp: any iterable of lines in config file format e.g.\
+            ["DASH1=C:\\evoxdash.xbe\\n"]
+    :param fields: the fields to take from the file, defaults to every field\
+            in it
+    :returns: a tuple of (field name, value in Python format) pairs
+    :raises ConfigError: if any of the fields are invalid or have an invalid\
+            value (or any line is invalid if fields is not given)
+    """
+    # type: (Iterable[str], Optional[Iterable[str]]) -> Tuple[Tuple[str, Any], ...]
+    lines = list(fp)
+    config = IndBiosConfig()
+    # Other fields in the file don't matter if they are invalid
+    invalid_fields = config.readfp(lines)
+    if fields is None:
+        fields = [option_name for option_name, _ in tokenize_config_file(lines)]
+    # Fields may appear more than once in the file, in different cases
+    fields = OrderedDict.fromkeys(config._format_option_name(field) for field in fields)
+
+    assignments = []
+    for field in fields:
+        value = config.get(field)
+        if field in invalid_fields:
+            raise ConfigFieldValueError(field + ": " + invalid_fields[field])
+        assignments.append((field, value))
+    return tuple(assignments)
+
+
+def _write_atomically(filename, contents):
+    """Replace the contents of a file so that it is never left half written
+
+    The new contents are written to a temporary file in the same directory,
+    which then replaces the original.
+    """
+    # type: (str, str) -> None
+    directory, basename = os.path.split(filename)
+    fd, temporary_filename = tempfile.mkstemp(
+        prefix="." + basename + ".", suffix=".tmp", dir=directory or "."
+    )
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(contents)
+            fp.flush()
+            os.fsync(fp.fileno())
+        shutil.copymode(filename, temporary_filename)
+        if os.name == "nt":
+            # Windows can't rename over an existing file
+            os.remove(filename)
+        os.rename(temporary_filename, filename)
+    except:
+        if os.path.exists(temporary_filename):
+            os.remove(temporary_filename)
+        raise
+
+
+def rewrite_config_file(
+    filename, assignments, dont_write_option_if_value_default=True, fix_invalid=False
+):
+    """Set fields in an iND-BiOS config file
+
+    Only the lines for fields that change are modified (see\
+    :resources.lib.configs.config_document:). The file is not written to at
+    all if nothing would change.
+
+    :param assignments: (field name, value in Python format) pairs, see\
+            :load_assignments:
+    :param dont_write_option_if_value_default: see\
+            :resources.lib.configs.AbstractConfig.write:
+    :param fix_invalid: if False files with invalid fields or lines are left\
+            alone and reported as errors. If True the invalid fields are\
+            reset to their default values as the file is rewritten
+    :returns: a report that can be serialised as JSON. It contains the\
+            filename, whether it was changed, any invalid fields (and the\
+            reason they are invalid), any lines that are not of the form\
+            KEY=value (see\
+            :resources.lib.batch.validate.validate_config_file:) and an\
+            error if the file could not be rewritten
+    """
+    # type: (str, Iterable[Tuple[str, Any]], bool, bool) -> Dict[str, Any]
+    changed = False
+    invalid_fields = {}  # type: Dict[str, str]
+    malformed_lines = []  # type: List[Dict[str, Any]]
+    error = None
+    try:
+        with open(filename, "rb") as fp:
+            original_contents = fp.read()
+        config = IndBiosConfig()
+        try:
+            config.readfp(
+                StringIO(original_contents), set_invalid_fields_to_default=False
+            )
+            valid = True
+        except ConfigError:
+            valid = False
+            invalid_fields, malformed_lines, error = find_problems(
+                original_contents.splitlines(True)
+            )
+
+        if not valid and not fix_invalid:
+            # Rewriting would silently reset the invalid fields
+            error = error or "Not rewritten as it has invalid fields or lines"
+        else:
+            if not valid:
+                config = IndBiosConfig()
+                config.readfp(StringIO(original_contents))
+                error = None
+            config.set_many(assignments)
+            output = StringIO()
+            config.write(
+                output,
+                dont_write_option_if_value_default=dont_write_option_if_value_default,
+            )
+            new_contents = output.getvalue()
+            if new_contents != original_contents:
+                _write_atomically(filename, new_contents)
+                changed = True
+    except (ConfigError, EnvironmentError) as e:
+        error = str(e)
+    return {
+        "filename": filename,
+        "changed": changed,
+        "invalid_fields": invalid_fields,
+        "malformed_lines": malformed_lines,
+        "error": error,
+    }
+
+
+def rewrite_config_files(
+    filenames,
+    assignments,
+    dont_write_option_if_value_default=True,
+    fix_invalid=False,
+    processes=None,
+):
+    """Set fields in lots of iND-BiOS config files using a pool of processes
+
+    :param fix_invalid: see :rewrite_config_file:
+    :param processes: see\
+            :resources.lib.batch.process_pool.map_in_processes:
+    :returns: a report (see :rewrite_config_file:) for each file, in the\
+            same order as filenames
+    :raises ConfigError: if any of the assignments are invalid. No files\
+            are changed if this happens
+    """
+    # type: (Iterable[str], Iterable[Tuple[str, Any]], bool, bool, Optional[int]) -> List[Dict[str, Any]]
+    assignments = tuple(assignments)
+    # Checked up front rather than failing on every file
+    IndBiosConfig().set_many(assignments)
+
+    return map_in_processes(
+        functools.partial(
+            rewrite_config_file,
+            assignments=assignments,
+            dont_write_option_if_value_default=dont_write_option_if_value_default,
+            fix_invalid=fix_invalid,
+        ),
+        filenames,
+        processes=processes,
+    )
@@ -0,0 +1,75 @@
+"""Validate lots of config files at once"""
+
+try:
+    # typing not available on XBMC4XBOX
+    from typing import Any, Dict, Iterable, List, Optional, Tuple
+except:
+    pass
+
+from ..configs import ConfigError, IndBiosConfig
+from ..configs.config_file_tokenizer import find_malformed_lines
+from .process_pool import map_in_processes
+
+
+def find_problems(lines):
+    """Check every line and field in the lines of an iND-BiOS config file
+
+    :returns: the reason that each invalid field is invalid, every line that\
+            is not of the form KEY=value (as {"line": line number, "text":\
+            line}) and an error if the file is invalid but neither of those\
+            say why (None otherwise)
+    """
+    # type: (List[str]) -> Tuple[Dict[str, str], List[Dict[str, Any]], Optional[str]]
+    try:
+        IndBiosConfig().readfp(lines, set_invalid_fields_to_default=False)
+    except ConfigError as e:
+        # A strict read stops at the first problem, so look for all of them
+        malformed_lines = [
+            {"line": line_number, "text": line}
+            for line_number, line in find_malformed_lines(lines)
+        ]
+        invalid_fields = IndBiosConfig().readfp(lines)
+        if not malformed_lines and not invalid_fields:
+            return invalid_fields, malformed_lines, str(e)
+        return invalid_fields, malformed_lines, None
+    return {}, [], None
+
+
+def validate_config_file(filename):
+    """Check every line and field in an iND-BiOS config file
+
+    :returns: a report that can be serialised as JSON. It contains the\
+            filename, whether the file is valid, the reason that each\
+            invalid field is invalid, every line that is not of the form\
+            KEY=value (as {"line": line number, "text": line}) and an error\
+            if the file could not be read at all
+    """
+    # type: (str) -> Dict[str, Any]
+    invalid_fields = {}  # type: Dict[str, str]
+    malformed_lines = []  # type: List[Dict[str, Any]]
+    error = None
+    try:
+        with open(filename) as fp:
+            lines = fp.readlines()
+        invalid_fields, malformed_lines, error = find_problems(lines)
+    except (ConfigError, EnvironmentError) as e:
+        error = str(e)
+    return {
+        "filename": filename,
+        "valid": not invalid_fields and not malformed_lines and error is None,
+        "invalid_fields": invalid_fields,
+        "malformed_lines": malformed_lines,
+        "error": error,
+    }
+
+
+def validate_config_files(filenames, processes=None):
+    """Check lots of iND-BiOS config files using a pool of processes
+
+    :param processes: see\
+            :resources.lib.batch.process_pool.map_in_processes:
+    :returns: a report (see :validate_config_file:) for each file, in the\
+            same order as filenames
+    """
+    # type: (Iterable[str], Optional[int]) -> List[Dict[str, Any]]
+    return map_in_processes(validate_config_file, filenames, processes=processes)
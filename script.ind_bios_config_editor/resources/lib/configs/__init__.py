@@ -3,9 +3,13 @@
 from .abstract_config import AbstractConfig
 
 from .ind_bios import IndBiosConfig
+from .preset_browser import PresetBrowser
+from .preset_library import PresetLibrary
+from .preset_swatches import PresetSwatches
 from .config_errors import (
     ConfigError,
     ConfigFieldNameError,
     ConfigFieldValueError,
     ConfigPresetDoesNotExistError,
+    ConfigSyntaxError,
 )
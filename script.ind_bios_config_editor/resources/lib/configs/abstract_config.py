@@ -5,24 +5,43 @@ config file formats
 """
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
-import ConfigParser
 import os
 import re
-from StringIO import StringIO
 
 try:
     # typing not available on XBMC4XBOX
-    from typing import Any, Dict, Tuple
+    from typing import Any, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+    if TYPE_CHECKING:
+        from .field_codec import FieldCodec
 except:
     pass
 
+from ..tracing import traced
+from .config_document import ConfigDocument
+from .config_file_tokenizer import tokenize_config_file
 from .config_errors import (
     ConfigError,
     ConfigFieldNameError,
-    ConfigFieldValueError,
     ConfigPresetDoesNotExistError,
 )
-from .factories import format_converter_factory, validator_factory
+from .factories import compile_field_codecs
+
+_WHITESPACE_REGEX = re.compile(r"\s")
+
+# Everything about a config file that does not change between instances.
+# Built once per class (see AbstractConfig._get_schema) and never modified.
+_ConfigSchema = namedtuple(
+    "_ConfigSchema",
+    (
+        "options",
+        "defaults",
+        # Everything below is indexed by the position of the field in options
+        "field_indexes",
+        "field_codecs",
+        "default_values",
+    ),
+)
 
 
 class AbstractConfig(object):
@@ -34,50 +53,93 @@ class AbstractConfig(object):
 
     __metaclass__ = ABCMeta
 
+    # Lots of configs can be alive at once (e.g. presets) so avoid having a
+    # __dict__ for each of them. Subclasses should set __slots__ = () too.
+    __slots__ = (
+        "_max_line_length",
+        "_quote_char_if_whitespace",
+        "_schema",
+        "_values",
+        "_document",
+        "_fields_not_in_document",
+    )
+
+    # Schemas shared by every instance, keyed by class and the constructor
+    # arguments that affect validation
+    _SCHEMA_CACHE = {}  # type: Dict[Tuple[Any, ...], _ConfigSchema]
+
     def __init__(self, max_line_length=None, quote_char_if_whitespace=None):
         """:param quote_char_if_whitespace: optional quote character used to\
         wrap values if they contain whitespace
         """
         # type: (int, str) -> None
-        fields = self._get_fields()
-        self._options = tuple(field.field_name for field in fields)
-
-        self._defaults = {field.field_name: field.default_value for field in fields}
-
-        # pytype not callable errors are incorrect
-        # pytype: disable=not-callable
-        self._format_converters = {
-            field.field_name: format_converter_factory(field) for field in fields
-        }
-        self._validators = {
-            field.field_name: validator_factory(field) for field in fields
-        }
-        # pytype: enable=not-callable
-
         self._max_line_length = max_line_length
         self._quote_char_if_whitespace = quote_char_if_whitespace
+        self._use_schema(self._get_schema())
 
-        # Could inherit from RawConfigParser instead
-        # but decided not as the interface is different
-        # e.g. get and set take different arguments
-        # and get does not always return a string.
-        self._config_parser = ConfigParser.RawConfigParser()
-        self._config_parser.optionxform = self._format_option_name
-
-        for field in self._defaults:
-            self.set(field, self._defaults[field])
+    def _get_schema(self):
+        """:returns: the schema for this class, building it the first time\
+                it is needed
+        """
+        # type: () -> _ConfigSchema
+        key = (type(self), self._max_line_length, self._quote_char_if_whitespace)
+        schema = self._SCHEMA_CACHE.get(key)
+        if schema is None:
+            fields = self._get_fields()
+            field_codecs = self._get_field_codecs()
+            options = tuple(field.field_name for field in fields)
+            for field in fields:
+                # Validated here, once, so that they never need to be again
+                field_codecs[field.field_name].validate_in_python_format(
+                    field.default_value
+                )
+            schema = _ConfigSchema(
+                options=options,
+                defaults={field.field_name: field.default_value for field in fields},
+                field_indexes={option: index for index, option in enumerate(options)},
+                field_codecs=tuple(field_codecs[option] for option in options),
+                default_values=tuple(field.default_value for field in fields),
+            )
+            self._SCHEMA_CACHE[key] = schema
+        return schema
+
+    def _use_schema(self, schema):
+        """Set every field to its default value from the schema"""
+        # type: (_ConfigSchema) -> None
+        self._schema = schema
+        # Values are stored in Python format, in the same order as the fields
+        self._values = list(schema.default_values)
+        # The file that was read, which is kept up to date as values are set
+        self._document = ConfigDocument()
+        # Fields that have been changed but aren't in the document. Whether
+        # they need to be added depends on the arguments to write.
+        self._fields_not_in_document = set()
+
+    def _new_with_default_values(self):
+        """:returns: a new config of the same class, with the same settings,\
+                that has every field set to its default value
+
+        __init__ is bypassed so that this only costs a list copy.
+        """
+        # type: () -> AbstractConfig
+        config = object.__new__(type(self))
+        config._max_line_length = self._max_line_length
+        config._quote_char_if_whitespace = self._quote_char_if_whitespace
+        config._use_schema(self._schema)
+        return config
 
     def defaults(self):
         """:returns: a dictionary with the default value (in Python format)\
                 for each field
         """
         # type: () -> Dict[str, Any]
-        return self._defaults
+        # A copy so that the shared schema can't be modified
+        return dict(self._schema.defaults)
 
     def options(self):
         """:returns: all the options that can be set in the config file"""
         # type: () -> Tuple[str, ...]
-        return self._options
+        return self._schema.options
 
     @abstractmethod
     def _get_fields(self):
@@ -87,6 +149,21 @@ class AbstractConfig(object):
         # type: () -> Tuple[Any, ...]
         pass
 
+    def _get_field_codecs(self):
+        """:returns: a dictionary mapping each field name to a codec (see\
+                :resources.lib.configs.field_codec:) used to validate and\
+                convert its values
+
+        Only called the first time that an instance of a class is created,
+        the result is shared between all of its instances.
+        """
+        # type: () -> Dict[str, FieldCodec]
+        return compile_field_codecs(
+            self._get_fields(),
+            max_line_length=self._max_line_length,
+            quote_char_if_whitespace=self._quote_char_if_whitespace,
+        )
+
     @abstractmethod
     def _get_true_if_fields_dont_have_values(self):
         """:returns: fields that should be set to True if at least one of the\
@@ -96,144 +173,155 @@ class AbstractConfig(object):
         # type: () -> Dict[str, Dict[str, Any]]
         pass
 
-    def read(self, filename, set_invalid_fields_to_default=True, *args, **kwargs):
+    @traced("AbstractConfig.read")
+    def read(self, filename, set_invalid_fields_to_default=True, fields=None):
         """Read the config file with filename, and take the field values from
         it
 
         :param set_invalid_fields_to_default: if False an error will be thrown\
                 if any field has an invalid value
+        :param fields: see :readfp:
+        :returns: see :readfp:
         """
-        # type: (str, bool, Any, Any) -> None
+        # type: (str, bool, Optional[Iterable[str]]) -> Dict[str, str]
         with open(filename) as fp:
-            self.readfp(
+            return self.readfp(
                 fp,
                 set_invalid_fields_to_default=set_invalid_fields_to_default,
-                *args,
-                **kwargs
+                fields=fields,
             )
 
-    def _remove_start_end_quote_chars(self):
-        """If values are wrapped in quote characters, remove the quote characters"""
-        # type: () -> None
-        if self._quote_char_if_whitespace:
-            for field in self._options:
-                value = self._get_in_config_file_format(field)
-                if (
-                    value[0] == self._quote_char_if_whitespace
-                    and value[-1] == self._quote_char_if_whitespace
-                ):
-                    self._set_in_config_format(field, value[1:-1])
-
-    def readfp(self, fp, set_invalid_fields_to_default=True, *args, **kwargs):
+    def readfp(self, fp, set_invalid_fields_to_default=True, fields=None):
         """Read from the file pointer object, and take the field values from it
-        
+
+        The file is tokenized a line at a time. Quote characters, inline
+        comments and the case of field names are all dealt with in that
+        single pass.
+
         :param set_invalid_fields_to_default: if False an error will be\
-                thrown if any field has an invalid name or value
-        :raises ConfigFieldNameError: if set_invalid_fields_to_default is\
-                False and any field is an invalid name
+                thrown if any line or field value is invalid
+        :param fields: if given only these fields are taken from the file,\
+                as if they had been set. Lines for any other field are\
+                skipped without being checked and the file is not kept to be\
+                written back out
+        :returns: a dictionary mapping the name of each field that was set to\
+                its default value (because its value was invalid) to the\
+                reason why
+        :raises ConfigSyntaxError: if set_invalid_fields_to_default is False\
+                and any line is not of the form KEY=value
         :raises ConfigFieldValueError: if set_invalid_fields_to_default is False\
                 and any field has an invalid value
+        :raises ConfigFieldNameError: if any of fields does not exist for this\
+                config file
         """
-        # type: (Any, bool, Any, Any) -> None
-        stream = StringIO()
+        # type: (Any, bool, Optional[Iterable[str]]) -> Dict[str, str]
+        if fields is not None:
+            return self._read_fields(fp, fields, set_invalid_fields_to_default)
+
+        # The file is kept so that it can be written back out with only the
+        # fields that have changed being modified
+        document = ConfigDocument()
+        values = document.read(
+            fp,
+            format_option_name=self._format_option_name,
+            quote_char=self._quote_char_if_whitespace,
+            ignore_syntax_errors=set_invalid_fields_to_default,
+        )
 
-        try:
-            stream.name = fp.name
-        except AttributeError:
-            pass
+        # Everything is converted first so that nothing is changed if there
+        # is an invalid value
+        new_values, invalid_fields = self._convert_values_read(
+            values, set_invalid_fields_to_default
+        )
 
-        stream.write("[" + ConfigParser.DEFAULTSECT + "]\n")
-        stream.write(fp.read())
-        stream.seek(0, 0)
+        schema = self._schema
+        self._document = document
+        for index, value in new_values:
+            self._values[index] = value
+        # So that the invalid values in the file get replaced
+        for option_name in invalid_fields:
+            document.set(
+                option_name,
+                self._get_in_config_file_format(schema.field_indexes[option_name]),
+            )
+        # Values that were set before reading and aren't in this file
+        self._fields_not_in_document = set(
+            index
+            for index, value in enumerate(self._values)
+            if value != schema.default_values[index]
+            and schema.options[index] not in document
+        )
+        return invalid_fields
+
+    def _read_fields(self, fp, fields, set_invalid_fields_to_default):
+        """Take the values of certain fields from a file (see :readfp:)"""
+        # type: (Any, Iterable[str], bool) -> Dict[str, str]
+        options = self._schema.options
+        option_names = set(options[self._get_field_index(field)] for field in fields)
+        values = {}
+        for option_name, value in tokenize_config_file(
+            fp,
+            format_option_name=self._format_option_name,
+            quote_char=self._quote_char_if_whitespace,
+            ignore_syntax_errors=set_invalid_fields_to_default,
+            option_names=option_names,
+        ):
+            values[option_name] = value
+
+        new_values, invalid_fields = self._convert_values_read(
+            values, set_invalid_fields_to_default
+        )
+        for index, value in new_values:
+            self._set_by_index(index, value)
+        return invalid_fields
 
-        self._config_parser.readfp(stream, *args, **kwargs)
-        if self._quote_char_if_whitespace:
-            self._remove_start_end_quote_chars()
-        self._validate_everything_in_config_file_format(set_invalid_fields_to_default)
+    def _convert_values_read(self, values, set_invalid_fields_to_default):
+        """Validate values read from a file and convert them to Python format
 
-    def _validate_everything_in_config_file_format(
-        self, set_invalid_fields_to_default=False
-    ):
-        """Validate option names and values in the config file format
-        
-        :param set_invalid_fields_to_default: if False an error will be\
-                thrown if any field has an invalid name or value
-        :raises ConfigFieldNameError: if set_invalid_fields_to_default is\
-                False and any field is an invalid name
+        Unrecognised fields are ignored.
+
+        :returns: a list of (field index, value) pairs and the invalid fields\
+                (see :readfp:)
         :raises ConfigFieldValueError: if set_invalid_fields_to_default is False\
                 and any field has an invalid value
         """
-        # type: (bool) -> None
-        for option in self.options():
-            value = self._get_in_config_file_format(option)
-            if set_invalid_fields_to_default:
+        # type: (Dict[str, str], bool) -> Tuple[List[Tuple[int, Any]], Dict[str, str]]
+        schema = self._schema
+        new_values = []
+        invalid_fields = {}
+        for option_name, value in values.iteritems():
+            index = schema.field_indexes.get(option_name)
+            if index is not None:
                 try:
-                    self._validate_option_name_and_value(
-                        option, value, value_is_in_config_file_format=True
+                    value = schema.field_codecs[index].config_file_to_python_format(
+                        value
                     )
                 except ConfigError as e:
-                    self.set_to_default(option)
-            else:
-                self._validate_option_name_and_value(
-                    option, value, value_is_in_config_file_format=True
-                )
-
-    def _validate_option_name(self, option_name):
-        """:raies ConfigFieldNameError: if option_name does not exist for\
-                this config file
+                    if not set_invalid_fields_to_default:
+                        raise
+                    value = schema.default_values[index]
+                    invalid_fields[option_name] = str(e)
+                new_values.append((index, value))
+        return new_values, invalid_fields
+
+    def _get_field_index(self, option_name):
+        """:returns: the position of option_name in the stored values
+        :raises ConfigFieldNameError: if option_name does not exist for this\
+                config file
         """
-        # type: (str) -> None
+        # type: (str) -> int
+        field_indexes = self._schema.field_indexes
+        try:
+            return field_indexes[option_name]
+        except KeyError:
+            pass
+
         option_name = self._format_option_name(option_name)
-        if option_name not in self._options:
+        try:
+            return field_indexes[option_name]
+        except KeyError:
             raise ConfigFieldNameError(option_name + " is not a valid option")
 
-    def _validate_config_file_line_length(self, option_name, value_in_config_format):
-        """:raise ConfigFieldValueError: if the line in the config file would\
-                be too long for value_in_config_format
-        """
-        # type: (str, str) -> None
-        if self._max_line_length is not None:
-            # The equals sign, and \r\n on the end of line
-            additional_chars = 3
-            if self._quote_char_if_whitespace and re.search(
-                r"\s", value_in_config_format
-            ):
-                # The quotes around the value
-                additional_chars += 2
-            if (
-                len(option_name) + len(value_in_config_format) + additional_chars
-                > self._max_line_length
-            ):
-                raise ConfigFieldValueError(
-                    "Cannot use "
-                    + value_in_config_format
-                    + " for field "
-                    + option_name
-                    + " the line length in the file would be too long"
-                )
-
-    def _validate_option_name_and_value(
-        self, option_name, value, value_is_in_config_file_format=False
-    ):
-        """:param value_is_in_config_file_format: if True values are validated in\
-                config file format otherwise they are validated in Python\
-                format
-        :raises ConfigFieldNameError: if value is invalid
-        :raises ConfigFieldValueError: option_name is invalid
-        """
-        # type: (str, Any, bool) -> None
-        self._validate_option_name(option_name)
-
-        # Won't reach this if option name is invalid
-        # (which is what we want as there will be no validator
-        # if the option does not exist)
-        validator = self._validators[option_name]
-        if value_is_in_config_file_format:
-            validator.validate_in_config_file_format(value)
-            self._validate_config_file_line_length(option_name, value)
-        else:
-            validator.validate_in_python_format(value)
-
     def _format_option_name(self, option):
         """Used to convert an option name from outside the class to the format
         that is used internally
@@ -243,6 +331,7 @@ class AbstractConfig(object):
         # type: (str) -> str
         return option.upper()
 
+    @traced("AbstractConfig.load_preset")
     def load_preset(
         self, filename, fields_to_apply_to, set_invalid_fields_to_default=True
     ):
@@ -261,36 +350,33 @@ class AbstractConfig(object):
             raise ConfigPresetDoesNotExistError(
                 "Preset '" + filename + "' does not exist"
             )
-        # Need to disable this error as during execution self.__class__ does
-        # not refer to an instance of AbstractConfig but rather an instance
-        # of one of its subclasses
-        preset_config = self.__class__()  # pytype: disable=not-instantiable
+        preset_config = self._new_with_default_values()
+        # Only the fields that are needed are read and validated
         preset_config.read(
-            filename, set_invalid_fields_to_default=set_invalid_fields_to_default
+            filename,
+            set_invalid_fields_to_default=set_invalid_fields_to_default,
+            fields=fields_to_apply_to,
         )
 
         for field in fields_to_apply_to:
-            self.set(field, preset_config.get(field))
-
-    def get(self, option_name, validate_option_name=True):
-        """:returns: the value of option_name in Python format"""
-        # type: (str, bool) ->  Any
-        if validate_option_name:
-            self._validate_option_name(option_name)
-        value_in_config_format = self._get_in_config_file_format(option_name)
-        format_converter = self._format_converters[option_name]
-        return format_converter.convert_to_python_format(value_in_config_format)
-
-    def _get_in_config_file_format(self, option_name):
-        """:returns: the value of option_name in config file format"""
-        # type: (str) -> str
-        return self._config_parser.get(ConfigParser.DEFAULTSECT, option_name)
+            # Already validated when they were read
+            self.set(
+                field, preset_config.get(field), validate_option_name_and_value=False
+            )
+
+    def get(self, option_name):
+        """:returns: the value of option_name in Python format
+        :raises ConfigFieldNameError: if option_name does not exist for this\
+                config file
+        """
+        # type: (str) ->  Any
+        return self._values[self._get_field_index(option_name)]
 
     def set_to_default(self, option_name):
         """Set the option to its default value"""
         # type: (str) -> None
-        option = self._format_option_name(option_name)
-        self.set(option_name, self._defaults[option_name])
+        index = self._get_field_index(option_name)
+        self._set_by_index(index, self._schema.default_values[index])
 
     def set(self, option_name, value, validate_option_name_and_value=True):
         """Set the option to the value
@@ -298,27 +384,86 @@ class AbstractConfig(object):
         Python format must be used for the value
         """
         # type: (str, Any, bool) -> None
+        index = self._get_field_index(option_name)
         if validate_option_name_and_value:
-            self._validate_option_name_and_value(option_name, value)
-        format_converter = self._format_converters[option_name]
-        value_in_config_format = format_converter.convert_to_config_file_format(value)
-        return self._set_in_config_format(option_name, value_in_config_format)
+            self._schema.field_codecs[index].validate_in_python_format(value)
+        self._set_by_index(index, value)
 
-    def _set_in_config_format(self, option_name, value):
-        """Set the option to the value. No validation is performed
-
-        config format must be used for the value
+    def get_many(self, option_names):
+        """:returns: a dictionary mapping each option name to its value in\
+                Python format
+        :raises ConfigFieldNameError: if any option name does not exist for\
+                this config file
         """
-        # type: (str, str) -> None
-        return self._config_parser.set(ConfigParser.DEFAULTSECT, option_name, value)
+        # type: (Iterable[str]) -> Dict[str, Any]
+        values = self._values
+        return {
+            option_name: values[self._get_field_index(option_name)]
+            for option_name in option_names
+        }
 
-    def write(self, fp, dont_write_option_if_value_default=True):
-        """Write the config out to the given config file
+    def set_many(self, values, validate_option_names_and_values=True):
+        """Set lots of options at once
 
-        :param dont_write_option_if_value_default: if True then if an option\
-                has its default value it won't be written to the file
+        Every option name and value is validated before any of them are set,
+        so if one is invalid then nothing is changed. If an error is raised
+        while they are being set (only possible if they weren't validated)
+        then every option is restored to the value it had before.
+
+        :param values: a dictionary mapping option names to values in Python\
+                format, or (option name, value) pairs. If an option appears\
+                more than once in the pairs then the last value is used
+        :raises ConfigFieldNameError: if any option name does not exist for\
+                this config file
+        :raises ConfigFieldValueError: if any value is invalid
         """
         # type: (Any, bool) -> None
+        if isinstance(values, dict):
+            values = values.iteritems()
+        field_codecs = self._schema.field_codecs
+        new_values = []
+        for option_name, value in values:
+            index = self._get_field_index(option_name)
+            if validate_option_names_and_values:
+                field_codecs[index].validate_in_python_format(value)
+            new_values.append((index, value))
+
+        if validate_option_names_and_values:
+            # Valid values can always be set, so nothing needs to be restored
+            for index, value in new_values:
+                self._set_by_index(index, value)
+            return
+
+        old_values = list(self._values)
+        old_document = self._document.copy()
+        old_fields_not_in_document = set(self._fields_not_in_document)
+        try:
+            for index, value in new_values:
+                self._set_by_index(index, value)
+        except:
+            self._values = old_values
+            self._document = old_document
+            self._fields_not_in_document = old_fields_not_in_document
+            raise
+
+    def _set_by_index(self, index, value):
+        """Set the field at index to the value, updating the document if the\
+        value has changed. No validation is performed
+        """
+        # type: (int, Any) -> None
+        if self._values[index] != value:
+            self._values[index] = value
+            option_name = self._schema.options[index]
+            if option_name in self._document:
+                self._document.set(option_name, self._get_in_config_file_format(index))
+            else:
+                self._fields_not_in_document.add(index)
+
+    def _update_true_if_fields_dont_have_values(self):
+        """Set the fields from :_get_true_if_fields_dont_have_values: based on\
+        the current values of the fields they refer to
+        """
+        # type: () -> None
         true_if_fields_dont_have_values = self._get_true_if_fields_dont_have_values()
         for field in true_if_fields_dont_have_values:
             value = False
@@ -332,42 +477,52 @@ class AbstractConfig(object):
                     break
             self.set(field, value)
 
-        if self._quote_char_if_whitespace:
-            for field in self._options:
-                value = self._get_in_config_file_format(field)
-                if re.search(r"\s", value):
-                    value = (
-                        self._quote_char_if_whitespace
-                        + value
-                        + self._quote_char_if_whitespace
-                    )
-                    self._set_in_config_format(field, value)
+    def _get_in_config_file_format(self, index):
+        """:returns: the value of the field at index as it should appear in\
+                the config file
+        """
+        # type: (int) -> str
+        value = self._schema.field_codecs[index].convert_to_config_file_format(
+            self._values[index]
+        )
+        if self._quote_char_if_whitespace and _WHITESPACE_REGEX.search(value):
+            value = (
+                self._quote_char_if_whitespace + value + self._quote_char_if_whitespace
+            )
+        return value
 
-        stream = StringIO()
+    @traced("AbstractConfig.write")
+    def write(self, fp, dont_write_option_if_value_default=True):
+        """Write the config out to the given config file
+
+        The file that was read is written back out with the values that have
+        been set since. Everything else (including comments and
+        unrecognised fields) is written exactly as it was.
+
+        :param dont_write_option_if_value_default: if True then if an option\
+                has its default value it won't be added to the file
+        """
+        # type: (Any, bool) -> None
+        self._update_true_if_fields_dont_have_values()
+
+        schema = self._schema
+        document = self._document
         if dont_write_option_if_value_default:
-            output_file = ConfigParser.RawConfigParser()
-            output_file.optionxform = self._format_option_name
-            for field in self._options:
-                if (
-                    field not in self._defaults
-                    or self.get(field) != self._defaults[field]
-                ):
-                    value_in_config_file_format = self._get_in_config_file_format(field)
-                    output_file.set(
-                        ConfigParser.DEFAULTSECT, field, value_in_config_file_format
-                    )
-            output_file.write(stream)
+            fields_to_add = sorted(self._fields_not_in_document)
         else:
-            self._config_parser.write(stream)
-
-        # Ignore the first line which will be a marker for the default section
-        stream.seek(0, 0)
-        stream.readline()
-        # Replace the first non-commented out instance of " = " with "="
-        # (Some config files have line length limits)
-        equals_white_space_regex = re.compile(r"^([^;]+)\s+=\s+")
-        for line in stream:
-            fp.write(equals_white_space_regex.sub(r"\1=", line))
-
-        if self._quote_char_if_whitespace:
-            self._remove_start_end_quote_chars()
+            fields_to_add = [
+                index
+                for index, option in enumerate(schema.options)
+                if option not in document
+            ]
+        for index in fields_to_add:
+            if (
+                not dont_write_option_if_value_default
+                or self._values[index] != schema.default_values[index]
+            ):
+                document.set(
+                    schema.options[index], self._get_in_config_file_format(index)
+                )
+        self._fields_not_in_document = set()
+
+        document.write(fp)
@@ -0,0 +1,47 @@
+"""Convert colours between the hex strings used in config files (e.g.
+0xRRGGBB or 0xAARRGGBB) and ARGB ints
+"""
+
+try:
+    # typing not available on XBMC4XBOX
+    from typing import Union
+except:
+    pass
+
+
+def hex_colour_to_argb(colour):
+    """:param colour: a hex colour, optionally prefixed with 0x e.g. 0xRRGGBB\
+            (which is treated as fully opaque) or 0xAARRGGBB
+    :returns: the colour as an int of the form 0xAARRGGBB
+    """
+    # type: (str) -> int
+    digits = colour[2:] if colour[0:2] in ("0x", "0X") else colour
+    argb = int(digits, 16)
+    if len(digits) <= 6:
+        argb |= 0xFF000000
+    return argb
+
+
+def colour_to_argb(colour, with_alpha_channel=True):
+    """:param colour: an int of the form 0xAARRGGBB or a hex colour (see\
+            :hex_colour_to_argb:)
+    :param with_alpha_channel: if False the colour is made fully opaque
+    :returns: the colour as an int of the form 0xAARRGGBB
+    """
+    # type: (Union[int, str], bool) -> int
+    if isinstance(colour, basestring):
+        colour = hex_colour_to_argb(colour)
+    if not with_alpha_channel:
+        colour |= 0xFF000000
+    return colour
+
+
+def argb_to_hex_colour(argb, with_alpha_channel=True):
+    """:param argb: an int of the form 0xAARRGGBB
+    :param with_alpha_channel: if False the alpha channel is dropped
+    :returns: the colour as a hex string e.g. 0xAARRGGBB or 0xRRGGBB
+    """
+    # type: (int, bool) -> str
+    if with_alpha_channel:
+        return "0x%08X" % argb
+    return "0x%06X" % (argb & 0xFFFFFF)
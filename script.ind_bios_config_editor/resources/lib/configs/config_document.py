@@ -0,0 +1,101 @@
+"""Lossless model of a flat config file where each line is of the form
+KEY=value ;comment (e.g. the iND-BiOS config)
+
+Every line is kept exactly as it was read, along with the indexes of the lines
+that each option appears on. Setting an option only changes the lines it is on
+so comments, blank lines, unrecognised options and line endings all survive
+being written back out.
+"""
+
+try:
+    # typing not available on XBMC4XBOX
+    from typing import Any, Callable, Dict, List, Optional
+except:
+    pass
+
+from .config_file_tokenizer import replace_value, tokenize_config_lines
+
+
+class ConfigDocument(object):
+    """The lines of a config file and the lines that each option is on"""
+
+    __slots__ = ("_lines", "_line_indexes")
+
+    def __init__(self):
+        self._lines = []  # type: List[str]
+        self._line_indexes = {}  # type: Dict[str, List[int]]
+
+    def read(
+        self, fp, format_option_name=None, quote_char=None, ignore_syntax_errors=False
+    ):
+        """Replace the contents of the document with the lines from fp
+
+        See :resources.lib.configs.config_file_tokenizer.tokenize_config_file:
+        for the parameters. The document is not changed if an error is raised.
+
+        :returns: a dictionary mapping each option name to its value. If an\
+                option appears more than once then the last value is used
+        """
+        # type: (Any, Callable[[str], str], Optional[str], bool) -> Dict[str, str]
+        lines = list(fp)
+        line_indexes = {}  # type: Dict[str, List[int]]
+        values = {}
+        for line_index, option_name, value in tokenize_config_lines(
+            lines,
+            format_option_name=format_option_name,
+            quote_char=quote_char,
+            ignore_syntax_errors=ignore_syntax_errors,
+        ):
+            values[option_name] = value
+            line_indexes.setdefault(option_name, []).append(line_index)
+
+        self._lines = lines
+        self._line_indexes = line_indexes
+        return values
+
+    def copy(self):
+        """:returns: a copy of the document that can be changed without\
+                affecting this one
+        """
+        # type: () -> ConfigDocument
+        document = ConfigDocument()
+        document._lines = list(self._lines)
+        document._line_indexes = {
+            option_name: list(line_indexes)
+            for option_name, line_indexes in self._line_indexes.iteritems()
+        }
+        return document
+
+    def __contains__(self, option_name):
+        # type: (str) -> bool
+        return option_name in self._line_indexes
+
+    def set(self, option_name, value):
+        """Set the value of option_name
+
+        Every line that the option is on is changed in place (so that the
+        file stays consistent if it appears more than once). If it is not in
+        the document then a new line is added to the end.
+
+        :param value: exactly as it should appear in the file (i.e. wrapped\
+                in quote characters if they are needed)
+        """
+        # type: (str, str) -> None
+        lines = self._lines
+        line_indexes = self._line_indexes.get(option_name)
+        if line_indexes:
+            for line_index in line_indexes:
+                lines[line_index] = replace_value(lines[line_index], value)
+            return
+
+        # New lines match the line endings used by the rest of the file
+        newline = "\r\n" if lines and lines[0].endswith("\r\n") else "\n"
+        if lines and not lines[-1].endswith("\n"):
+            lines[-1] += newline
+        self._line_indexes[option_name] = [len(lines)]
+        lines.append(option_name + "=" + value + newline)
+
+    def write(self, fp):
+        """Write every line in the document out to fp"""
+        # type: (Any) -> None
+        fp.writelines(self._lines)
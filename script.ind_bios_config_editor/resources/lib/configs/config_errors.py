@@ -23,3 +23,9 @@ class ConfigPresetDoesNotExistError(ConfigError):
     """The chosen preset does not exist"""
 
     pass
+
+
+class ConfigSyntaxError(ConfigError):
+    """A line in the config file could not be understood"""
+
+    pass
@@ -0,0 +1,168 @@
+"""Tokenizer for flat config files where each line is of the form
+KEY=value ;comment (e.g. the iND-BiOS config)
+
+Blank lines and lines that begin with a comment character are skipped. Inline
+comments must be preceded by whitespace so that values may still contain the
+comment character.
+"""
+
+try:
+    # typing not available on XBMC4XBOX
+    from typing import Any, Callable, Container, Iterator, List, Optional, Tuple
+except:
+    pass
+
+from .config_errors import ConfigSyntaxError
+
+_COMMENT_CHARS = ";#"
+_INLINE_COMMENT_CHAR = ";"
+
+
+def _remove_inline_comment(value):
+    """:returns: value with any inline comment removed. Only comment\
+            characters at the start of the value or preceded by whitespace\
+            start a comment
+    """
+    # type: (str) -> str
+    position = value.find(_INLINE_COMMENT_CHAR)
+    while position != -1:
+        if position == 0 or value[position - 1].isspace():
+            return value[:position]
+        position = value.find(_INLINE_COMMENT_CHAR, position + 1)
+    return value
+
+
+def tokenize_line(line, quote_char=None):
+    """Split a single line into an option name and a value
+
+    :param quote_char: if supplied and the value is wrapped in this\
+            character then it is removed from both ends of the value
+    :returns: a tuple (option_name, value) or None if the line is blank or a\
+            comment
+    :raises ConfigSyntaxError: if the line is not of the form KEY=value
+    """
+    # type: (str, Optional[str]) -> Optional[Tuple[str, str]]
+    line = line.strip()
+    if not line or line[0] in _COMMENT_CHARS:
+        return None
+
+    option_name, separator, value = line.partition("=")
+    option_name = option_name.rstrip()
+    if not separator or not option_name:
+        raise ConfigSyntaxError(line + " is not of the form KEY=value")
+
+    value = _remove_inline_comment(value).strip()
+    if (
+        quote_char
+        and len(value) > 1
+        and value[0] == quote_char
+        and value[-1] == quote_char
+    ):
+        value = value[1:-1]
+
+    return option_name, value
+
+
+def replace_value(line, value):
+    """:returns: line with its value replaced by value. The option name, any\
+            whitespace, the inline comment and the line ending are all kept
+
+    :param value: the new value exactly as it should appear in the file\
+            (i.e. already wrapped in quote characters if they are needed)
+    """
+    # type: (str, str) -> str
+    value_start = line.index("=") + 1
+    while line[value_start : value_start + 1] in (" ", "\t"):
+        value_start += 1
+    old_value = _remove_inline_comment(line[value_start:]).rstrip()
+    rest_of_line = line[value_start + len(old_value) :]
+    if rest_of_line.startswith(_INLINE_COMMENT_CHAR):
+        # Otherwise the comment would become part of the value
+        rest_of_line = " " + rest_of_line
+    return line[:value_start] + value + rest_of_line
+
+
+def tokenize_config_lines(
+    lines,
+    format_option_name=None,
+    quote_char=None,
+    ignore_syntax_errors=False,
+    option_names=None,
+):
+    """Stream (line_index, option_name, value) tuples from a config file one
+    line at a time
+
+    line_index is the position of the line in lines, starting from 0. See
+    :tokenize_config_file: for the other parameters.
+    """
+    # type: (Any, Callable[[str], str], Optional[str], bool, Optional[Container[str]]) -> Iterator[Tuple[int, str, str]]
+    for line_index, line in enumerate(lines):
+        if option_names is not None:
+            # Checked before the rest of the line is looked at so that the
+            # lines that aren't needed are skipped as cheaply as possible
+            option_name = line.partition("=")[0].strip()
+            if format_option_name is not None:
+                option_name = format_option_name(option_name)
+            if option_name not in option_names:
+                continue
+
+        try:
+            token = tokenize_line(line, quote_char)
+        except ConfigSyntaxError as e:
+            if ignore_syntax_errors:
+                continue
+            raise ConfigSyntaxError("Line " + str(line_index + 1) + ": " + str(e))
+
+        if token is not None:
+            option_name, value = token
+            if format_option_name is not None:
+                option_name = format_option_name(option_name)
+            yield line_index, option_name, value
+
+
+def tokenize_config_file(
+    fp,
+    format_option_name=None,
+    quote_char=None,
+    ignore_syntax_errors=False,
+    option_names=None,
+):
+    """Stream (option_name, value) pairs from a config file one line at a time
+
+    :param fp: any iterable of lines e.g. a file pointer object
+    :param format_option_name: called on every option name before it is\
+            returned e.g. to convert it to upper case
+    :param quote_char: see :tokenize_line:
+    :param ignore_syntax_errors: if True lines that are not of the form\
+            KEY=value are skipped
+    :param option_names: if given only these options are returned (after\
+            format_option_name has been applied). Every other line is\
+            skipped without being checked
+    :raises ConfigSyntaxError: if ignore_syntax_errors is False and a line\
+            is not of the form KEY=value
+    """
+    # type: (Any, Callable[[str], str], Optional[str], bool, Optional[Container[str]]) -> Iterator[Tuple[str, str]]
+    for _, option_name, value in tokenize_config_lines(
+        fp,
+        format_option_name=format_option_name,
+        quote_char=quote_char,
+        ignore_syntax_errors=ignore_syntax_errors,
+        option_names=option_names,
+    ):
+        yield option_name, value
+
+
+def find_malformed_lines(fp):
+    """:param fp: any iterable of lines e.g. a file pointer object
+    :returns: a (line number, line) pair for every line that is not blank, a\
+            comment or of the form KEY=value. Line numbers start from 1 and\
+            the line ending is removed from each line
+    """
+    # type: (Any) -> List[Tuple[int, str]]
+    malformed_lines = []
+    for line_index, line in enumerate(fp):
+        try:
+            tokenize_line(line)
+        except ConfigSyntaxError:
+            malformed_lines.append((line_index + 1, line.rstrip("\r\n")))
+    return malformed_lines
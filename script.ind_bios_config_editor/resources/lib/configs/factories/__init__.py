@@ -7,3 +7,4 @@ from .format_converter_factory import (
     FormatConverterFactoryError,
 )
 from .validator_factory import validator_factory, ValidatorFactoryError
+from .field_codec_factory import compile_field_codecs, field_codec_factory
@@ -0,0 +1,75 @@
+"""Factory to create field codecs"""
+
+from collections import OrderedDict
+
+try:
+    # typing module not available on XBMC4XBOX
+    from typing import Any, Dict, Iterable, Optional
+except:
+    pass
+
+from ..config_field import BooleanField, DiscreteField, HexColourField, IntegerField
+from ..field_codec import FieldCodec
+from .format_converter_factory import format_converter_factory
+from .validator_factory import validator_factory
+
+
+def _longest_possible_value(config_field):
+    """:returns: the maximum length of a value for the field in config file\
+            format or None if there is no limit
+    """
+    # type: (Any) -> Optional[int]
+    if isinstance(config_field, BooleanField):
+        return 1
+    elif isinstance(config_field, IntegerField):
+        return max(len(str(config_field.min_value)), len(str(config_field.max_value)))
+    elif isinstance(config_field, DiscreteField):
+        # Discrete values are stored as an index
+        return len(str(len(config_field.values) - 1))
+    elif isinstance(config_field, HexColourField):
+        return 10 if config_field.with_alpha_channel else 8
+    return None
+
+
+def field_codec_factory(
+    config_field, max_line_length=None, quote_char_if_whitespace=None
+):
+    """Create a codec that validates and converts values for a field
+
+    :param config_field: a config field description from :resoures.lib.configs.config_field:
+    :param max_line_length: see :resources.lib.configs.field_codec.FieldCodec:
+    :param quote_char_if_whitespace: see :resources.lib.configs.field_codec.FieldCodec:
+    :returns: a :resources.lib.configs.field_codec.FieldCodec:
+    """
+    # type: (Any, Optional[int], Optional[str]) -> FieldCodec
+    return FieldCodec(
+        config_field.field_name,
+        config_field.default_value,
+        validator_factory(config_field),
+        format_converter_factory(config_field),
+        max_line_length=max_line_length,
+        quote_char_if_whitespace=quote_char_if_whitespace,
+        longest_possible_value=_longest_possible_value(config_field),
+    )
+
+
+def compile_field_codecs(
+    config_fields, max_line_length=None, quote_char_if_whitespace=None
+):
+    """Create a codec for each field
+
+    :returns: an OrderedDict mapping each field name to its codec, in the\
+            same order as config_fields
+    """
+    # type: (Iterable[Any], Optional[int], Optional[str]) -> Dict[str, FieldCodec]
+    return OrderedDict(
+        (
+            config_field.field_name,
+            field_codec_factory(
+                config_field,
+                max_line_length=max_line_length,
+                quote_char_if_whitespace=quote_char_if_whitespace,
+            ),
+        )
+        for config_field in config_fields
+    )
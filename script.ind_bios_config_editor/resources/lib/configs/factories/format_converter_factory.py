@@ -21,6 +21,7 @@ from ..config_field import (
 )
 from ..format_converters import (
     BooleanFormatConverter,
+    ColourFormatConverter,
     DiscreteFormatConverter,
     DOSFilePathFormatConverter,
     IntegerFormatConverter,
@@ -30,6 +31,8 @@ from ..format_converters import (
 
 # There is no need for there to be more than 1 instance of these
 _BOOLEAN_FORMAT_CONVERTER = BooleanFormatConverter()
+_COLOUR_FORMAT_CONVERTER = ColourFormatConverter(with_alpha_channel=False)
+_COLOUR_WITH_ALPHA_FORMAT_CONVERTER = ColourFormatConverter(with_alpha_channel=True)
 _DOS_FILE_PATH_CONVERTER = DOSFilePathFormatConverter()
 _OPTIONAL_DOS_FILE_PATH_CONVERTER = OptionalDOSFilePathFormatConverter()
 _INTEGER_FORMAT_CONVERTER = IntegerFormatConverter()
@@ -55,8 +58,14 @@ def format_converter_factory(config_field):
         return _INTEGER_FORMAT_CONVERTER
     elif isinstance(config_field, DiscreteField):
         return DiscreteFormatConverter(config_field.values)
-    elif isinstance(config_field, (StringField, HexColourField)):
+    elif isinstance(config_field, StringField):
         return _STRING_FORMAT_CONVERTER
+    elif isinstance(config_field, HexColourField):
+        return (
+            _COLOUR_WITH_ALPHA_FORMAT_CONVERTER
+            if config_field.with_alpha_channel
+            else _COLOUR_FORMAT_CONVERTER
+        )
     elif isinstance(config_field, HDDFilePathField):
         return _DOS_FILE_PATH_CONVERTER
     elif isinstance(config_field, OptionalHDDFilePathField):
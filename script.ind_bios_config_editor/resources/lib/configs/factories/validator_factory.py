@@ -24,16 +24,15 @@ from ..validators import (
     IntegerValidator,
     DiscreteValidator,
     RegexPatternMatchValidator,
-    ColourWithAlphaValidator,
-    ColourValidator,
+    ARGBColourValidator,
     DVDFilePathValidator,
     HDDFilePathValidator,
     OptionalHDDFilePathValidator,
 )
 
 _BOOLEAN_VALIDATOR = BooleanValidator()
-_COLOUR_VALIDATOR = ColourValidator()
-_COLOUR_WITH_ALPHA_VALIDATOR = ColourWithAlphaValidator()
+_COLOUR_VALIDATOR = ARGBColourValidator(with_alpha_channel=False)
+_COLOUR_WITH_ALPHA_VALIDATOR = ARGBColourValidator(with_alpha_channel=True)
 
 
 class ValidatorFactoryError(Exception):
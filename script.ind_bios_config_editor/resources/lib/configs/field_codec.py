@@ -0,0 +1,129 @@
+"""Validates and converts the value of a single config field.
+
+A codec bundles the validator and format converter for a field together with
+anything else that is needed to check a value (e.g. the maximum line length)
+so that both steps happen in a single call.
+"""
+import re
+
+try:
+    # typing not available on XBMC4XBOX
+    from typing import Any, Optional, TYPE_CHECKING
+
+    if TYPE_CHECKING:
+        from .format_converters import AbstractFormatConverter
+        from .validators import AbstractValidator
+except:
+    pass
+
+from .config_errors import ConfigFieldValueError
+
+_WHITESPACE_REGEX = re.compile(r"\s")
+
+
+class FieldCodec(object):
+    """Validates and converts the value of a single config field"""
+
+    __slots__ = (
+        "field_name",
+        "default_value",
+        "_validator",
+        "_format_converter",
+        "_max_value_length",
+        "_quote_char_if_whitespace",
+    )
+
+    def __init__(
+        self,
+        field_name,
+        default_value,
+        validator,
+        format_converter,
+        max_line_length=None,
+        quote_char_if_whitespace=None,
+        longest_possible_value=None,
+    ):
+        """:param max_line_length: the maximum length of a line in the config\
+                file (including the line ending)
+        :param quote_char_if_whitespace: optional quote character used to\
+                wrap values if they contain whitespace
+        :param longest_possible_value: the maximum length of any valid value\
+                in config file format, if there is one. Line lengths are not\
+                checked if a value can never be too long
+        """
+        # type: (str, Any, AbstractValidator, AbstractFormatConverter, Optional[int], Optional[str], Optional[int]) -> None
+        self.field_name = field_name
+        self.default_value = default_value
+        self._validator = validator
+        self._format_converter = format_converter
+        self._quote_char_if_whitespace = quote_char_if_whitespace
+        # The equals sign, and \r\n on the end of line
+        self._max_value_length = (
+            None if max_line_length is None else max_line_length - len(field_name) - 3
+        )
+        if (
+            self._max_value_length is not None
+            and longest_possible_value is not None
+            and longest_possible_value <= self._max_value_length
+        ):
+            self._max_value_length = None
+
+    def _validate_line_length(self, value_in_config_format):
+        """:raises ConfigFieldValueError: if the line in the config file would\
+                be too long for value_in_config_format
+        """
+        # type: (str) -> None
+        if self._max_value_length is not None:
+            value_length = len(value_in_config_format)
+            if self._quote_char_if_whitespace and _WHITESPACE_REGEX.search(
+                value_in_config_format
+            ):
+                # The quotes around the value
+                value_length += 2
+            if value_length > self._max_value_length:
+                raise ConfigFieldValueError(
+                    "Cannot use "
+                    + value_in_config_format
+                    + " for field "
+                    + self.field_name
+                    + " the line length in the file would be too long"
+                )
+
+    def validate_in_config_file_format(self, value):
+        """:raises ConfigFieldValueError: if value is not valid in config file\
+                format
+        """
+        # type: (str) -> None
+        self._validator.validate_in_config_file_format(value)
+        self._validate_line_length(value)
+
+    def validate_in_python_format(self, value):
+        """:raises ConfigFieldValueError: if value is not valid in Python\
+                format
+
+        Values are only converted to config file format if that is needed to
+        check the length of the line
+        """
+        # type: (Any) -> None
+        self._validator.validate_in_python_format(value)
+        if self._max_value_length is not None:
+            self._validate_line_length(
+                self._format_converter.convert_to_config_file_format(value)
+            )
+
+    def config_file_to_python_format(self, value):
+        """Validate a value in config file format and convert it to Python
+        format
+
+        :raises ConfigFieldValueError: if value is invalid
+        """
+        # type: (str) -> Any
+        self.validate_in_config_file_format(value)
+        return self._format_converter.convert_to_python_format(value)
+
+    def convert_to_config_file_format(self, value):
+        """Convert a value from Python format to config file format without
+        validating it
+        """
+        # type: (Any) -> str
+        return self._format_converter.convert_to_config_file_format(value)
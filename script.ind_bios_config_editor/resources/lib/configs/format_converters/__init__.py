@@ -4,6 +4,7 @@ config files and the format they need to be in for the rest of the program
 
 from .abstract_format_converter import AbstractFormatConverter
 from .boolean_format_converter import BooleanFormatConverter
+from .colour_format_converter import ColourFormatConverter
 from .discrete_format_converter import DiscreteFormatConverter
 from .dos_file_path_format_converters import (
     DOSFilePathFormatConverter,
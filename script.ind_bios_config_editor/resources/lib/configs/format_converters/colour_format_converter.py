@@ -0,0 +1,29 @@
+"""Convert colours between hex strings (e.g. 0xFFAA00) and ints of the form
+0xAARRGGBB
+"""
+from .abstract_format_converter import AbstractFormatConverter
+from ..colour import argb_to_hex_colour, hex_colour_to_argb
+
+
+class ColourFormatConverter(AbstractFormatConverter):
+    """Convert colours between hex strings (e.g. 0xFFAA00) and ints of the
+    form 0xAARRGGBB
+    """
+
+    def __init__(self, with_alpha_channel):
+        """:param with_alpha_channel: if False then colours in config file\
+                format have no alpha channel and are fully opaque in Python\
+                format
+        """
+        # type: (bool) -> None
+        self._with_alpha_channel = with_alpha_channel
+
+    def convert_to_config_file_format(self, value):
+        """Convert an int of the form 0xAARRGGBB to a hex string"""
+        # type: (int) -> str
+        return argb_to_hex_colour(value, self._with_alpha_channel)
+
+    def convert_to_python_format(self, value):
+        """Convert a hex string to an int of the form 0xAARRGGBB"""
+        # type: (str) -> int
+        return hex_colour_to_argb(value)
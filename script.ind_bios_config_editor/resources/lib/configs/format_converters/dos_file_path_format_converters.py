@@ -9,44 +9,47 @@ except:
 from .abstract_format_converter import AbstractFormatConverter
 
 
+# Drive letters and the hard disk partitions that they refer to
+_DRIVE_PARTITION_MAPPING = {"C": 2, "E": 1, "F": 6, "G": 7}
+_PARTITION_DRIVE_MAPPING = {
+    str(partition_number): drive_letter
+    for drive_letter, partition_number in _DRIVE_PARTITION_MAPPING.iteritems()
+}
+_FILE_PATH_PREAMBLE_HDD = "\\Device\\Harddisk0\\Partition"
+_FILE_PATH_PREAMBLE_DVD = "\\Device\\CdRom0"
+# Full prefix in the config file format for each drive letter
+_DRIVE_PREFIXES = {
+    drive_letter: _FILE_PATH_PREAMBLE_HDD + str(partition_number)
+    for drive_letter, partition_number in _DRIVE_PARTITION_MAPPING.iteritems()
+}
+_DRIVE_PREFIXES["D"] = _FILE_PATH_PREAMBLE_DVD
+
+
 class DOSFilePathFormatConverter(AbstractFormatConverter):
     """Converts between the path format \\Device\\<devicename>\\partition\\... to
     the DOS format (C:\\...)
     """
 
-    _DRIVE_PARTITION_MAPPING = {"C": 2, "E": 1, "F": 6, "G": 7}
-    _FILE_PATH_PREAMBLE_HDD = "\\Device\\Harddisk0\\Partition"
-    _FILE_PATH_PREAMBLE_DVD = "\\Device\\CdRom0"
-
     def convert_to_config_file_format(self, file_path):
         """Convert from the file path format format C:\\... to \\Device\\..."""
         # type: (str) -> str
-        drive_letter = file_path[0]
-        if drive_letter in self._DRIVE_PARTITION_MAPPING.keys():
-            partition_number = self._DRIVE_PARTITION_MAPPING[drive_letter]
-            file_path = (
-                self._FILE_PATH_PREAMBLE_HDD + str(partition_number) + file_path[2:]
-            )
-        elif drive_letter == "D":
-            file_path = self._FILE_PATH_PREAMBLE_DVD + file_path[2:]
-
-        return file_path
+        prefix = _DRIVE_PREFIXES.get(file_path[0])
+        if prefix is None:
+            return file_path
+        return prefix + file_path[2:]
 
     def convert_to_python_format(self, file_path):
         """Convert from the file path format format \\Device\\... to C:\\..."""
         # type: (str) -> str
-        if file_path.startswith(self._FILE_PATH_PREAMBLE_HDD):
-            file_path = file_path.replace(self._FILE_PATH_PREAMBLE_HDD, "")
-            partition_number = int(file_path[0])
-            drive_letter = None
-            for letter in self._DRIVE_PARTITION_MAPPING:
-                if self._DRIVE_PARTITION_MAPPING[letter] == partition_number:
-                    drive_letter = letter
-                    break
-            file_path = drive_letter + ":" + file_path[1:]
-        elif file_path.startswith(self._FILE_PATH_PREAMBLE_DVD):
-            file_path = "D:" + file_path.replace(self._FILE_PATH_PREAMBLE_DVD, "")
-
+        if file_path.startswith(_FILE_PATH_PREAMBLE_HDD):
+            file_path_on_partition = file_path[len(_FILE_PATH_PREAMBLE_HDD) :]
+            return (
+                _PARTITION_DRIVE_MAPPING[file_path_on_partition[0]]
+                + ":"
+                + file_path_on_partition[1:]
+            )
+        if file_path.startswith(_FILE_PATH_PREAMBLE_DVD):
+            return "D:" + file_path[len(_FILE_PATH_PREAMBLE_DVD) :]
         return file_path
 
 
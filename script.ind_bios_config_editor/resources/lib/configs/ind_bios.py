@@ -9,13 +9,21 @@ except:
 from .abstract_config import AbstractConfig
 from .ind_bios_fields import IND_BIOS_FIELDS
 
+_MAX_LINE_LENGTH = 300
+_QUOTE_CHAR_IF_WHITESPACE = '"'
+
 
 class IndBiosConfig(AbstractConfig):
     """Read and edit the iND-BiOS config"""
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(IndBiosConfig, self).__init__(
-            *args, max_line_length=300, quote_char_if_whitespace='"', **kwargs
+            *args,
+            max_line_length=_MAX_LINE_LENGTH,
+            quote_char_if_whitespace=_QUOTE_CHAR_IF_WHITESPACE,
+            **kwargs
         )
 
     def _get_fields(self):
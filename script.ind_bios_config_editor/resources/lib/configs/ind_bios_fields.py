@@ -37,17 +37,17 @@ _IND_BIOS_FIELDS = {
         "CAMERAVIEW", "-1", tuple(str(x) for x in range(-1, 16))
     ),
     "fastani": BooleanField("FASTANI", False),
-    "scenecolor1": HexColourField("SCENECOLOR1", "0xFF35FF1A", True),
-    "scenecolor2": HexColourField("SCENECOLOR2", "0xFF35FF1A", True),
-    "scenecolor3": HexColourField("SCENECOLOR3", "0xFF35FF1A", True),
+    "scenecolor1": HexColourField("SCENECOLOR1", 0xFF35FF1A, True),
+    "scenecolor2": HexColourField("SCENECOLOR2", 0xFF35FF1A, True),
+    "scenecolor3": HexColourField("SCENECOLOR3", 0xFF35FF1A, True),
     "showflub": BooleanField("SHOWFLUB", True),
     "nosound": BooleanField("NOSOUND", False),
     # Blob
-    "blobcolor": HexColourField("BLOBCOLOR", "0x40FF27", False),
+    "blobcolor": HexColourField("BLOBCOLOR", 0xFF40FF27, False),
     "blobradi": IntegerField("BLOBRADI", 23, 0, 100),
     "blobsdead": BooleanField("BLOBSDEAD", False),
     "blobthrob": BooleanField("BLOBTHROB", True),
-    "blobbgc": HexColourField("BLOBBGC", "0x000000", False),
+    "blobbgc": HexColourField("BLOBBGC", 0xFF000000, False),
     "slowmoblob": BooleanField("SLOWMOBLOB", False),
     "spikeyblob": BooleanField("SPIKEYBLOB", False),
     "customblob": OptionalHDDFilePathField("CUSTOMBLOB", "C:\\flubber.x", "x"),
@@ -56,27 +56,27 @@ _IND_BIOS_FIELDS = {
     "fogon": BooleanField("FOGON", True),
     # Double check this section
     "fog1abs": BooleanField("FOG1ABS", False),
-    "fog1color": HexColourField("FOG1COLOR", "0xFF35FF1A", True),
+    "fog1color": HexColourField("FOG1COLOR", 0xFF35FF1A, True),
     "fog1custom": BooleanField("FOG1CUSTOM", False),
-    "fog2color": HexColourField("FOG2COLOR", "0xFF35FF1A", True),
+    "fog2color": HexColourField("FOG2COLOR", 0xFF35FF1A, True),
     "fog2custom": BooleanField("FOG2CUSTOM", False),
     # Boot animation glow
-    "glowcolor": HexColourField("GLOWCOLOR", "0xA0FF60", False),
-    "ioglowcolor": HexColourField("IOGLOWCOLOR", "0xA0FF60", False),
+    "glowcolor": HexColourField("GLOWCOLOR", 0xFFA0FF60, False),
+    "ioglowcolor": HexColourField("IOGLOWCOLOR", 0xFFA0FF60, False),
     "noflubbg": BooleanField("NOFLUBBG", False),
     # X screen
     "showxen": BooleanField("SHOWXEN", True),
-    "bgcolor": HexColourField("BGCOLOR", "0xFFFFFF", False),
+    "bgcolor": HexColourField("BGCOLOR", 0xFFFFFFFF, False),
     "skewen": BooleanField("SKEWEN", True),
     "tms": BooleanField("TMS", True),
     # The X on the X screen
     "ind3d": BooleanField("IND3D", True),
-    "lipcolor": HexColourField("LIPCOLOR", "0x000100", False),
-    "lipglow": HexColourField("LIPGLOW", "0x4b9b4b", False),
-    "xboxcolor": HexColourField("XBOXCOLOR", "0x62ca13", False),
-    "xglowcolor": HexColourField("XGLOWCOLOR", "0xCADE00", False),
-    "xinnercolor": HexColourField("XINNERCOLOR", "0x206a16", False),
-    "xlightcolor": HexColourField("XLIGHTCOLOR", "0xff000000", True),
+    "lipcolor": HexColourField("LIPCOLOR", 0xFF000100, False),
+    "lipglow": HexColourField("LIPGLOW", 0xFF4B9B4B, False),
+    "xboxcolor": HexColourField("XBOXCOLOR", 0xFF62CA13, False),
+    "xglowcolor": HexColourField("XGLOWCOLOR", 0xFFCADE00, False),
+    "xinnercolor": HexColourField("XINNERCOLOR", 0xFF206A16, False),
+    "xlightcolor": HexColourField("XLIGHTCOLOR", 0xFF000000, True),
     "yskewlogo": IntegerField("YSKEWLOGO", -20, -100, 100),
     "xskewlogo": IntegerField("XSKEWLOGO", 0, -100, 100),
     "xscewxlogo": IntegerField("XSKEWXLOGO", 0, -100, 100),
@@ -86,7 +86,7 @@ _IND_BIOS_FIELDS = {
     # MS logo
     "showmsen": BooleanField("SHOWMSEN", True),
     "mslogotransen": BooleanField("MSLOGOTRANSEN", False),
-    "mslogotranscolor": HexColourField("MSLOGOTRANSCOLOR", "0xff00ff", False),
+    "mslogotranscolor": HexColourField("MSLOGOTRANSCOLOR", 0xFFFF00FF, False),
     "nolighten": BooleanField("NOLIGHTEN", False),
     "customlogo": OptionalHDDFilePathField("CUSTOMLOGO", "C:\\mslogo.bmp", "bmp"),
     # Xbox text
@@ -0,0 +1,67 @@
+"""The presets in a directory and the colours in each of them, used to show
+previews when picking a preset to load
+
+Presets are indexed by a :PresetLibrary: so only those that are new or have
+changed are read, and their colours are kept in a :PresetSwatches: file so
+that the previews for a directory can be shown without opening any presets.
+"""
+import os
+
+try:
+    # typing not available on XBMC4XBOX
+    from typing import Dict, Iterable, List, Optional, Tuple
+except:
+    pass
+
+from .preset_library import PresetLibrary
+from .preset_swatches import PresetSwatches
+
+
+class PresetBrowser(object):
+    """Lists the presets in a directory along with the colours in each"""
+
+    def __init__(self, preset_library, swatch_filename, colour_fields):
+        """:param swatch_filename: where the colours of the presets are\
+                stored. It is created if it doesn't exist
+        :param colour_fields: the fields to show the colours of
+        """
+        # type: (PresetLibrary, str, Iterable[str]) -> None
+        self._preset_library = preset_library
+        self._swatch_filename = swatch_filename
+        self._colour_fields = tuple(colour_fields)
+        self._swatches = PresetSwatches.load(swatch_filename, self._colour_fields)
+
+    def get_colour_fields(self):
+        """:returns: the fields that colours are shown for"""
+        # type: () -> Tuple[str, ...]
+        return self._colour_fields
+
+    def list_presets(self, directory):
+        """Index the presets in directory (and its subdirectories), reading
+        only those that are new or have changed
+
+        :returns: the filenames of the presets, sorted
+        """
+        # type: (str) -> List[str]
+        if self._swatches.update_from_library(self._preset_library, directory):
+            self._save_swatches()
+        return self._swatches.filenames()
+
+    def get_colours(self, filename):
+        """:returns: the colour of each colour field in a listed preset as a\
+                hex string (e.g. for _ColourSquare) or None if it hasn't been\
+                listed
+        """
+        # type: (str) -> Optional[Dict[str, str]]
+        return self._swatches.get_hex_colours(filename)
+
+    def _save_swatches(self):
+        # type: () -> None
+        try:
+            directory = os.path.dirname(self._swatch_filename)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+            self._swatches.save(self._swatch_filename)
+        except EnvironmentError:
+            # The presets will just be looked up in the index again next time
+            pass
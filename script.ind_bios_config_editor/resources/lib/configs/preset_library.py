@@ -0,0 +1,200 @@
+"""Index of preset files (config files that contain values for certain
+fields that can be reapplied to a config later)
+
+Reading and validating a whole config file is slow on the Xbox so the values
+from each preset are stored in an index file along with its modification time.
+Presets are only read again if they have changed.
+"""
+import json
+import os
+
+try:
+    # typing not available on XBMC4XBOX
+    from typing import (
+        Any,
+        Callable,
+        Dict,
+        List,
+        Optional,
+        Tuple,
+        TYPE_CHECKING,
+    )
+
+    if TYPE_CHECKING:
+        from .abstract_config import AbstractConfig
+except:
+    pass
+
+from .config_errors import ConfigError, ConfigPresetDoesNotExistError
+
+# Changed whenever the format of the index file changes
+_INDEX_VERSION = 2
+
+
+def _from_json(value):
+    """:returns: value with unicode converted back to str (json always\
+            returns unicode on Python 2)
+    """
+    # type: (Any) -> Any
+    if isinstance(value, unicode):
+        return value.encode("utf-8")
+    if isinstance(value, dict):
+        return {_from_json(key): _from_json(item) for key, item in value.iteritems()}
+    return value
+
+
+class PresetLibrary(object):
+    """Index of the field values in preset files, stored in a JSON file"""
+
+    def __init__(self, index_filename, config_factory, extensions=(".cfg",)):
+        """:param index_filename: where the index is stored. It is created if\
+                it doesn't exist
+        :param config_factory: called with no arguments to create an empty\
+                config (e.g. IndBiosConfig) that is used to read presets
+        :param extensions: only files ending in one of these are presets
+        """
+        # type: (str, Callable[[], AbstractConfig], Tuple[str, ...]) -> None
+        self._index_filename = index_filename
+        self._config_factory = config_factory
+        self._extensions = tuple(extension.lower() for extension in extensions)
+        # Loaded the first time that it is needed
+        self._index = None  # type: Optional[Dict[str, Dict[str, Any]]]
+        self._defaults = None  # type: Optional[Dict[str, Any]]
+
+    def _get_index(self):
+        # type: () -> Dict[str, Dict[str, Any]]
+        if self._index is None:
+            try:
+                with open(self._index_filename) as fp:
+                    index = _from_json(json.load(fp))
+                if index.get("version") != _INDEX_VERSION:
+                    raise ValueError("Index is out of date")
+                self._index = index["presets"]
+            except (EnvironmentError, ValueError, KeyError, AttributeError):
+                # Missing or corrupt, it will be rebuilt
+                self._index = {}
+        return self._index
+
+    def _save_index(self):
+        # type: () -> None
+        try:
+            directory = os.path.dirname(self._index_filename)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+            with open(self._index_filename, "w") as fp:
+                json.dump({"version": _INDEX_VERSION, "presets": self._index}, fp)
+        except EnvironmentError:
+            # Presets will just be read again next time
+            pass
+
+    def _read_preset(self, filename, stat):
+        """:returns: an index entry for a preset file"""
+        # type: (str, os.stat_result) -> Dict[str, Any]
+        config = self._config_factory()
+        try:
+            invalid_fields = config.read(filename)
+            error = None
+        except (ConfigError, EnvironmentError) as e:
+            invalid_fields = {}
+            error = str(e)
+        defaults = config.defaults()
+        return {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "valid": not invalid_fields and error is None,
+            "invalid_fields": invalid_fields,
+            "error": error,
+            # Only values that aren't the default are stored, to keep it small
+            "values": {
+                option: config.get(option)
+                for option in config.options()
+                if config.get(option) != defaults[option]
+            },
+        }
+
+    def _update_entry(self, filename):
+        """Read filename again if it has changed since it was indexed
+
+        :returns: True if the index has changed
+        :raises ConfigPresetDoesNotExistError: if filename does not exist
+        """
+        # type: (str) -> bool
+        index = self._get_index()
+        try:
+            stat = os.stat(filename)
+        except EnvironmentError:
+            if index.pop(filename, None) is not None:
+                self._save_index()
+            raise ConfigPresetDoesNotExistError(
+                "Preset '" + filename + "' does not exist"
+            )
+
+        entry = index.get(filename)
+        if (
+            entry is not None
+            and entry["mtime"] == stat.st_mtime
+            and entry["size"] == stat.st_size
+        ):
+            return False
+        index[filename] = self._read_preset(filename, stat)
+        return True
+
+    def scan(self, directory):
+        """Index every preset in a directory (and its subdirectories),
+        reading only those that are new or have changed
+
+        :returns: the filenames of the presets, sorted
+        """
+        # type: (str) -> List[str]
+        directory = os.path.abspath(directory)
+        filenames = []
+        changed = False
+        for path, subdirectories, files in os.walk(directory):
+            for filename in files:
+                if filename.lower().endswith(self._extensions):
+                    filename = os.path.join(path, filename)
+                    filenames.append(filename)
+                    try:
+                        changed = self._update_entry(filename) or changed
+                    except ConfigPresetDoesNotExistError:
+                        # Deleted since os.walk listed it
+                        filenames.pop()
+
+        # Forget presets that have been deleted
+        index = self._get_index()
+        found = set(filenames)
+        prefix = os.path.join(directory, "")
+        for filename in list(index):
+            if filename.startswith(prefix) and filename not in found:
+                del index[filename]
+                changed = True
+
+        if changed:
+            self._save_index()
+        return sorted(filenames)
+
+    def get(self, filename):
+        """:returns: the index entry for a preset, reading it first if it is\
+                new or has changed. The entry contains "valid",\
+                "invalid_fields" (see\
+                :resources.lib.configs.AbstractConfig.readfp:), "error" (if\
+                the file could not be read) and "values" (only those that\
+                aren't the default)
+        :raises ConfigPresetDoesNotExistError: if filename does not exist
+        """
+        # type: (str) -> Dict[str, Any]
+        filename = os.path.abspath(filename)
+        if self._update_entry(filename):
+            self._save_index()
+        return self._get_index()[filename]
+
+    def get_values(self, filename):
+        """:returns: the value (in Python format) of every field in a preset
+        :raises ConfigPresetDoesNotExistError: if filename does not exist
+        """
+        # type: (str) -> Dict[str, Any]
+        if self._defaults is None:
+            self._defaults = self._config_factory().defaults()
+        values = dict(self._defaults)
+        values.update(self.get(filename)["values"])
+        return values
@@ -0,0 +1,165 @@
+"""Colour swatches for presets, stored in a single compact file
+
+Presets for the boot animation are mostly defined by their colours. Storing
+just those colours for every preset in one file means that previews can be
+shown without opening each preset.
+
+The file is little endian and contains:
+    - a header: SWCH, the format version (uint16), the number of colour\
+            fields (uint16) and the number of presets (uint32)
+    - the name of each colour field: its length (uint8) then the name
+    - for each preset: the length of its filename (uint16), the filename\
+            (UTF-8) then each colour as an ARGB int (uint32)
+"""
+from collections import OrderedDict
+import struct
+
+try:
+    # typing not available on XBMC4XBOX
+    from typing import Any, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+    if TYPE_CHECKING:
+        from .preset_library import PresetLibrary
+except:
+    pass
+
+from .colour import argb_to_hex_colour
+
+_MAGIC = "SWCH"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHI")
+_FIELD_NAME_LENGTH = struct.Struct("<B")
+_FILENAME_LENGTH = struct.Struct("<H")
+
+
+class PresetSwatches(object):
+    """The colours in each preset, stored as packed ARGB ints"""
+
+    def __init__(self, colour_fields):
+        """:param colour_fields: the names of the fields to store colours for"""
+        # type: (Iterable[str]) -> None
+        self._colour_fields = tuple(colour_fields)
+        self._colours = struct.Struct("<" + str(len(self._colour_fields)) + "I")
+        # Filename -> packed colours
+        self._swatches = OrderedDict()  # type: Dict[str, str]
+
+    @classmethod
+    def load(cls, filename, colour_fields):
+        """Read swatches from a file with a single read
+
+        :returns: the swatches or no swatches if the file doesn't exist, is\
+                corrupt or was made for different colour fields
+        """
+        # type: (str, Iterable[str]) -> PresetSwatches
+        swatches = cls(colour_fields)
+        try:
+            with open(filename, "rb") as fp:
+                data = fp.read()
+            swatches._unpack(data)
+        except (EnvironmentError, ValueError, struct.error):
+            swatches._swatches.clear()
+        return swatches
+
+    def _unpack(self, data):
+        """:raises ValueError: if the data isn't for these colour fields"""
+        # type: (str) -> None
+        magic, version, num_fields, num_presets = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a swatch file or out of date")
+
+        offset = _HEADER.size
+        colour_fields = []
+        for _ in range(num_fields):
+            (length,) = _FIELD_NAME_LENGTH.unpack_from(data, offset)
+            offset += _FIELD_NAME_LENGTH.size
+            colour_fields.append(data[offset : offset + length])
+            offset += length
+        if tuple(colour_fields) != self._colour_fields:
+            raise ValueError("Swatches are for different colour fields")
+
+        for _ in range(num_presets):
+            (length,) = _FILENAME_LENGTH.unpack_from(data, offset)
+            offset += _FILENAME_LENGTH.size
+            preset_filename = data[offset : offset + length]
+            offset += length
+            colours = data[offset : offset + self._colours.size]
+            if len(colours) != self._colours.size:
+                raise ValueError("Swatch file is truncated")
+            offset += self._colours.size
+            self._swatches[preset_filename] = colours
+
+    def save(self, filename):
+        """Write every swatch to a file"""
+        # type: (str) -> None
+        parts = [
+            _HEADER.pack(
+                _MAGIC, _VERSION, len(self._colour_fields), len(self._swatches)
+            )
+        ]
+        for field in self._colour_fields:
+            parts.append(_FIELD_NAME_LENGTH.pack(len(field)) + field)
+        for preset_filename, colours in self._swatches.iteritems():
+            parts.append(
+                _FILENAME_LENGTH.pack(len(preset_filename)) + preset_filename + colours
+            )
+        with open(filename, "wb") as fp:
+            fp.write("".join(parts))
+
+    def set(self, preset_filename, values):
+        """Store the colours from a preset
+
+        :param values: the value of each field in the preset, in Python\
+                format. See\
+                :resources.lib.configs.preset_library.PresetLibrary.get_values:
+        """
+        # type: (str, Dict[str, Any]) -> None
+        if isinstance(preset_filename, unicode):
+            preset_filename = preset_filename.encode("utf-8")
+        self._swatches[preset_filename] = self._colours.pack(
+            *(values[field] for field in self._colour_fields)
+        )
+
+    def update_from_library(self, preset_library, directory):
+        """Store the colours from every preset in a directory, and forget any
+        presets that have been deleted
+
+        :param preset_library: used to get the values from each preset so\
+                that only the presets that have changed are read
+        :returns: True if any swatch has changed
+        """
+        # type: (PresetLibrary, str) -> bool
+        original_swatches = dict(self._swatches)
+        filenames = preset_library.scan(directory)
+        self._swatches.clear()
+        for preset_filename in filenames:
+            self.set(preset_filename, preset_library.get_values(preset_filename))
+        return self._swatches != original_swatches
+
+    def filenames(self):
+        """:returns: the filenames of all the presets with swatches"""
+        # type: () -> List[str]
+        return list(self._swatches)
+
+    def get(self, preset_filename):
+        """:returns: the colours in a preset as ARGB ints, in the same order\
+                as the colour fields, or None if there is no swatch for it
+        """
+        # type: (str) -> Optional[Tuple[int, ...]]
+        colours = self._swatches.get(preset_filename)
+        if colours is None:
+            return None
+        return self._colours.unpack(colours)
+
+    def get_hex_colours(self, preset_filename):
+        """:returns: the colours in a preset as hex strings (e.g. for\
+                _ColourSquare) keyed by field name, or None if there is no\
+                swatch for it
+        """
+        # type: (str) -> Optional[Dict[str, str]]
+        colours = self.get(preset_filename)
+        if colours is None:
+            return None
+        return {
+            field: argb_to_hex_colour(colour)
+            for field, colour in zip(self._colour_fields, colours)
+        }
@@ -4,7 +4,11 @@ formats
 
 from .abstract_validator import AbstractValidator
 from .boolean_validator import BooleanValidator
-from .colour_validators import ColourValidator, ColourWithAlphaValidator
+from .colour_validators import (
+    ARGBColourValidator,
+    ColourValidator,
+    ColourWithAlphaValidator,
+)
 from .discrete_validator import DiscreteValidator
 from .file_path_validators import (
     DVDFilePathValidator,
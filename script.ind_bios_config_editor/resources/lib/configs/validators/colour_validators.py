@@ -1,5 +1,7 @@
 """Validate hexadecimal colours (with or without an alpha channel)"""
+from .abstract_validator import AbstractValidator
 from .regex_pattern_match_validator import RegexPatternMatchValidator
+from ..config_errors import ConfigFieldValueError
 
 
 class _HexValidator(RegexPatternMatchValidator):
@@ -24,3 +26,48 @@ class ColourWithAlphaValidator(_HexValidator):
 
     def __init__(self):
         super(ColourWithAlphaValidator, self).__init__(8)
+
+
+class ARGBColourValidator(AbstractValidator):
+    """Validate colours that are hex strings (e.g. 0xFFAA00) in config file
+    format and ints of the form 0xAARRGGBB in Python format
+    """
+
+    __slots__ = "_with_alpha_channel", "_hex_validator"
+
+    def __init__(self, with_alpha_channel):
+        """:param with_alpha_channel: if False then colours in config file\
+                format have no alpha channel and colours in Python format\
+                must be fully opaque
+        """
+        # type: (bool) -> None
+        self._with_alpha_channel = with_alpha_channel
+        self._hex_validator = (
+            ColourWithAlphaValidator() if with_alpha_channel else ColourValidator()
+        )
+
+    def validate_in_config_file_format(self, value):
+        """:raises ConfigFieldValueError: if value is not a hex colour string\
+                e.g. 0xFFAA00 or 0xFFAA00BB if there is an alpha channel
+        """
+        self._hex_validator.validate_in_config_file_format(value)
+
+    def validate_in_python_format(self, value):
+        """:raises ConfigFieldValueError: if value is not an int or long such\
+                that 0 <= value <= 0xFFFFFFFF, or if it is not fully opaque\
+                when there is no alpha channel
+        """
+        # bool is a subclass of int
+        if isinstance(value, bool) or not isinstance(value, (int, long)):
+            raise ConfigFieldValueError(
+                "Value must be an int or long not " + str(type(value))
+            )
+        if value < 0 or value > 0xFFFFFFFF:
+            raise ConfigFieldValueError(
+                str(value) + " is not valid, value must be >= 0 and <= 0xFFFFFFFF"
+            )
+        if not self._with_alpha_channel and value >> 24 != 0xFF:
+            raise ConfigFieldValueError(
+                "0x%08X is not valid, colours without an alpha channel must "
+                "have an alpha of 0xFF" % value
+            )
@@ -12,17 +12,49 @@ classes that use them.
 
 All controls also pass their current value to whatever callback is connected to
 them via window.connect. (Unlike those defined in PyXBMCt.)
+
+Each control's module is only imported the first time that the control is
+used, so that opening a window doesn't pay for every control up front.
 """
 
-from .colour_picker import ColourPicker
-from .colour_picker_full import ColourPickerFull
-from .file_selector import *
-from .file_selector_or_zero import *
-from .select_box import *
-from .fake_slider import *
-from .fake_edit import *
-from .led_pattern import *
-from .horizontal_rule import *
-from .button_with_icon import *
-from .radio_button import *
-from .abstract_control import *
+try:
+    # typing not available on XBMC4Xbox
+    from typing import TYPE_CHECKING
+
+    if TYPE_CHECKING:
+        # The same imports that are made lazily below, so that static analysis
+        # (e.g. pytype) can see every name in the package
+        from .abstract_control import AbstractControl
+        from .button_with_icon import ButtonWithIcon
+        from .colour_picker import ColourPicker
+        from .colour_picker_full import ColourPickerFull
+        from .fake_edit import FakeEdit
+        from .fake_slider import FakeSlider
+        from .file_selector import FileSelector
+        from .file_selector_or_zero import FileSelectorOrZero
+        from .horizontal_rule import HorizontalRule
+        from .led_pattern import LedPattern
+        from .radio_button import RadioButton
+        from .select_box import SelectBox
+except:
+    pass
+
+from .._lazy_module import make_module_lazy
+
+make_module_lazy(
+    __name__,
+    {
+        "AbstractControl": ".abstract_control",
+        "ButtonWithIcon": ".button_with_icon",
+        "ColourPicker": ".colour_picker",
+        "ColourPickerFull": ".colour_picker_full",
+        "FakeEdit": ".fake_edit",
+        "FakeSlider": ".fake_slider",
+        "FileSelector": ".file_selector",
+        "FileSelectorOrZero": ".file_selector_or_zero",
+        "HorizontalRule": ".horizontal_rule",
+        "LedPattern": ".led_pattern",
+        "RadioButton": ".radio_button",
+        "SelectBox": ".select_box",
+    },
+)
@@ -1,15 +1,16 @@
 """A helper control that displays a square with a given colour"""
 
+try:
+    # typing not available on XBMC4Xbox
+    from typing import Any, Union
+except:
+    pass
 import pyxbmct
-import os
-import xbmcaddon
 
-_addon = xbmcaddon.Addon()
-_addon_path = _addon.getAddonInfo("path")
+from ..configs.colour import argb_to_hex_colour, colour_to_argb
+from ._texture_registry import get_texture, record_texture_used
 
-_COLOUR_SQUARE_IMAGE_FILENAME = os.path.join(
-    _addon_path, "resources", "media", "colour_picker_white_square.png"
-)
+_TEXTURE = "colour_picker_white_square.png"
 
 
 class _ColourSquare(pyxbmct.Image):
@@ -19,24 +20,32 @@ class _ColourSquare(pyxbmct.Image):
         # parameter not used here. Not camel cae as that is not the convetion
         # used in PyXBMCt.
         return super(_ColourSquare, cls).__new__(
-            cls, _COLOUR_SQUARE_IMAGE_FILENAME, aspectRatio=2
+            cls, get_texture(_TEXTURE), aspectRatio=2
         )
 
     def __init__(self, color_diffuse):
-        # type: (str) -> None
+        # type: (Union[int, str]) -> None
         # parameter not used here. Not camel cae as that is not the convetion
         # used in PyXBMCt.
         self.setColorDiffuse(color_diffuse)
 
+    def _placedCallback(self, window, *args, **kwargs):
+        """Called once the square has been placed"""
+        # type: (Any, Any, Any) -> None
+        record_texture_used(window, get_texture(_TEXTURE))
+        # pyxbmct.Image doesn't have a _placedCallback of its own, but a class
+        # between this one and it in the MRO might
+        placed_callback = getattr(super(_ColourSquare, self), "_placedCallback", None)
+        if placed_callback is not None:
+            placed_callback(window, *args, **kwargs)
+
     def setColorDiffuse(self, color_diffuse):
         """Override of the method from pyxbmct.Image
         
-        :param colorDiffuse: a hex colour e.g. FFAA00, FFAAAABB, 0xFFFFFF
+        :param colorDiffuse: an int of the form 0xAARRGGBB or a hex colour\
+                e.g. FFAA00, FFAAAABB, 0xFFFFFF
         """
-        # type: (str) -> None
-        if color_diffuse[0:2] == "0x":
-            if len(color_diffuse) < 10:
-                color_diffuse = color_diffuse[0:2] + "FF" + color_diffuse[2:]
-        elif len(color_diffuse) < 8:
-            color_diffuse = "FF" + color_diffuse
-        super(_ColourSquare, self).setColorDiffuse(color_diffuse)
+        # type: (Union[int, str]) -> None
+        super(_ColourSquare, self).setColorDiffuse(
+            argb_to_hex_colour(colour_to_argb(color_diffuse))
+        )
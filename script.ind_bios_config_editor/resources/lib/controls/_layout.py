@@ -0,0 +1,109 @@
+"""Measures the geometry of controls that have been placed in a window
+
+Controls that position their own parts (e.g. the icon of a ButtonWithIcon)
+need the position and size of controls after PyXBMCt has placed them. Every
+getPosition, getWidth and getHeight is a round trip to XBMC, so whilst a
+window has a :Layout: the measurements are recorded and replayed from it
+instead. The measurements only depend on the layout of the window, so a
+layout recorded once can be cached and reused for as long as the layout
+doesn't change.
+
+Each measurement is recorded along with the identity of the control that was
+measured (its type and where it was placed). If a control doesn't match the
+identity recorded at the same point in the cached layout, the rest of the
+cached layout is thrown away and the controls are measured instead.
+"""
+try:
+    # typing not available on XBMC4Xbox
+    from typing import Any, List, Optional, Sequence, Tuple
+
+    Rectangle = Tuple[int, int, int, int]
+    # The type of the control and the row, column, rowspan and columnspan it
+    # was placed at
+    Identity = Tuple[Any, ...]
+except:
+    pass
+
+# Name of the attribute that a window's layout is stored in
+_WINDOW_ATTRIBUTE = "_control_layout"
+
+
+class Layout(object):
+    """The geometry of controls, in the order that they are measured in"""
+
+    def __init__(self, measurements=None):
+        """:param measurements: the (identity, rectangle) pairs recorded by a\
+                previous layout of the same controls, or None to measure\
+                every control
+        """
+        # type: (Optional[List[Tuple[Identity, Rectangle]]]) -> None
+        self._cached_measurements = list(measurements or [])
+        self._measurements = []  # type: List[Tuple[Identity, Rectangle]]
+
+    def measure(self, control, placement):
+        """:param placement: the row, column, rowspan and columnspan that\
+                control was placed at
+        :returns: the position and size (x, y, width, height) of control
+        """
+        # type: (Any, Sequence[int]) -> Rectangle
+        identity = get_identity(control, placement)
+        index = len(self._measurements)
+        if index < len(self._cached_measurements):
+            cached_identity, rectangle = self._cached_measurements[index]
+            if cached_identity != identity:
+                # The controls have changed, so none of the rest of the cached
+                # layout can be trusted
+                del self._cached_measurements[index:]
+                rectangle = _query_rectangle(control)
+        else:
+            rectangle = _query_rectangle(control)
+        self._measurements.append((identity, rectangle))
+        return rectangle
+
+    def get_measurements(self):
+        """:returns: every (identity, rectangle) pair measured so far"""
+        # type: () -> List[Tuple[Identity, Rectangle]]
+        return list(self._measurements)
+
+    def used_cache(self):
+        """:returns: True if every control was replayed from the cached\
+                measurements, and no cached measurements were left unused
+        """
+        # type: () -> bool
+        return self._measurements == self._cached_measurements
+
+
+def get_identity(control, placement):
+    """:param placement: the row, column, rowspan and columnspan that control\
+            was placed at
+    :returns: what a cached measurement of control is checked against
+    """
+    # type: (Any, Sequence[int]) -> Identity
+    return (type(control).__name__,) + tuple(placement)
+
+
+def _query_rectangle(control):
+    # type: (Any) -> Rectangle
+    x, y = control.getPosition()
+    return x, y, control.getWidth(), control.getHeight()
+
+
+def set_layout(window, layout):
+    """Record (or replay) the measurements of the controls placed in window\
+    in layout. None stops recording.
+    """
+    # type: (Any, Optional[Layout]) -> None
+    setattr(window, _WINDOW_ATTRIBUTE, layout)
+
+
+def measure(window, control, placement):
+    """:param window: the window that control has been placed in
+    :param placement: the row, column, rowspan and columnspan that control\
+            was placed at
+    :returns: the position and size (x, y, width, height) of control
+    """
+    # type: (Any, Any, Sequence[int]) -> Rectangle
+    layout = getattr(window, _WINDOW_ATTRIBUTE, None)
+    if layout is None:
+        return _query_rectangle(control)
+    return layout.measure(control, placement)
@@ -0,0 +1,130 @@
+"""Routes the actions that move sliders straight to the slider that has focus
+
+Connecting a handler for every slider to the window would mean that every
+left/right press ran the handler of every slider in the window, each of which
+would have to check whether it had focus.
+
+Sliders coalesce the updates from held down keys (see
+:resources.lib.controls._update_coalescer:), so windows that contain sliders
+must call :SliderDispatcher.flush_window: before handling any action or click
+and before using the values of their controls (e.g. when saving).
+"""
+import pyxbmct
+
+try:
+    # typing not available on XBMC4Xbox
+    from typing import Any, Callable, Dict, Optional, Set, Tuple
+except:
+    pass
+
+_INCREASE_ACTIONS = [pyxbmct.ACTION_MOVE_RIGHT, pyxbmct.ACTION_MOUSE_WHEEL_UP]
+_DECREASE_ACTIONS = [pyxbmct.ACTION_MOVE_LEFT, pyxbmct.ACTION_MOUSE_WHEEL_DOWN]
+_MOVE_ACTIONS = frozenset(_INCREASE_ACTIONS + _DECREASE_ACTIONS)
+
+# Name of the attribute that each window's dispatcher is stored in
+_WINDOW_ATTRIBUTE = "_slider_dispatcher"
+
+
+class SliderDispatcher(object):
+    """Maps the ID of each focusable slider control in a window to the
+    functions that move that slider and carry out its waiting updates
+
+    Only the sliders whose moves have left an update waiting are flushed.
+    """
+
+    def __init__(self, window):
+        # type: (Any) -> None
+        self._window = window
+        self._sliders = {}  # type: Dict[int, Tuple[Callable, Callable, Callable]]
+        # IDs of the sliders that may have an update waiting
+        self._pending = set()  # type: Set[int]
+        window.connectEventList(_INCREASE_ACTIONS, self._increase)
+        window.connectEventList(_DECREASE_ACTIONS, self._decrease)
+
+    @classmethod
+    def for_window(cls, window):
+        """:returns: the dispatcher for window, creating it if there isn't\
+                one yet
+        """
+        # type: (Any) -> SliderDispatcher
+        dispatcher = getattr(window, _WINDOW_ATTRIBUTE, None)
+        if dispatcher is None:
+            dispatcher = cls(window)
+            setattr(window, _WINDOW_ATTRIBUTE, dispatcher)
+        return dispatcher
+
+    @classmethod
+    def flush_window(cls, window, action=None):
+        """Carry out the updates that are waiting for any slider in window
+
+        :param action: the action that the window is about to handle (if\
+                any). If it moves the slider that has focus, that slider is\
+                left alone so that the moves from a held down key are still\
+                coalesced
+        """
+        # type: (Any, Optional[Any]) -> None
+        dispatcher = getattr(window, _WINDOW_ATTRIBUTE, None)
+        if dispatcher is not None:
+            dispatcher._flush(action)
+
+    def add(self, control_id, increase, decrease, flush):
+        """:param control_id: the ID of the control that has focus when the\
+                slider is selected
+        :param increase: called when the slider should be increased. Returns\
+                True if an update was left waiting
+        :param decrease: called when the slider should be decreased. Returns\
+                True if an update was left waiting
+        :param flush: called to carry out any updates that are waiting
+        """
+        # type: (int, Callable[[], bool], Callable[[], bool], Callable[[], Any]) -> None
+        self._sliders[control_id] = (increase, decrease, flush)
+
+    def remove(self, control_id):
+        # type: (int) -> None
+        self._sliders.pop(control_id, None)
+        self._pending.discard(control_id)
+
+    def _get_focus_id(self):
+        """:returns: the ID of the control that has focus, or None if nothing\
+                has focus
+        """
+        # type: () -> Optional[int]
+        try:
+            return self._window.getFocusId()
+        except RuntimeError:
+            return None
+
+    def _move_focussed_slider(self, move_index):
+        """Move the slider that has focus (if any) and remember whether it\
+        has an update waiting
+
+        :param move_index: 0 to increase the slider or 1 to decrease it
+        """
+        # type: (int) -> None
+        control_id = self._get_focus_id()
+        slider = self._sliders.get(control_id)
+        if slider is not None and slider[move_index]():
+            self._pending.add(control_id)
+
+    def _flush(self, action):
+        # type: (Optional[Any]) -> None
+        if not self._pending:
+            return
+        skipped_control_id = None
+        if action is not None and action.getId() in _MOVE_ACTIONS:
+            skipped_control_id = self._get_focus_id()
+        pending = self._pending
+        self._pending = set()
+        for control_id in pending:
+            if control_id == skipped_control_id:
+                self._pending.add(control_id)
+            else:
+                self._sliders[control_id][2]()
+
+    def _increase(self):
+        # type: () -> None
+        self._move_focussed_slider(0)
+
+    def _decrease(self):
+        # type: () -> None
+        self._move_focussed_slider(1)
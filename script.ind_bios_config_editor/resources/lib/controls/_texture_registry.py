@@ -0,0 +1,88 @@
+"""Resolves the textures used by controls and keeps track of which textures
+each window uses
+
+Texture memory is the scarcest resource on XBMC4Xbox. XBMC shares a loaded
+texture between every control that uses the same path, so each path is only
+resolved (and checked to exist) once and the same path string is handed to
+every control that uses it.
+"""
+import os
+
+import xbmc
+
+from ..addon_info import get_media_filename
+
+try:
+    # typing not available on XBMC4Xbox
+    from typing import Any, Dict, FrozenSet, Set
+except:
+    pass
+
+# Maps each media filename to its full path
+_MEDIA_TEXTURES = {}  # type: Dict[str, str]
+# Full paths that have already been checked to exist
+_CHECKED_TEXTURES = {}  # type: Dict[str, str]
+
+# Name of the attribute that the textures used by a window are stored in
+_WINDOW_ATTRIBUTE = "_textures_used"
+
+
+def get_texture(filename, full_path=False):
+    """:param filename: the name of a file in resources/media, or the full\
+            path of a texture if full_path is True
+    :returns: the full path of the texture. The same string is returned\
+            every time that the same texture is asked for.
+    """
+    # type: (str, bool) -> str
+    if full_path:
+        texture = _CHECKED_TEXTURES.get(filename)
+        if texture is None:
+            texture = _check_texture(filename)
+        return texture
+
+    texture = _MEDIA_TEXTURES.get(filename)
+    if texture is None:
+        texture = _check_texture(get_media_filename(filename))
+        _MEDIA_TEXTURES[filename] = texture
+    return texture
+
+
+def _check_texture(texture):
+    """Log a warning if the texture doesn't exist. XBMC would just show
+    nothing.
+
+    :returns: the path that will be used for texture from now on
+    """
+    # type: (str) -> str
+    if not os.path.isfile(texture):
+        xbmc.log("Texture not found: " + texture, xbmc.LOGWARNING)
+    return _CHECKED_TEXTURES.setdefault(texture, texture)
+
+
+def record_texture_used(window, texture):
+    """Record that a control using texture has been placed in window
+
+    :param texture: the full path of the texture (see get_texture)
+    """
+    # type: (Any, str) -> None
+    textures = getattr(window, _WINDOW_ATTRIBUTE, None)
+    if textures is None:
+        textures = set()  # type: Set[str]
+        setattr(window, _WINDOW_ATTRIBUTE, textures)
+    textures.add(texture)
+
+
+def get_textures_used(window):
+    """:returns: the full path of every texture used by the controls that\
+            have been placed in window
+    """
+    # type: (Any) -> FrozenSet[str]
+    return frozenset(getattr(window, _WINDOW_ATTRIBUTE, ()))
+
+
+def count_textures_used(window):
+    """:returns: the number of distinct textures used by the controls that\
+            have been placed in window
+    """
+    # type: (Any) -> int
+    return len(getattr(window, _WINDOW_ATTRIBUTE, ()))
@@ -0,0 +1,105 @@
+"""Collapses bursts of requests to update a control (e.g. from a held down
+key) into at most one update per frame
+"""
+import threading
+import time
+
+try:
+    # typing not available on XBMC4Xbox
+    from typing import Any, Callable, Optional
+except:
+    pass
+
+# Roughly one frame at 30fps
+_FRAME_INTERVAL = 1.0 / 30
+
+
+def _schedule(delay, callback):
+    """Call callback once, after delay seconds, on a timer thread"""
+    # type: (float, Callable[[], Any]) -> None
+    timer = threading.Timer(delay, callback)
+    # Don't keep the addon running just to carry out an update
+    timer.daemon = True
+    timer.start()
+
+
+class UpdateCoalescer(object):
+    """Calls update at most once per interval, no matter how often an update
+    is requested
+
+    The first request after a quiet period is carried out straight away.
+    Requests that arrive too soon after an update are left waiting until the
+    interval has passed, when a one-off flush is scheduled to carry them out
+    (so the last move from a held down key lands once the key is released),
+    or until :flush: is called. The scheduled flush runs on a timer thread,
+    so a lock makes sure that only one update happens at a time. Windows
+    still flush their controls before handling any other action or click
+    (see\
+    :resources.lib.controls._slider_dispatcher.SliderDispatcher.flush_window:)
+    so that they never see a stale value.
+    """
+
+    def __init__(
+        self, update, interval=_FRAME_INTERVAL, clock=time.time, schedule=_schedule
+    ):
+        """:param update: called with no arguments to carry out the update
+        :param interval: the minimum time between updates, in seconds
+        :param clock: returns the current time in seconds
+        :param schedule: called with a delay in seconds and a function that\
+                should be called once after that delay
+        """
+        # type: (Callable[[], Any], float, Callable[[], float], Callable[[float, Callable[[], Any]], Any]) -> None
+        self._update = update
+        self._interval = interval
+        self._clock = clock
+        self._schedule = schedule
+        # Reentrant as update may set the control's value, which cancels
+        self._lock = threading.RLock()
+        self._pending = False
+        self._flush_scheduled = False
+        self._last_update_time = None  # type: Optional[float]
+
+    def request(self):
+        """Ask for an update. It happens now, or is left waiting if the last
+        update was too recent
+        """
+        # type: () -> None
+        with self._lock:
+            self._pending = True
+            if self._last_update_time is None:
+                self.flush()
+                return
+            remaining = self._interval - (self._clock() - self._last_update_time)
+            if remaining <= 0:
+                self.flush()
+            elif not self._flush_scheduled:
+                self._flush_scheduled = True
+                self._schedule(remaining, self._scheduled_flush)
+
+    def _scheduled_flush(self):
+        """Carry out the update that was left waiting by :request:"""
+        # type: () -> None
+        with self._lock:
+            self._flush_scheduled = False
+            self.flush()
+
+    def is_pending(self):
+        """:returns: True if an update has been requested but not carried out"""
+        # type: () -> bool
+        return self._pending
+
+    def flush(self):
+        """Carry out any requested update now"""
+        # type: () -> None
+        with self._lock:
+            if not self._pending:
+                return
+            self._pending = False
+            self._last_update_time = self._clock()
+            self._update()
+
+    def cancel(self):
+        """Forget any requested update that hasn't happened yet"""
+        # type: () -> None
+        with self._lock:
+            self._pending = False
@@ -28,3 +28,16 @@ class AbstractControl(object):
     def get_value(self):
         # type: () -> Any
         pass
+
+    def set_value_if_changed(self, value, trigger_callback=True):
+        """Set the current value, unless the control already has that value
+        (saves redrawing it)
+
+        :param trigger_callback: trigger callback connected to this control
+        :returns: True if the value was changed
+        """
+        # type: (Any, bool) -> bool
+        if self.get_value() == value:
+            return False
+        self.set_value(value, trigger_callback=trigger_callback)
+        return True
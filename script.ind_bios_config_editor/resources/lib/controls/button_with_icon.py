@@ -1,17 +1,15 @@
 """Button with an icon and text"""
-import os
 
 try:
     # typing not available on XBMC4Xbox
-    from typing import Any, Callable, Union
+    from typing import Any, Callable, Optional, Union
 except:
     pass
 
 import pyxbmct
-import xbmcaddon
 
-_addon = xbmcaddon.Addon()
-_addon_path = _addon.getAddonInfo("path")
+from ._layout import measure
+from ._texture_registry import get_texture, record_texture_used
 
 
 class ButtonWithIcon(pyxbmct.Group):
@@ -57,10 +55,11 @@ class ButtonWithIcon(pyxbmct.Group):
             set_icon_colour_diffuse_on_set_enabled
         )
 
+        # None if given an image, whoever created it is responsible for it
+        self._icon_texture = None  # type: Optional[str]
         if isinstance(icon, basestring):
-            if not icon_full_path:
-                icon = os.path.join(_addon_path, "resources", "media", icon)
-            self._icon = pyxbmct.Image(icon, aspectRatio=2)
+            self._icon_texture = get_texture(icon, icon_full_path)
+            self._icon = pyxbmct.Image(self._icon_texture, aspectRatio=2)
         else:
             self._icon = icon  # type: pyxbmct.Image
 
@@ -81,18 +80,17 @@ class ButtonWithIcon(pyxbmct.Group):
     def _icon_placed(self, window, row, column, rowspan, columnspan, pad_x, pad_y):
         """Called after the icon has been placed in a window"""
         # type: (Any, int, int, int, int, int, int) -> None
-        icon_width = self._icon.getWidth()
-        # Using the min of getWidth and getHeight as the image is square and
+        placement = (row, column, rowspan, columnspan)
+        _, icon_y, icon_width, icon_height = measure(window, self._icon, placement)
+        # Using the min of the width and height as the image is square and
         # this gives the width of the actual image, rather than the width of the
         # image object which may be very wide
-        icon_side = min(icon_width, self._icon.getHeight())
+        icon_side = min(icon_width, icon_height)
 
-        button_x, _ = self._button.getPosition()
-        button_width = self._button.getWidth()
+        button_x, _, button_width, _ = measure(window, self._button, placement)
 
         new_icon_x = button_x + button_width - ((icon_side + icon_width) / 2 + pad_x)
 
-        _, icon_y = self._icon.getPosition()
         self._icon.setPosition(new_icon_x, icon_y)
 
     def setEnabled(self, enabled):
@@ -121,6 +119,8 @@ class ButtonWithIcon(pyxbmct.Group):
         Called once the button has been placed
         """
         super(ButtonWithIcon, self)._placedCallback(window, *args, **kwargs)
+        if self._icon_texture is not None:
+            record_texture_used(window, self._icon_texture)
 
         self.placeControl(self._button, 0, 0, pad_x=0, pad_y=0, columnspan=2)
 
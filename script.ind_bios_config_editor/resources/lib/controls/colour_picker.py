@@ -2,17 +2,18 @@
 
 try:
     # typing not available on XBMC4Xbox
-    from typing import Any, Callable
+    from typing import Any, Callable, Union
 except:
     pass
 import pyxbmct
-import xbmc
 
+from ..configs.colour import argb_to_hex_colour, colour_to_argb
 from .abstract_control import AbstractControl
 from .button_with_icon import ButtonWithIcon
 from ._colour_square import _ColourSquare
 from .colour_picker_full import ColourPickerFull
-from .fake_slider import FakeSlider
+from ._slider_dispatcher import SliderDispatcher
+from ..tracing import traced
 
 # Note: this window is here and not in the Windows package as:
 # a) it only really needs to be used with this control
@@ -26,7 +27,7 @@ class _ColourPickerWindow(pyxbmct.AddonDialogWindow):
         cls,
         window_title="Choose Colour",
         alpha_selector=False,
-        current_colour="0xFFFFFFFF",
+        current_colour=0xFFFFFFFF,
         colour_chosen_callback=None,
     ):
         return super(_ColourPickerWindow, cls).__new__(cls)
@@ -35,17 +36,15 @@ class _ColourPickerWindow(pyxbmct.AddonDialogWindow):
         self,
         window_title="Choose Colour",
         alpha_selector=False,
-        current_colour="0xFFFFFFFF",
+        current_colour=0xFFFFFFFF,
         colour_chosen_callback=None,
     ):
         """:param alpha_selector: if True then you can also pick the colour's\
                 alpha component
-        :param current_colour: a hexadecimal colour string optionally\
-                prefixed with 0x. If alpha_selector is True then the first 2\
-                characters represent the alpha channel
+        :param current_colour: an int of the form 0xAARRGGBB
         """
 
-        # type: (str, bool, str, Callable) -> None
+        # type: (str, bool, int, Callable) -> None
         super(_ColourPickerWindow, self).__init__(window_title)
 
         num_rows = 5 if alpha_selector else 4
@@ -55,32 +54,95 @@ class _ColourPickerWindow(pyxbmct.AddonDialogWindow):
         self._current_colour = current_colour
         self._colour_chosen_callback = colour_chosen_callback
 
-        ok_button = ButtonWithIcon("OK", "done.png")
+        self._ok_button = ButtonWithIcon("OK", "done.png")
         cancel_button = ButtonWithIcon("Cancel", "close.png")
-        colour_picker_full = ColourPickerFull(alpha_selector, current_colour)
-        self.placeControl(colour_picker_full, 0, 0, columnspan=5, rowspan=num_rows - 1)
-        self.placeControl(ok_button, num_rows - 1, 0, columnspan=2)
+        self._colour_picker_full = ColourPickerFull(alpha_selector, current_colour)
+        self.placeControl(
+            self._colour_picker_full, 0, 0, columnspan=5, rowspan=num_rows - 1
+        )
+        self.placeControl(self._ok_button, num_rows - 1, 0, columnspan=2)
         self.placeControl(cancel_button, num_rows - 1, 3, columnspan=2)
 
         self.autoNavigation()
 
-        self.connect(ok_button, self._ok_button_pressed)
+        self.connect(self._ok_button, self._ok_button_pressed)
         self.connect(cancel_button, self.close)
-        self.connect(colour_picker_full, self._colour_changed)
+        self.connect(self._colour_picker_full, self._colour_changed)
         self.connect(pyxbmct.ACTION_NAV_BACK, self.close)
-        self.setFocus(ok_button)
+        self.setFocus(self._ok_button)
+
+    def pick_colour(self, window_title, current_colour, colour_chosen_callback):
+        """Reset the window and show it, so that it can be reused rather than
+        building a new one each time a colour is picked
+
+        :param current_colour: an int of the form 0xAARRGGBB
+        :param colour_chosen_callback: called with the colour if OK is pressed
+        """
+        # type: (str, int, Callable) -> None
+        self.setWindowTitle(window_title)
+        self._current_colour = current_colour
+        self._colour_chosen_callback = colour_chosen_callback
+        self._colour_picker_full.set_value(current_colour, trigger_callback=False)
+        self.setFocus(self._ok_button)
+        try:
+            self.doModal()
+        finally:
+            # Otherwise the control that opened the window (and the window
+            # that it is in) would be kept alive by this one
+            self._colour_chosen_callback = None
+
+    def onAction(self, action):
+        """Override of the xbmcgui method (hence the camelCase) so that any
+        slider updates that are waiting are carried out first
+        """
+        SliderDispatcher.flush_window(self, action)
+        super(_ColourPickerWindow, self).onAction(action)
+
+    def onControl(self, control):
+        """Override of the xbmcgui method (hence the camelCase) so that any
+        slider updates that are waiting are carried out first
+        """
+        SliderDispatcher.flush_window(self)
+        super(_ColourPickerWindow, self).onControl(control)
 
     def _colour_changed(self, colour):
-        # type: (str) -> None
+        # type: (int) -> None
         self._current_colour = colour
 
     def _ok_button_pressed(self):
         # type: () -> None
+        SliderDispatcher.flush_window(self)
         if self._colour_chosen_callback:
             self._colour_chosen_callback(self._current_colour)
         self.close()
 
 
+# Building a colour picker window is slow so there is one for colours with an
+# alpha channel and one for those without, each created when it is first needed
+_COLOUR_PICKER_WINDOWS = {}
+
+
+def _get_colour_picker_window(alpha_selector):
+    # type: (bool) -> _ColourPickerWindow
+    window = _COLOUR_PICKER_WINDOWS.get(alpha_selector)
+    if window is None:
+        window = _ColourPickerWindow(alpha_selector=alpha_selector)
+        _COLOUR_PICKER_WINDOWS[alpha_selector] = window
+    return window
+
+
+def close_colour_picker_windows():
+    """Destroy the colour picker windows that are kept for reuse. Must be
+    called once they are no longer needed (e.g. when the window containing
+    the colour pickers is closed) as the underlying xbmcgui classes are not
+    garbage collected on exit. They are created again if they are needed.
+    """
+    # type: () -> None
+    while _COLOUR_PICKER_WINDOWS:
+        _, window = _COLOUR_PICKER_WINDOWS.popitem()
+        del window
+
+
 class ColourPicker(AbstractControl, ButtonWithIcon):
     """Colour picker button that displays the Current colour and opens a
     colour picker window when clicked
@@ -90,7 +152,7 @@ class ColourPicker(AbstractControl, ButtonWithIcon):
         cls,
         window_title="Choose Colour",
         alpha_selector=False,
-        default_colour="0xFFFFFFFF",
+        default_colour=0xFFFFFFFF,
         *args,
         **kwargs
     ):
@@ -100,24 +162,24 @@ class ColourPicker(AbstractControl, ButtonWithIcon):
         self,
         window_title="Choose Colour",
         alpha_selector=False,
-        default_colour="0xFFFFFFFF",
+        default_colour=0xFFFFFFFF,
         *args,
         **kwargs
     ):
         """:param alpha_selector: if True then you can also pick the colour's\
                 alpha component
-        :param default_colour: a hexadecimal colour string optionally\
-                prefixed with 0x. If alpha_selector is True then the first 2\
-                characters represent the alpha channel
+        :param default_colour: an int of the form 0xAARRGGBB or a\
+                hexadecimal colour string optionally prefixed with 0x. If\
+                alpha_selector is False then the colour is made fully opaque
         """
-        # type: (str, bool, str, Any, Any) -> None
+        # type: (str, bool, Union[int, str], Any, Any) -> None
 
         self._alpha_selector = alpha_selector
-        self._current_colour = self._get_colour_in_correct_format(default_colour)
+        self._current_colour = colour_to_argb(default_colour, alpha_selector)
 
         colour_square = _ColourSquare(self._current_colour)
         super(ColourPicker, self).__init__(
-            self._current_colour,
+            argb_to_hex_colour(self._current_colour, alpha_selector),
             colour_square,
             set_icon_colour_diffuse_on_set_enabled=False,
             *args,
@@ -127,61 +189,36 @@ class ColourPicker(AbstractControl, ButtonWithIcon):
         self._window_title = window_title
         self._colour_chosen_callback = None
 
-    def _get_colour_in_correct_format(self, colour):
-        """Cut out alpha component if it shouldn't be there"""
-        # type: (str) -> str
-        if not self._alpha_selector:
-            if colour[0:2] == "0x":
-                if len(colour) == 10:
-                    colour = colour[0:2] + colour[4:]
-            else:
-                if len(colour) == 8:
-                    colour = colour[2:]
-
-        return colour
-
+    @traced("ColourPicker.set_value")
     def set_value(self, colour, trigger_callback=True):
-        """:param colour: is a hexadecimal colour string\
-                e.g. 0xFFFFFF or 000000 or FFFFFFFF if you have an alpha\
-                channel
+        """:param colour: an int of the form 0xAARRGGBB or a hexadecimal\
+                colour string e.g. 0xFFFFFF or 000000 or FFFFFFFF if you have\
+                an alpha channel. If there is no alpha channel then the\
+                colour is made fully opaque
         :param trigger_callback: if False then the colour chosen callback\
                 will not be triggered
         """
-        # type (str, bool) -> None
-
-        import xbmc
-
-        xbmc.log("set value: " + colour, 2)
-        colour = self._get_colour_in_correct_format(colour)
+        # type (Union[int, str], bool) -> None
+        colour = colour_to_argb(colour, self._alpha_selector)
         self._current_colour = colour
 
-        self._button.setLabel(colour)
+        self._button.setLabel(argb_to_hex_colour(colour, self._alpha_selector))
         self._icon.setColorDiffuse(colour)
 
         if trigger_callback and self._colour_chosen_callback is not None:
             self._colour_chosen_callback(colour)
 
     def get_value(self):
-        """:returns: a hexadecimal colour string\
-                e.g. 0xFFFFFF or 000000 or FFFFFFFF if you have an alpha\
-                channel
-        """
-        # type: () -> str
+        """:returns: the colour as an int of the form 0xAARRGGBB"""
+        # type: () -> int
         return self._current_colour
 
     def pick_colour(self):
         """Open the colour picker window so you can pick a new colour"""
         # type: () -> None
-        colour_picker = _ColourPickerWindow(
-            self._window_title,
-            self._alpha_selector,
-            self._current_colour,
-            self.set_value,
+        _get_colour_picker_window(self._alpha_selector).pick_colour(
+            self._window_title, self._current_colour, self.set_value
         )
-        colour_picker.doModal()
-        # Destroy the instance explicitly because
-        # underlying xbmcgui classes are not garbage-collected on exit.
-        del colour_picker
 
     def _connectCallback(self, callback, window):
         # type: (Callable, Any) ->  bool
@@ -1,32 +1,32 @@
 try:
     # typing is not available on XBMC4Xbox
-    from typing import Any, Callable
+    from typing import Any, Callable, Union
 except:
     pass
 import pyxbmct
+from ..configs.colour import colour_to_argb
 from .fake_slider import FakeSlider
 from ._colour_square import _ColourSquare
 from .abstract_control import AbstractControl
+from ..tracing import traced
 
 
 class ColourPickerFull(AbstractControl, pyxbmct.Group):
     """Full colour picker control with sliders and colour display"""
 
-    def __new__(
-        cls, alpha_selector=False, default_colour="0xFFFFFFFF", *args, **kwargs
-    ):
+    def __new__(cls, alpha_selector=False, default_colour=0xFFFFFFFF, *args, **kwargs):
         return super(ColourPickerFull, cls).__new__(cls, 1, 2, *args, **kwargs)
 
     def __init__(
-        self, alpha_selector=False, default_colour="0xFFFFFFFF", *args, **kwargs
+        self, alpha_selector=False, default_colour=0xFFFFFFFF, *args, **kwargs
     ):
         """:param alpha_selector: if True then you can also pick the colour's\
                 alpha component
-        :param default_colour: a hexadecimal colour string optionally\
-                prefixed with 0x. If alpha_selector is True then the first 2\
-                characters represent the alpha channel
+        :param default_colour: an int of the form 0xAARRGGBB or a\
+                hexadecimal colour string optionally prefixed with 0x. If\
+                alpha_selector is False then the colour is made fully opaque
         """
-        # type: (bool, str, Any, Any) -> None
+        # type: (bool, Union[int, str], Any, Any) -> None
         num_rows = 3
 
         if alpha_selector:
@@ -36,20 +36,10 @@ class ColourPickerFull(AbstractControl, pyxbmct.Group):
 
         self._num_rows = num_rows
         self._alpha_selector = alpha_selector
-        self._current_colour = self._get_colour_in_correct_format(default_colour)
+        self._current_colour = colour_to_argb(default_colour, alpha_selector)
         self._colour_changed_callback = None
-
-    def _get_colour_in_correct_format(self, colour):
-        """Remove alpha component if it shouldn't be there"""
-        # type: (str) -> str
-        if not self._alpha_selector:
-            if colour[0:2] == "0x":
-                if len(colour) == 10:
-                    colour = colour[0:2] + colour[4:]
-            elif len(colour) == 8:
-                colour = colour[2:]
-
-        return colour
+        # (shift, slider) for each component of the colour, once placed
+        self._sliders = []
 
     def _connectCallback(self, callback, window):
         # type: (Callable, Any) -> bool
@@ -64,68 +54,54 @@ class ColourPickerFull(AbstractControl, pyxbmct.Group):
             self._colour_square, 0, 5, rowspan=self._num_rows, columnspan=2
         )
 
-        button_labels = ["Red", "Green", "Blue"]
+        # The label for each component and how far it is shifted in the colour
+        components = [("Red", 16), ("Green", 8), ("Blue", 0)]
         if self._alpha_selector:
-            button_labels.insert(0, "Alpha")
-        modify_colour_position = 2 if self._current_colour[0:2] == "0x" else 0
+            components.insert(0, ("Alpha", 24))
 
-        for i, label_text in enumerate(button_labels):
+        for i, (label_text, shift) in enumerate(components):
             label_control = pyxbmct.Label(label_text)
             self.placeControl(label_control, i, 0)
-            initial_value = int(
-                self._current_colour[
-                    modify_colour_position : modify_colour_position + 2
-                ],
-                16,
-            )
-            callback = lambda value, pos=modify_colour_position: self._modify_colour(
-                pos, value
-            )
+            initial_value = (self._current_colour >> shift) & 0xFF
+            callback = lambda value, shift=shift: self._modify_colour(shift, value)
             slider = FakeSlider(default_value=initial_value, keyboard_title=label_text)
             window.connect(slider, callback)
             self.placeControl(slider, i, 1, columnspan=4, pad_y=10)
-            modify_colour_position += 2
+            self._sliders.append((shift, slider))
 
+    @traced("ColourPickerFull.set_value")
     def set_value(self, colour, trigger_callback=True):
-        """:param colour: is a hexadecimal colour string\
-                e.g. 0xFFFFFF or 000000 or FFFFFFFF if you have an alpha\
-                channel
+        """:param colour: an int of the form 0xAARRGGBB or a hexadecimal\
+                colour string e.g. 0xFFFFFF or 000000 or FFFFFFFF if you have\
+                an alpha channel. If there is no alpha channel then the\
+                colour is made fully opaque
         :param trigger_callback: if False then the colour chosen callback\
                 will not be triggered
         """
-        colour = self._get_colour_in_correct_format(colour)
-        # type (str, bool) -> None
-
-        # The way colours are modified when using sliders depends on whether
-        # the colour starts with 0x or not
-        if self._current_colour.startswith("0x") and not colour.startswith("0x"):
-            colour = "0x" + colour
-        elif not self._current_colour.startswith("0x") and colour.startswith("0x"):
-            colour = colour[2:]
-
+        # type (Union[int, str], bool) -> None
+        colour = colour_to_argb(colour, self._alpha_selector)
         self._current_colour = colour
-        self._colour_square.setColorDiffuse(self._current_colour)
+        self._colour_square.setColorDiffuse(colour)
+        # Only the sliders that don't already match need to be moved
+        for shift, slider in self._sliders:
+            slider.set_value_if_changed(
+                (colour >> shift) & 0xFF, trigger_callback=False
+            )
 
         if trigger_callback and self._colour_changed_callback:
             self._colour_changed_callback(colour)
 
     def get_value(self):
-        """:returns: a hexadecimal colour string\
-                e.g. 0xFFFFFF or 000000 or FFFFFFFF if you have an alpha\
-                channel
-        """
-        # type: () -> str
+        """:returns: the colour as an int of the form 0xAARRGGBB"""
+        # type: () -> int
         return self._current_colour
 
-    def _modify_colour(self, position, value):
-        """Modify the current colour, change the 2 characters at the given
-        position
+    def _modify_colour(self, shift, value):
+        """Modify one component of the current colour e.g. the red component
 
-        Used to change e.g. the red component of the colour
+        :param shift: how far the component is shifted in the colour e.g. 16\
+                for red
+        :param value: the new value of the component (0-255)
         """
-        colour = (
-            self._current_colour[:position]
-            + "{:02X}".format(value)
-            + self._current_colour[position + 2 :]
-        )
-        self.set_value(colour)
+        # type: (int, int) -> None
+        self.set_value((self._current_colour & ~(0xFF << shift)) | (value << shift))
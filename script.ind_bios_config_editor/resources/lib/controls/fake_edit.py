@@ -8,6 +8,7 @@ import xbmc
 import xbmcgui
 from .button_with_icon import ButtonWithIcon
 from .abstract_control import AbstractControl
+from ..tracing import traced
 
 
 class FakeEdit(AbstractControl, ButtonWithIcon):
@@ -57,6 +58,7 @@ class FakeEdit(AbstractControl, ButtonWithIcon):
         # type: () -> str
         return self._current_value
 
+    @traced("FakeEdit.set_value")
     def set_value(self, value, trigger_callback=True):
         """set the entered text
         :param trigger_callback: if False then the whatever callback is\
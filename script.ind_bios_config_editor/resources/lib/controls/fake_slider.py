@@ -6,7 +6,22 @@ except:
 import pyxbmct
 import xbmcgui
 import os
+import time
 from .abstract_control import AbstractControl
+from ._layout import measure
+from ._slider_dispatcher import SliderDispatcher
+from ._texture_registry import get_texture, record_texture_used
+from ._update_coalescer import UpdateCoalescer
+from ..tracing import traced
+
+# Moves closer together than this (in seconds) are from a key being held down
+_KEY_REPEAT_INTERVAL = 0.25
+# The step doubles after this many repeated moves...
+_REPEATS_PER_ACCELERATION = 4
+# ...up to this many times the normal step
+_MAX_ACCELERATION = 8
+# But a single move never covers more than this fraction of the range
+_MIN_MOVES_ACROSS_RANGE = 16
 
 
 class FakeSlider(AbstractControl, pyxbmct.Group):
@@ -81,20 +96,23 @@ class FakeSlider(AbstractControl, pyxbmct.Group):
         if default_value < min_value:
             raise ValueError("default_value must be >= min_value")
 
-        self._outline_texture = (
+        self._outline_texture = get_texture(
             outline_texture
             if outline_texture
-            else os.path.join(pyxbmct.skin.images, "Slider", "osd_slider_bg.png")
+            else os.path.join(pyxbmct.skin.images, "Slider", "osd_slider_bg.png"),
+            full_path=True,
         )
-        self._nib_texture_not_focussed = (
+        self._nib_texture_not_focussed = get_texture(
             nib_texture_not_focussed
             if nib_texture_not_focussed
-            else os.path.join(pyxbmct.skin.images, "Slider", "osd_slider_nibNF.png")
+            else os.path.join(pyxbmct.skin.images, "Slider", "osd_slider_nibNF.png"),
+            full_path=True,
         )
-        self._nib_texture_focussed = (
+        self._nib_texture_focussed = get_texture(
             nib_texture_focussed
             if nib_texture_focussed
-            else os.path.join(pyxbmct.skin.images, "Slider", "osd_slider_nib.png")
+            else os.path.join(pyxbmct.skin.images, "Slider", "osd_slider_nib.png"),
+            full_path=True,
         )
 
         # if xbmc.getInfoLabel('System.BuildVersion')[:2] >= '17':
@@ -113,38 +131,112 @@ class FakeSlider(AbstractControl, pyxbmct.Group):
         self._value_label_width = value_label_width
         self._total_width = total_width
 
+        # Holding down a key moves the slider many times a second, but the
+        # nib, label and callback are only updated once per frame. A waiting
+        # update is carried out at the end of the frame, or before the window
+        # handles anything else (see :SliderDispatcher.flush_window:)
+        self._update_coalescer = UpdateCoalescer(self._moved)
+        self._max_acceleration = max(
+            1,
+            min(
+                _MAX_ACCELERATION,
+                (max_value - min_value) // (step * _MIN_MOVES_ACROSS_RANGE),
+            ),
+        )
+        self._last_move_time = None
+        self._last_move_increased = None
+        self._num_repeated_moves = 0
+
     def get_value(self):
         """:returns: the current value of the slider"""
         # type: () -> int
         return self._value
 
-    def _add_to_value_if_focussed(self, num_to_add):
-        # type: (int) -> None
-        if self._window.getFocus() == self._nib:
-            self.set_value(self._value + num_to_add)
+    def _get_acceleration(self, increase):
+        """:returns: how many steps to move by. This grows the longer that a\
+                key is held down
+        """
+        # type: (bool) -> int
+        now = time.time()
+        if (
+            increase == self._last_move_increased
+            and now - self._last_move_time < _KEY_REPEAT_INTERVAL
+        ):
+            self._num_repeated_moves += 1
+        else:
+            self._num_repeated_moves = 0
+        self._last_move_time = now
+        self._last_move_increased = increase
+        return min(
+            self._max_acceleration,
+            2 ** (self._num_repeated_moves // _REPEATS_PER_ACCELERATION),
+        )
+
+    def _add_to_value(self, num_to_add):
+        """:returns: True if the update for the move was left waiting"""
+        # type: (int) -> bool
+        value = self._clamp(
+            self._value + num_to_add * self._get_acceleration(num_to_add > 0)
+        )
+        if value != self._value:
+            self._value = value
+            self._update_coalescer.request()
+        return self._update_coalescer.is_pending()
 
-    def _increase_if_focussed(self):
-        """Increase current value by the step value if the slider is in focus"""
+    def _moved(self):
+        """Show the current value and let the callback know about it"""
         # type: () -> None
-        self._add_to_value_if_focussed(self._step)
+        self._show_value()
+        if self._value_changed_callback:
+            self._value_changed_callback(self._value)
 
-    def _decrease_if_focussed(self):
-        """Decrease the slider by the step value of it the slider is in focus"""
-        # type: () -> None
-        self._add_to_value_if_focussed(-self._step)
+    def _increase(self):
+        """Increase current value by the step value. Called by the window's\
+        :SliderDispatcher: when the slider is in focus
 
+        :returns: True if the update for the move was left waiting
+        """
+        # type: () -> bool
+        return self._add_to_value(self._step)
+
+    def _decrease(self):
+        """Decrease current value by the step value. Called by the window's\
+        :SliderDispatcher: when the slider is in focus
+
+        :returns: True if the update for the move was left waiting
+        """
+        # type: () -> bool
+        return self._add_to_value(-self._step)
+
+    @traced("FakeSlider.set_value")
     def set_value(self, value, trigger_callback=True):
         """Set the value of the slider
         :param trigger_callback: if False the whatever callback is connected\
                 to the slider won't be called
         """
         # type: (int, bool) -> None
+        # Any moves that haven't been shown yet are overridden
+        self._update_coalescer.cancel()
+        value = self._clamp(value)
+        self._value = value
+        self._show_value()
+
+        if trigger_callback and self._value_changed_callback:
+            self._value_changed_callback(value)
+
+    def _clamp(self, value):
+        """:returns: value limited to the range of the slider"""
+        # type: (int) -> int
         if value < self._min_value:
-            value = self._min_value
+            return self._min_value
         elif value > self._max_value:
-            value = self._max_value
+            return self._max_value
+        return value
 
-        self._value = value
+    def _show_value(self):
+        """Move the nib and update the label to match the current value"""
+        # type: () -> None
+        value = self._value
         nib_x = int(
             round(self._nib_min_x + (float(value - self._min_value) * self._nib_x_unit))
         )
@@ -154,9 +246,6 @@ class FakeSlider(AbstractControl, pyxbmct.Group):
         if self._show_value_label:
             self._value_label.setLabel(str(value))
 
-        if trigger_callback and self._value_changed_callback:
-            self._value_changed_callback(value)
-
     def _type_value(self):
         """Open a keyboard to allow the user to type in a value instead of\
                 using the slider
@@ -175,8 +264,11 @@ class FakeSlider(AbstractControl, pyxbmct.Group):
         self._value_changed_callback = callback
         return False  # Don't use PyXBMCt's built in callback mechanism
 
-    def _placedCallback(self, window, *args, **kwargs):
-        super(FakeSlider, self)._placedCallback(window, *args, **kwargs)
+    def _placedCallback(self, window, row, column, rowspan, columnspan, pad_x, pad_y):
+        # type: (Any, int, int, int, int, int, int) -> None
+        super(FakeSlider, self)._placedCallback(
+            window, row, column, rowspan, columnspan, pad_x, pad_y
+        )
 
         if self._show_value_label:
             slider_width = self._total_width - self._value_label_width
@@ -195,14 +287,12 @@ class FakeSlider(AbstractControl, pyxbmct.Group):
             slider_width = self._total_width
 
         self._window = window
+        x, y, total_width, height = measure(
+            window, self, (row, column, rowspan, columnspan)
+        )
         width = int(
-            round(
-                float(self.getWidth())
-                * (float(slider_width) / float(self._total_width))
-            )
+            round(float(total_width) * (float(slider_width) / float(self._total_width)))
         )
-        height = self.getHeight()
-        x, y = self.getPosition()
 
         nib_pad = 0
         nib_size = min(width, height) - (2 * nib_pad)
@@ -239,24 +329,23 @@ class FakeSlider(AbstractControl, pyxbmct.Group):
         # From this control to one on the left or right
         self._nib.controlLeft = lambda x: None
         self._nib.controlRight = lambda x: None
-        window.connectEventList(
-            [pyxbmct.ACTION_MOVE_RIGHT, pyxbmct.ACTION_MOUSE_WHEEL_UP],
-            self._increase_if_focussed,
-        )
-        window.connectEventList(
-            [pyxbmct.ACTION_MOVE_LEFT, pyxbmct.ACTION_MOUSE_WHEEL_DOWN],
-            self._decrease_if_focussed,
+        SliderDispatcher.for_window(window).add(
+            self._nib.getId(),
+            self._increase,
+            self._decrease,
+            self._update_coalescer.flush,
         )
 
         outline = pyxbmct.Image(self._outline_texture)
         self.placeControl(outline, 0, 0, columnspan=slider_width, pad_x=0, pad_y=0)
 
+        for texture in (
+            self._outline_texture,
+            self._nib_texture_not_focussed,
+            self._nib_texture_focussed,
+        ):
+            record_texture_used(window, texture)
+
     def _removedCallback(self, window):
-        window.disconnectEventList(
-            [pyxbmct.ACTION_MOVE_RIGHT, pyxbmct.ACTION_MOUSE_WHEEL_UP],
-            self._increase_if_focussed,
-        )
-        window.disconnectEventList(
-            [pyxbmct.ACTION_MOVE_LEFT, pyxbmct.ACTION_MOUSE_WHEEL_DOWN],
-            self._decrease_if_focussed,
-        )
+        self._update_coalescer.flush()
+        SliderDispatcher.for_window(window).remove(self._nib.getId())
@@ -9,6 +9,7 @@ import xbmcgui
 
 from .button_with_icon import ButtonWithIcon
 from .abstract_control import AbstractControl
+from ..tracing import traced
 
 
 def _get_icon_filename(browse_type, custom_icon):
@@ -101,6 +102,7 @@ class FileSelector(AbstractControl, ButtonWithIcon):
         # type: () -> str
         return self._current_selection
 
+    @traced("FileSelector.set_value")
     def set_value(self, file_path, trigger_callback=True):
         """Set the currently selected file
         :param trigger_callback: if False then whatever callback is connected\
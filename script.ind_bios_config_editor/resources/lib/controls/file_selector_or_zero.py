@@ -9,6 +9,7 @@ import pyxbmct
 
 from .file_selector import FileSelector
 from .abstract_control import AbstractControl
+from ..tracing import traced
 
 
 class FileSelectorOrZero(AbstractControl, pyxbmct.Group):
@@ -74,6 +75,7 @@ class FileSelectorOrZero(AbstractControl, pyxbmct.Group):
         # type: () -> str
         return self._file_selector.get_value()
 
+    @traced("FileSelectorOrZero.set_value")
     def set_value(self, file_path, trigger_callback=True):
         """Set the currently chosen file
         :param file_path: set to None if no file is to be chosen
@@ -1,17 +1,22 @@
 import pyxbmct
-import xbmcaddon
-import os
 
-_addon = xbmcaddon.Addon()
-_addon_path = _addon.getAddonInfo("path")
+from ._texture_registry import get_texture, record_texture_used
+
+_TEXTURE = "horizontal_rule.png"
 
 
 class HorizontalRule(pyxbmct.Image):
     def __new__(cls):
-        image_file = os.path.join(
-            _addon_path, "resources", "media", "horizontal_rule.png"
-        )
-        return super(HorizontalRule, cls).__new__(cls, image_file)
+        return super(HorizontalRule, cls).__new__(cls, get_texture(_TEXTURE))
 
     def __init__(self):
         super(HorizontalRule, self).setColorDiffuse("0x00000000")
+
+    def _placedCallback(self, window, *args, **kwargs):
+        """Called once the rule has been placed"""
+        record_texture_used(window, get_texture(_TEXTURE))
+        # pyxbmct.Image doesn't have a _placedCallback of its own, but a class
+        # between this one and it in the MRO might
+        placed_callback = getattr(super(HorizontalRule, self), "_placedCallback", None)
+        if placed_callback is not None:
+            placed_callback(window, *args, **kwargs)
@@ -7,9 +7,9 @@ except:
     pass
 
 import pyxbmct
-import xbmcaddon
 
 from .abstract_control import AbstractControl
+from ..tracing import traced
 
 
 class LedPattern(AbstractControl, pyxbmct.Group):
@@ -75,6 +75,7 @@ class LedPattern(AbstractControl, pyxbmct.Group):
         if self._pattern_changed_callback:
             self._pattern_changed_callback(self._pattern)
 
+    @traced("LedPattern.set_value")
     def set_value(self, pattern, trigger_callback=True):
         """Set the current LED pattern
         :param trigger_callback: if False then the callback attached to this\
@@ -10,6 +10,7 @@ except:
 
 import pyxbmct
 from .abstract_control import AbstractControl
+from ..tracing import traced
 
 
 class RadioButton(AbstractControl, pyxbmct.RadioButton):
@@ -24,6 +25,7 @@ class RadioButton(AbstractControl, pyxbmct.RadioButton):
         super(RadioButton, self).__init__(*args, **kwargs)
         self._value_set_callback = None
 
+    @traced("RadioButton.set_value")
     def set_value(self, value, trigger_callback=True):
         """Set the current value
         :param trigger_callback: if False then the callback attached to this\
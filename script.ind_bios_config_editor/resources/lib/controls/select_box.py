@@ -9,6 +9,7 @@ import xbmcgui
 
 from .button_with_icon import ButtonWithIcon
 from .abstract_control import AbstractControl
+from ..tracing import traced
 
 
 class SelectBox(AbstractControl, ButtonWithIcon):
@@ -43,6 +44,7 @@ class SelectBox(AbstractControl, ButtonWithIcon):
         # type: () -> str
         return self._button.getLabel()
 
+    @traced("SelectBox.set_value")
     def set_value(self, chosen_option, trigger_callback=True):
         """Set which option is currently chosen
         :param trigger_callback: if False then the callback that is attached\
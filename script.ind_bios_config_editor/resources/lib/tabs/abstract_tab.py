@@ -1,12 +1,36 @@
 from abc import ABCMeta, abstractmethod
+import os
+
 import pyxbmct
 from .. import controls
+from ..addon_info import get_profile_path
+from ..configs import PresetBrowser, PresetLibrary
+
+# Shared by every tab so that each preset only needs to be indexed once
+_PRESET_LIBRARIES = {}
+
+
+def _get_preset_library(config):
+    """:returns: the preset library for the class of config"""
+    config_class = type(config)
+    preset_library = _PRESET_LIBRARIES.get(config_class)
+    if preset_library is None:
+        preset_library = PresetLibrary(
+            os.path.join(
+                get_profile_path(), "presets_" + config_class.__name__ + ".json"
+            ),
+            config_class,
+        )
+        _PRESET_LIBRARIES[config_class] = preset_library
+    return preset_library
 
 
 class AbstractTab(pyxbmct.Group):
     __metaclass__ = ABCMeta
 
     NUM_ROWS = 10
+    # Every field in the tab, so that they can be reset without creating it
+    FIELDS = ()
 
     def __new__(cls, config, num_columns=4, default_columnspan=1):
         # Group.__new__ is not responsible for setting number of rows/columns
@@ -21,13 +45,48 @@ class AbstractTab(pyxbmct.Group):
         self._value_changed_callback = None
         self._value_converter = self._create_value_converter()
         self._last_preset_filename = None
+        self._preset_browser = None
+        self._placements = []
+
+    def get_placements(self):
+        """:returns: the type of every control placed in the tab and the row,\
+                column, rowspan, columnspan, pad_x and pad_y it was placed\
+                with, in the order that they were placed
+        """
+        return list(self._placements)
 
     def reset_to_default(self):
         defaults = self._config.defaults()
-        for field in self._fields:
-            value = defaults[field]
-            self._config.set(field, value)
-            self._set_control_value(field, value, False)
+        self.set_values(
+            {field: defaults[field] for field in self._fields}, notify_window=False
+        )
+
+    def set_values(self, values, notify_window=True):
+        """Set the values of many fields at once
+
+        The config is updated in one go (nothing is changed if any value is
+        invalid) and only the controls whose values have changed are redrawn.
+        The callbacks connected to the controls are not triggered.
+
+        :param values: maps fields in this tab to values in Python format
+        :param notify_window: tell the window about each field that changed
+        """
+        self._config.set_many(values)
+        self._update_controls(values, notify_window)
+
+    def _update_controls(self, fields, notify_window=True):
+        """Redraw the controls for fields whose values in the config have\
+        changed. The callbacks connected to the controls are not triggered.
+
+        :param notify_window: tell the window about each field that changed
+        """
+        for field in fields:
+            value = self._config.get(field)
+            changed = self._fields[field].set_value_if_changed(
+                value, trigger_callback=False
+            )
+            if changed and notify_window and self._value_changed_callback:
+                self._value_changed_callback(field, value)
 
     def _value_changed(self, field, value, control):
         if self._value_changed_callback:
@@ -46,20 +105,48 @@ class AbstractTab(pyxbmct.Group):
 
     def _update_last_preset_filename(self, last_preset_filename):
         self._last_preset_filename = last_preset_filename
-        if self._load_preset_button:
-            self._load_preset_button.set_value(last_preset_filename)
 
     def load_preset(self, filename):
         self._update_last_preset_filename(filename)
-        self._config.load_preset(filename, self._fields)
-        for field in self._fields:
-            self._set_control_value(field, self.config.get(field))
+        fields = tuple(self._fields)
+        # Only the fields in this tab are read from the preset
+        self._config.load_preset(filename, fields)
+        self._update_controls(fields)
 
     def save_preset(self, filename):
         self._update_last_preset_filename(filename)
         with open(filename, "w") as preset_file:
             self._config.write(preset_file)
 
+    def _get_preset_browser(self):
+        """:returns: lists the presets that can be loaded, with a preview of\
+                the colour fields in this tab
+        """
+        if self._preset_browser is None:
+            colour_fields = sorted(
+                field
+                for field, control in self._fields.iteritems()
+                if isinstance(control, controls.ColourPicker)
+            )
+            self._preset_browser = PresetBrowser(
+                _get_preset_library(self._config),
+                os.path.join(
+                    get_profile_path(), "swatches_" + type(self).__name__ + ".bin"
+                ),
+                colour_fields,
+            )
+        return self._preset_browser
+
+    def _load_preset_button_pressed(self):
+        # Windows imports tabs so this import is delayed until here to avoid circular import issues
+        from ..windows import PresetPicker
+
+        preset_picker = PresetPicker(
+            self._get_preset_browser(), self.load_preset, self._last_preset_filename
+        )
+        preset_picker.doModal()
+        del preset_picker
+
     def _save_preset_button_pressed(self):
         # Windows imports tabs so this import is delayed until here to avoid circular import issues
         from ..windows import SavePreset
@@ -79,22 +166,13 @@ class AbstractTab(pyxbmct.Group):
         )
 
     def _place_load_preset_button(self, row, column, columnspan=None, *args, **kwargs):
-        self._load_preset_button = controls.FileSelector(
-            default_filename="Load Preset",
-            update_label_on_select=False,
-            file_select_window_title="Load Preset",
-            icon_pad_x=7,
-            custom_icon="file_arrow_up.png",
+        load_preset_button = controls.ButtonWithIcon(
+            "Load Preset", "file_arrow_up.png", icon_pad_x=7
         )
         self.placeControl(
-            self._load_preset_button,
-            row,
-            column,
-            columnspan=columnspan,
-            *args,
-            **kwargs
+            load_preset_button, row, column, columnspan=columnspan, *args, **kwargs
         )
-        self._window.connect(self._load_preset_button, self.load_preset)
+        self._window.connect(load_preset_button, self._load_preset_button_pressed)
 
     def _place_save_preset_button(self, row, column, columnspan=None, *args, **kwargs):
         save_preset_button = controls.ButtonWithIcon(
@@ -106,7 +184,8 @@ class AbstractTab(pyxbmct.Group):
         self._window.connect(save_preset_button, self._save_preset_button_pressed)
 
     def _place_and_link(self, field, control, row, column, *args, **kwargs):
-
+        if field not in self.FIELDS:
+            raise ValueError(field + " is not in " + type(self).__name__ + ".FIELDS")
         self._fields[field] = control
 
         callback = lambda value=None: self._value_changed(field, value, control)
@@ -143,6 +222,9 @@ class AbstractTab(pyxbmct.Group):
     ):
         if columnspan == None:
             columnspan = self._default_columnspan
+        self._placements.append(
+            (type(control).__name__, row, column, rowspan, columnspan, pad_x, pad_y)
+        )
         super(AbstractTab, self).placeControl(
             control, row, column, rowspan, columnspan, pad_x, pad_y
         )
@@ -4,6 +4,8 @@ from .abstract_ind_bios_tab import AbstractIndBiosTab
 
 
 class Advanced(AbstractIndBiosTab):
+    FIELDS = ("USEALLMEMORY", "DISABLEDM", "MACADDR")
+
     def __init__(self, config):
         super(Advanced, self).__init__(config, 2)
 
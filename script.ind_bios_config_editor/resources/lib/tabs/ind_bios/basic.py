@@ -4,6 +4,16 @@ from .abstract_ind_bios_tab import AbstractIndBiosTab
 
 
 class Basic(AbstractIndBiosTab):
+    FIELDS = (
+        "IGRMODE",
+        "IGRLOADSDASH",
+        "AUTOLOADDVD",
+        "AVCHECK",
+        "RESETONEJECT",
+        "FANSPEED",
+        "LEDPATTERN",
+    )
+
     def __init__(self, config):
         super(Basic, self).__init__(config, 8, default_columnspan=2)
 
@@ -4,6 +4,8 @@ from .abstract_ind_bios_tab import AbstractIndBiosTab
 
 
 class BootSettings(AbstractIndBiosTab):
+    FIELDS = ("DASH1", "DASH2", "DASH3", "DEFAULTXBE", "INTRO", "USEXBX")
+
     def __init__(self, config):
         super(BootSettings, self).__init__(config, 10)
 
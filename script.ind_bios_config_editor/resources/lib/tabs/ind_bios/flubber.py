@@ -4,6 +4,33 @@ from .abstract_ind_bios_tab import AbstractIndBiosTab
 
 
 class Flubber(AbstractIndBiosTab):
+    FIELDS = (
+        "GLOWCOLOR",
+        "IOGLOWCOLOR",
+        "FOGON",
+        "FOG1COLOR",
+        "FOG2COLOR",
+        "SHOWFLUB",
+        "NOSOUND",
+        "480P",
+        "FASTANI",
+        "CAMERAVIEW",
+        "IFILTER",
+        "BLOBBGC",
+        "BLOBSDEAD",
+        "WIREFRAMEBLOB",
+        "BLOBTHROB",
+        "SLOWMOBLOB",
+        "SPIKEYBLOB",
+        "BLOBCOLOR",
+        "BLOBRADI",
+        "CUSTOMBLOB",
+        "NOFLUBBG",
+        "SCENECOLOR1",
+        "SCENECOLOR2",
+        "SCENECOLOR3",
+    )
+
     def __init__(self, config):
         super(Flubber, self).__init__(config, 6)
 
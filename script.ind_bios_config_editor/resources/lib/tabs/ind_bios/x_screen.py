@@ -4,6 +4,31 @@ from .abstract_ind_bios_tab import AbstractIndBiosTab
 
 
 class XScreen(AbstractIndBiosTab):
+    FIELDS = (
+        "BGCOLOR",
+        "NOLIGHTEN",
+        "SHOWXEN",
+        "XGLOWCOLOR",
+        "XINNERCOLOR",
+        "TMS",
+        "LIPCOLOR",
+        "LIPGLOW",
+        "XLIGHTCOLOR",
+        "XSKEWXLOGO",
+        "YSKEWXLOGO",
+        "CUSTOMX",
+        "IND3D",
+        "XBOXCOLOR",
+        "TEXTSCALE",
+        "CUSTOMTEXT",
+        "SHOWMSEN",
+        "MSLOGOTRANSEN",
+        "MSLOGOTRANSCOLOR",
+        "XSKEWLOGO",
+        "YSKEWLOGO",
+        "CUSTOMLOGO",
+    )
+
     def __init__(self, config):
         super(XScreen, self).__init__(config, 6)
 
@@ -0,0 +1,140 @@
+"""Records how long named parts of the addon (spans) take, so that it is
+possible to see where the time goes on a real Xbox
+
+The most recent spans are kept in a ring buffer, which can be dumped to the
+log (or anywhere else) with :dump:. Tracing is off until it is turned on with
+:set_enabled: (the addon does this if its tracing setting is on), and spans
+cost next to nothing whilst it is off.
+"""
+from collections import deque, namedtuple
+from functools import wraps
+from itertools import count
+import threading
+import time
+
+try:
+    # typing not available on XBMC4Xbox
+    from typing import Any, Callable, List, Optional
+except:
+    pass
+
+# How many spans are kept before the oldest are thrown away
+MAX_SPANS = 1000
+
+# :param depth: how many spans the span was nested inside
+Span = namedtuple("Span", ("name", "start", "duration", "depth"))
+
+# Each span is stored with the order that it started in, as time.time is too
+# coarse to tell apart spans that start close together
+_spans = deque(maxlen=MAX_SPANS)
+_order = count()
+_enabled = False
+# The nesting depth is kept per thread as slider updates that were left waiting
+# are carried out on a timer thread
+# (see :resources.lib.controls._update_coalescer.UpdateCoalescer:)
+_thread_state = threading.local()
+
+
+class span(object):
+    """Context manager that records how long its body takes to run e.g.
+
+    with span("AbstractConfig.read"):
+        ...
+    """
+
+    __slots__ = ("_name", "_start", "_depth", "_order")
+
+    def __init__(self, name):
+        # type: (str) -> None
+        self._name = name
+        self._start = None  # type: Optional[float]
+
+    def __enter__(self):
+        # type: () -> span
+        if _enabled:
+            self._depth = getattr(_thread_state, "depth", 0)
+            _thread_state.depth = self._depth + 1
+            self._order = next(_order)
+            self._start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Recorded even if the body raises an exception
+        if self._start is not None:
+            end = time.time()
+            _thread_state.depth = self._depth
+            _spans.append(
+                (
+                    self._order,
+                    Span(self._name, self._start, end - self._start, self._depth),
+                )
+            )
+            self._start = None
+        return False
+
+
+def traced(name):
+    """Decorator that records a span named name every time that the function
+    is called
+    """
+    # type: (str) -> Callable[[Callable], Callable]
+
+    def decorator(function):
+        @wraps(function)
+        def traced_function(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            with span(name):
+                return function(*args, **kwargs)
+
+        return traced_function
+
+    return decorator
+
+
+def set_enabled(enabled):
+    """Turn recording spans on or off. Spans that have already been recorded
+    are kept.
+    """
+    # type: (bool) -> None
+    global _enabled
+    _enabled = enabled
+
+
+def get_spans():
+    """:returns: the spans in the ring buffer, in the order that they started"""
+    # type: () -> List[Span]
+    return [recorded for _, recorded in sorted(_spans)]
+
+
+def clear():
+    """Throw away every span in the ring buffer"""
+    # type: () -> None
+    _spans.clear()
+
+
+def format_spans(spans=None):
+    """:param spans: the spans to format, defaults to every span in the ring\
+            buffer
+    :returns: a line of text for each span, indented by how deeply it is\
+            nested e.g. "  AbstractConfig.read: 12.3ms"
+    """
+    # type: (Optional[List[Span]]) -> List[str]
+    if spans is None:
+        spans = get_spans()
+    return [
+        "  " * recorded.depth
+        + recorded.name
+        + ": "
+        + "%.1fms" % (recorded.duration * 1000)
+        for recorded in spans
+    ]
+
+
+def dump(write):
+    """Pass every span in the ring buffer to write, one line at a time e.g.
+    dump(lambda line: xbmc.log(line, xbmc.LOGDEBUG))
+    """
+    # type: (Callable[[str], Any]) -> None
+    for line in format_spans():
+        write(line)
@@ -1,3 +1,22 @@
-"""A collection of windows that are useful when editing config files"""
+"""A collection of windows that are useful when editing config files
 
-from .save_preset import *
+Each window's module is only imported the first time that the window is used.
+"""
+
+try:
+    # typing not available on XBMC4Xbox
+    from typing import TYPE_CHECKING
+
+    if TYPE_CHECKING:
+        # The same imports that are made lazily below, so that static analysis
+        # (e.g. pytype) can see every name in the package
+        from .preset_picker import PresetPicker
+        from .save_preset import SavePreset
+except:
+    pass
+
+from .._lazy_module import make_module_lazy
+
+make_module_lazy(
+    __name__, {"PresetPicker": ".preset_picker", "SavePreset": ".save_preset"}
+)
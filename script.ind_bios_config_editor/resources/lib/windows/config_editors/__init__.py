@@ -1,4 +1,27 @@
-"""Windows used to edit config files"""
+"""Windows used to edit config files
 
-from .abstract_config_editor import *
-from .ind_bios import *
+Each editor's module (and the tabs that it uses) is only imported the first
+time that the editor is used.
+"""
+
+try:
+    # typing not available on XBMC4Xbox
+    from typing import TYPE_CHECKING
+
+    if TYPE_CHECKING:
+        # The same imports that are made lazily below, so that static analysis
+        # (e.g. pytype) can see every name in the package
+        from .abstract_config_editor import AbstractConfigEditor
+        from .ind_bios import IndBiosConfigEditor
+except:
+    pass
+
+from ..._lazy_module import make_module_lazy
+
+make_module_lazy(
+    __name__,
+    {
+        "AbstractConfigEditor": ".abstract_config_editor",
+        "IndBiosConfigEditor": ".ind_bios",
+    },
+)
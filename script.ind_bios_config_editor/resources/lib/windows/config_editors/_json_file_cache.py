@@ -0,0 +1,53 @@
+"""Base for caches that are stored in a JSON file in the addon's profile
+directory so that they last between sessions
+"""
+import json
+import os
+
+try:
+    # typing is not available on XBMC4Xbox
+    from typing import Any, Dict, Optional
+except:
+    pass
+
+
+class JSONFileCache(object):
+    """Entries stored under string keys in a JSON file
+
+    The file is only read the first time that it is needed. A missing or
+    corrupt file is treated as an empty cache, so the cached data must always
+    be possible to work out again.
+    """
+
+    def __init__(self, filename):
+        # type: (str) -> None
+        self._filename = filename
+        # Loaded the first time that it is needed
+        self._entries = None  # type: Optional[Dict[str, Any]]
+
+    def _get_entries(self):
+        # type: () -> Dict[str, Any]
+        if self._entries is None:
+            try:
+                with open(self._filename) as fp:
+                    self._entries = json.load(fp)
+            except (EnvironmentError, ValueError):
+                # Missing or corrupt, it will be rebuilt
+                self._entries = {}
+            if not isinstance(self._entries, dict):
+                self._entries = {}
+        return self._entries
+
+    def _set_entry(self, key, entry):
+        """Store entry under key and save it to the file"""
+        # type: (str, Any) -> None
+        self._get_entries()[key] = entry
+        try:
+            directory = os.path.dirname(self._filename)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+            with open(self._filename, "w") as fp:
+                json.dump(self._entries, fp)
+        except EnvironmentError:
+            # It will just be worked out again next time
+            pass
@@ -0,0 +1,47 @@
+"""Cache of the geometry of the controls in each tab so that it only needs to
+be measured once for each tab layout, screen resolution and skin
+"""
+try:
+    # typing is not available on XBMC4Xbox
+    from typing import Any, List, Optional, Tuple
+except:
+    pass
+
+from ._json_file_cache import JSONFileCache
+
+
+class LayoutCache(JSONFileCache):
+    """Layouts stored in a JSON file
+
+    Each layout is a list of (identity, rectangle) pairs, in the order that
+    they were measured in, where the identity is the type of the control and
+    where it was placed and the rectangle is (x, y, width, height) (see\
+    :resources.lib.controls._layout:).
+    """
+
+    def get(self, key):
+        """:returns: the measurements in the layout stored under key or None\
+                if there isn't one
+        """
+        # type: (str) -> Optional[List[Tuple[Tuple[Any, ...], Tuple[int, int, int, int]]]]
+        layout = self._get_entries().get(key)
+        if not isinstance(layout, list):
+            return None
+        try:
+            return [
+                (
+                    (str(identity[0]),) + tuple(int(part) for part in identity[1:]),
+                    (int(x), int(y), int(width), int(height)),
+                )
+                for identity, (x, y, width, height) in layout
+            ]
+        except (IndexError, TypeError, ValueError):
+            return None
+
+    def set(self, key, measurements):
+        """Store a layout under key and save it to the file"""
+        # type: (str, List[Tuple[Tuple[Any, ...], Tuple[int, int, int, int]]]) -> None
+        self._set_entry(
+            key,
+            [[list(identity), list(rectangle)] for identity, rectangle in measurements],
+        )
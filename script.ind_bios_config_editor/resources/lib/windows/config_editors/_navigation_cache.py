@@ -0,0 +1,61 @@
+"""Cache of the navigation between the controls in each tab so that
+autoNavigation (which is slow) only needs to be run once for each tab layout
+"""
+try:
+    # typing is not available on XBMC4Xbox
+    from typing import Any, List, Optional, Tuple
+except:
+    pass
+
+from ._json_file_cache import JSONFileCache
+
+
+class NavigationCache(JSONFileCache):
+    """Navigation graphs stored in a JSON file
+
+    Each graph is a list of edges (source, method, target) where source and
+    target are the positions of controls in a list and method is the name of
+    the method used to set the navigation (e.g. "controlUp"). A graph is only
+    valid for the same number of controls, placed in the same places, as it was
+    recorded with.
+    """
+
+    def get(self, key, num_controls, placements):
+        """:param placements: describes where each control was placed e.g.\
+                :resources.lib.tabs.abstract_tab.AbstractTab.get_placements:
+        :returns: the edges in the graph stored under key or None if there\
+                isn't one for this number of controls and placements
+        """
+        # type: (str, int, List[Tuple[Any, ...]]) -> Optional[List[Tuple[int, str, int]]]
+        graph = self._get_entries().get(key)
+        if (
+            not isinstance(graph, dict)
+            or graph.get("num_controls") != num_controls
+            or graph.get("placements") != _placements_to_json(placements)
+        ):
+            return None
+        try:
+            return [
+                (source, str(method), target)
+                for source, method, target in graph["edges"]
+            ]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def set(self, key, num_controls, placements, edges):
+        """Store a graph under key and save it to the file"""
+        # type: (str, int, List[Tuple[Any, ...]], List[Tuple[int, str, int]]) -> None
+        self._set_entry(
+            key,
+            {
+                "num_controls": num_controls,
+                "placements": _placements_to_json(placements),
+                "edges": [list(edge) for edge in edges],
+            },
+        )
+
+
+def _placements_to_json(placements):
+    """:returns: placements as they are stored in (and read back from) JSON"""
+    # type: (List[Tuple[Any, ...]]) -> List[List[Any]]
+    return [list(placement) for placement in placements]
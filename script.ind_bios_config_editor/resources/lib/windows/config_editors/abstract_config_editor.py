@@ -2,22 +2,33 @@
 
 from collections import OrderedDict
 from abc import ABCMeta, abstractmethod
+import os
 
 try:
     # typing is not available on XBMC4Xbox
-    from typing import Any
+    from typing import Any, List, Tuple
 
     # For typing purposes only
     from ...configs import AbstractConfig
 except:
     pass
 
+import xbmc
 import xbmcgui
 import pyxbmct
 
 from ... import controls
+from ...addon_info import get_addon_info, get_profile_path
+from ...controls._layout import Layout, set_layout
+from ...controls._slider_dispatcher import SliderDispatcher
+from ...controls._texture_registry import count_textures_used
+from ...tracing import span, traced
+from ._layout_cache import LayoutCache
+from ._navigation_cache import NavigationCache
 from .reset_to_default import ResetToDefault
 
+_NAVIGATION_METHODS = ("controlUp", "controlDown", "controlLeft", "controlRight")
+
 
 class AbstractConfigEditor(pyxbmct.AddonDialogWindow):
     """Abstract config editor window. Contains common functionality"""
@@ -29,8 +40,12 @@ class AbstractConfigEditor(pyxbmct.AddonDialogWindow):
     def __new__(cls, config_filename, *args, **kwargs):
         return super(AbstractConfigEditor, cls).__new__(cls, *args, **kwargs)
 
+    @traced("AbstractConfigEditor.__init__")
     def __init__(self, config_filename, *args, **kwargs):
         # type: (str, Any, Any) -> None
+        # Every control added to the window, in order (see addControl). Set
+        # first as the parent class adds some controls itself
+        self._controls = []  # type: List[Any]
         super(AbstractConfigEditor, self).__init__(self._get_window_title())
 
         self._config_filename = config_filename
@@ -42,18 +57,24 @@ class AbstractConfigEditor(pyxbmct.AddonDialogWindow):
         self.NUM_ROWS += 2
         self.NUM_COLUMNS = 1
         self._config = self._create_config()
-        self._config.read(config_filename)
+        with span("AbstractConfigEditor.read_config"):
+            self._config.read(config_filename)
         self._unsaved_changes = False
 
         self._last_preset_filename = None
 
-        self.setGeometry(1200, 640, self.NUM_ROWS, self.NUM_COLUMNS)
-        self._create_tabs(form_config)
+        self._geometry = (1200, 640, self.NUM_ROWS, self.NUM_COLUMNS)
+        self.setGeometry(*self._geometry)
+        self._layout_cache = LayoutCache(self._get_layout_cache_filename())
+        with span("AbstractConfigEditor._create_tabs"):
+            self._create_tabs(form_config)
 
         self._create_menu_bar(self.NUM_ROWS - 1, self.NUM_COLUMNS)
+        # Everything but the tabs, which are created when they're needed
+        self._menu_controls = list(self._controls)
+        self._navigation_cache = NavigationCache(self._get_navigation_cache_filename())
 
-        self._initialise_navigation()
-        first_tab = self._tab_groups.keys()[0]
+        first_tab = form_config.keys()[0]
         self.setFocus(self._tab_menu_buttons[first_tab])
         self.switch_tab(first_tab)
 
@@ -74,8 +95,24 @@ class AbstractConfigEditor(pyxbmct.AddonDialogWindow):
         # type: () -> str
         pass
 
+    def onAction(self, action):
+        """Override of the xbmcgui method (hence the camelCase) so that any
+        slider updates that are waiting are carried out first
+        """
+        SliderDispatcher.flush_window(self, action)
+        super(AbstractConfigEditor, self).onAction(action)
+
+    def onControl(self, control):
+        """Override of the xbmcgui method (hence the camelCase) so that any
+        slider updates that are waiting are carried out first
+        """
+        SliderDispatcher.flush_window(self)
+        super(AbstractConfigEditor, self).onControl(control)
+
     def close(self):
         # type: () -> None
+        # So that the last slider move counts as an unsaved change
+        SliderDispatcher.flush_window(self)
         close = True
         if self._unsaved_changes:
             dialog = xbmcgui.Dialog()
@@ -88,12 +125,17 @@ class AbstractConfigEditor(pyxbmct.AddonDialogWindow):
 
         if close:
             super(AbstractConfigEditor, self).close()
+            # Imported here so that the colour picker isn't imported up front
+            from ...controls.colour_picker import close_colour_picker_windows
+
+            close_colour_picker_windows()
 
     def save_config(self):
         """Save the config to the HDD. Creates a popup dialogue window that
         asks for confirmation first
         """
         # type: () -> None
+        SliderDispatcher.flush_window(self)
         dialog = xbmcgui.Dialog()
         save = dialog.yesno(
             "Save Changes?",
@@ -107,14 +149,26 @@ class AbstractConfigEditor(pyxbmct.AddonDialogWindow):
                 self._config.write(config_file)
 
     def reset_to_default(self, tab_names):
-        """Reset these tabs to default"""
+        """Reset these tabs to default
+
+        Tabs that haven't been created yet aren't created just to be reset,
+        their fields are reset in the config instead
+        """
+        defaults = None
         for tab in tab_names:
-            self._tab_groups[tab].reset_to_default()
+            tab_group = self._tab_groups.get(tab)
+            if tab_group is not None:
+                tab_group.reset_to_default()
+                continue
+            if defaults is None:
+                defaults = self._config.defaults()
+            fields = self._form_config[tab]["tab"].FIELDS
+            self._config.set_many({field: defaults[field] for field in fields})
 
     def _reset_to_default_button_clicked(self):
         # type: () -> None
         reset_to_default_window = ResetToDefault(
-            self._tab_groups.keys(), self.reset_to_default
+            self._form_config.keys(), self.reset_to_default
         )
         reset_to_default_window.doModal()
         del reset_to_default_window
@@ -125,28 +179,69 @@ class AbstractConfigEditor(pyxbmct.AddonDialogWindow):
         self._unsaved_changes = True
 
     def _create_tabs(self, form_config):
-        """Create all the tabs that are displayed"""
+        """Create the menu bar used to switch between tabs
+
+        Tabs themselves are only created when they are first needed (see
+        :_get_tab:) as some of them contain a lot of controls.
+        """
+        self._form_config = form_config
         self._tab_groups = OrderedDict()
+        # The controls that belong to each tab
+        self._tab_controls = {}
+        # Navigation for the menu bars depends on which tab is shown. Filled
+        # in as each tab is shown for the first time
+        self._tab_menu_buttons_control_down = {}
+        self._menu_bar_buttons_control_up = {}
 
-        for tab in form_config:
-            tab_group = form_config[tab]["tab"](self._config)
+        self._create_tab_menu_bar(form_config)
+
+    def _get_tab(self, tab_name):
+        """:returns: the tab with the given name, creating it (hidden) if it\
+                doesn't exist yet
+        """
+        tab_group = self._tab_groups.get(tab_name)
+        if tab_group is None:
+            tab_group = self._form_config[tab_name]["tab"](self._config)
             self.connect(tab_group, self._change_made_in_tab)
-            self._tab_groups[tab] = tab_group
-            self.placeControl(
-                tab_group, 1, 0, columnspan=self.NUM_COLUMNS, rowspan=self.NUM_ROWS - 2
+            self._tab_groups[tab_name] = tab_group
+            first_control = len(self._controls)
+            # The geometry of the controls in the tab is measured whilst it is
+            # being placed, so it is cached (see :_get_tab_layout_key:) and
+            # replayed in future
+            layout_key = self._get_tab_layout_key(tab_name)
+            layout = Layout(self._layout_cache.get(layout_key))
+            set_layout(self, layout)
+            try:
+                self.placeControl(
+                    tab_group,
+                    1,
+                    0,
+                    columnspan=self.NUM_COLUMNS,
+                    rowspan=self.NUM_ROWS - 2,
+                )
+            finally:
+                set_layout(self, None)
+            if not layout.used_cache():
+                self._layout_cache.set(layout_key, layout.get_measurements())
+            self._tab_controls[tab_name] = self._controls[first_control:]
+            self._hide_tab(tab_name)
+            xbmc.log(
+                "Textures used after creating tab "
+                + tab_name
+                + ": "
+                + str(count_textures_used(self)),
+                xbmc.LOGDEBUG,
             )
-            self._hide_tab(tab)
-
-        self._create_tab_menu_bar(form_config)
+        return tab_group
 
     def _create_tab_menu_bar(self, form_config):
-        tab_group = pyxbmct.Group(1, len(self._tab_groups))
+        tab_group = pyxbmct.Group(1, len(form_config))
         self.placeControl(
             tab_group, 0, 0, columnspan=self.NUM_COLUMNS, pad_x=0, pad_y=0
         )
         self._tab_menu_buttons = {}
 
-        for col, title in enumerate(self._tab_groups):
+        for col, title in enumerate(form_config):
             button = controls.ButtonWithIcon(
                 title, form_config[title]["icon"], icon_pad_x=9
             )
@@ -154,22 +249,26 @@ class AbstractConfigEditor(pyxbmct.AddonDialogWindow):
             tab_group.placeControl(button, 0, col, pad_x=0, pad_y=0)
             self.connect(button, lambda tab=title: self.switch_tab(tab))
 
-    def _initialise_navigation(self):
-        """Set up the navigation between all the controls"""
-        # type: () -> None
-        # Some initialisation is done further down
-        self._tab_menu_buttons_control_down = {}
-        self._menu_bar_buttons_control_up = {}
+    @traced("AbstractConfigEditor._initialise_navigation")
+    def _initialise_navigation(self, tab_name):
+        """Set up the navigation between all the controls in a tab and the
+        menu bars
+
+        autoNavigation is slow so the navigation that it sets up is cached
+        (see :_get_tab_layout_key:) and replayed in future.
+        """
+        # type: (str) -> None
+        self._tab_menu_buttons_control_down[tab_name] = {}
+        self._menu_bar_buttons_control_up[tab_name] = {}
         control_down_methods = {}
         control_up_methods = {}
-        current_tab = ""
         for button_title in self._tab_menu_buttons:
             button = self._tab_menu_buttons[button_title].get_button()
             control_down_methods[button_title] = button.controlDown
 
             def new_control_down(control, button=button_title):
                 control_down_methods[button](control)
-                self._tab_menu_buttons_control_down[current_tab][button] = control
+                self._tab_menu_buttons_control_down[tab_name][button] = control
 
             button.controlDown = new_control_down
 
@@ -179,17 +278,26 @@ class AbstractConfigEditor(pyxbmct.AddonDialogWindow):
 
             def new_control_up(control, button=button_title):
                 control_up_methods[button](control)
-                self._menu_bar_buttons_control_up[current_tab][button] = control
+                self._menu_bar_buttons_control_up[tab_name][button] = control
 
             button.controlUp = new_control_up
 
-        for tab_title in self._tab_groups:
-            current_tab = tab_title
-            self._tab_menu_buttons_control_down[tab_title] = {}
-            self._menu_bar_buttons_control_up[tab_title] = {}
-            self._show_tab(tab_title)
-            self.autoNavigation()
-            self._hide_tab(tab_title)
+        navigation_controls = self._menu_controls + self._tab_controls[tab_name]
+        cache_key = self._get_tab_layout_key(tab_name)
+        placements = self._tab_groups[tab_name].get_placements()
+        edges = self._navigation_cache.get(
+            cache_key, len(navigation_controls), placements
+        )
+        if edges is None:
+            edges = self._record_auto_navigation(tab_name, navigation_controls)
+            self._navigation_cache.set(
+                cache_key, len(navigation_controls), placements, edges
+            )
+        else:
+            for source, method, target in edges:
+                getattr(navigation_controls[source], method)(
+                    navigation_controls[target]
+                )
 
         for button_title in self._tab_menu_buttons:
             button = self._tab_menu_buttons[button_title].get_button()
@@ -199,6 +307,80 @@ class AbstractConfigEditor(pyxbmct.AddonDialogWindow):
             button = self._menu_bar_buttons[button_title].get_button()
             button.controlUp = control_up_methods[button_title]
 
+    def _record_auto_navigation(self, tab_name, navigation_controls):
+        """Run autoNavigation with only tab_name visible (so that the controls\
+        in every other tab are ignored)
+
+        :returns: the navigation that was set up as a list of edges (see\
+                :resources.lib.windows.config_editors._navigation_cache:)
+        """
+        # type: (str, List[Any]) -> List[Tuple[int, str, int]]
+        # Only the last call for each control and direction matters
+        edges = OrderedDict()
+        indexes = {
+            id(control): index for index, control in enumerate(navigation_controls)
+        }
+        original_methods = []
+        for source, control in enumerate(navigation_controls):
+            for method_name in _NAVIGATION_METHODS:
+                method = getattr(control, method_name)
+
+                def record_edge(
+                    target, method=method, source=source, method_name=method_name
+                ):
+                    method(target)
+                    target_index = indexes.get(id(target))
+                    if target_index is not None:
+                        edges[source, method_name] = target_index
+
+                setattr(control, method_name, record_edge)
+                original_methods.append((control, method_name, method))
+
+        self._show_tab(tab_name)
+        self.autoNavigation()
+        self._hide_tab(tab_name)
+
+        for control, method_name, method in original_methods:
+            setattr(control, method_name, method)
+
+        return [
+            (source, method_name, target)
+            for (source, method_name), target in edges.iteritems()
+        ]
+
+    def _get_tab_layout_key(self, tab_name):
+        """:returns: a key that identifies the layout of a tab. The cached\
+                navigation and geometry can't be used if any of it changes\
+                (including the screen resolution and the skin, which change\
+                the size of everything)
+        """
+        # type: (str) -> str
+        tab_class = type(self._tab_groups[tab_name])
+        return "|".join(
+            (
+                tab_class.__module__ + "." + tab_class.__name__,
+                get_addon_info("version"),
+                "x".join(str(dimension) for dimension in self._geometry),
+                str(self.getResolution()),
+                xbmc.getSkinDir(),
+            )
+        )
+
+    def _get_navigation_cache_filename(self):
+        # type: () -> str
+        return os.path.join(get_profile_path(), "navigation_cache.json")
+
+    def _get_layout_cache_filename(self):
+        # type: () -> str
+        return os.path.join(get_profile_path(), "layout_cache.json")
+
+    def addControl(self, control):
+        """Override of the xbmcgui method (hence the camelCase) so that every
+        control in the window is known
+        """
+        super(AbstractConfigEditor, self).addControl(control)
+        self._controls.append(control)
+
     def _hide_tab(self, tab_name):
         self._tab_groups[tab_name].setVisible(False)
         self._tab_groups[tab_name].setEnabled(False)
@@ -207,6 +389,7 @@ class AbstractConfigEditor(pyxbmct.AddonDialogWindow):
         self._tab_groups[tab_name].setVisible(True)
         self._tab_groups[tab_name].setEnabled(True)
 
+    @traced("AbstractConfigEditor.switch_tab")
     def switch_tab(self, tab_name):
         """Hide and disable the current tab and make the given tab visible and
         usable
@@ -220,6 +403,9 @@ class AbstractConfigEditor(pyxbmct.AddonDialogWindow):
                 self._tab_menu_buttons[previous_tab].setEnabled(True)
                 self._hide_tab(previous_tab)
 
+            self._get_tab(tab_name)
+            if tab_name not in self._tab_menu_buttons_control_down:
+                self._initialise_navigation(tab_name)
             self._show_tab(tab_name)
 
             for button_title in self._tab_menu_buttons:
@@ -11,7 +11,7 @@ import os
 import xbmcgui
 import pyxbmct
 
-from .. import controls
+from ... import controls
 
 
 class ResetToDefault(pyxbmct.AddonDialogWindow):
@@ -0,0 +1,171 @@
+"""Used to pick a config preset to load from a chosen directory, with a preview
+of the colours in the highlighted preset
+
+(Presets are files contain values for certain fields that can be reapplied to
+a config later)
+"""
+
+import os
+
+try:
+    # typing not available on XBMC4XBOX
+    from typing import Any, Callable, List, Optional
+except:
+    pass
+
+import pyxbmct
+from .. import controls
+from ..configs import PresetBrowser
+from ..controls._colour_square import _ColourSquare
+
+# Colour squares are shown in this many columns to the right of the presets
+_NUM_COLOUR_COLUMNS = 2
+
+
+class PresetPicker(pyxbmct.AddonDialogWindow):
+    """Lists the presets in a directory and previews the colours in the one
+    that is highlighted
+    """
+
+    def __new__(
+        cls,
+        preset_browser,
+        preset_chosen_callback=None,
+        default_filename=None,
+        *args,
+        **kwargs
+    ):
+        return super(PresetPicker, cls).__new__(cls, *args, **kwargs)
+
+    def __init__(
+        self,
+        preset_browser,
+        preset_chosen_callback=None,
+        default_filename=None,
+        *args,
+        **kwargs
+    ):
+        """:param preset_browser: used to list the presets and get their\
+                colours
+        :param preset_chosen_callback: called with the filename of the preset\
+                that is chosen
+        :param default_filename: a preset (or directory of presets) to start\
+                in e.g. the last preset that was loaded
+        """
+        # type: (PresetBrowser, Callable[[str], Any], Optional[str], Any, Any) -> None
+        super(PresetPicker, self).__init__("Load Flubber-X Preset", *args, **kwargs)
+        self._preset_browser = preset_browser
+        self._preset_chosen_callback = preset_chosen_callback
+        self._filenames = []  # type: List[str]
+        self._previewed_index = None  # type: Optional[int]
+
+        colour_fields = preset_browser.get_colour_fields()
+        num_colour_rows = -(-len(colour_fields) // _NUM_COLOUR_COLUMNS)
+        num_list_rows = max(5, num_colour_rows)
+        num_rows = num_list_rows + 2
+        num_columns = 4 + _NUM_COLOUR_COLUMNS
+        self.setGeometry(800, num_rows * 60, num_rows, num_columns)
+
+        directory = "Select Directory"
+        if default_filename:
+            if os.path.isfile(default_filename):
+                directory = os.path.dirname(default_filename)
+            elif os.path.isdir(default_filename):
+                directory = default_filename
+
+        self.placeControl(pyxbmct.Label("Directory"), 0, 0)
+        directory_input = controls.FileSelector(
+            default_filename=directory,
+            update_label_on_select=True,
+            browse_type=0,
+            file_select_window_title="Select Directory",
+        )
+        self.placeControl(directory_input, 0, 1, columnspan=num_columns - 1)
+        self.connect(directory_input, self._show_directory)
+
+        self._preset_list = pyxbmct.List()
+        self.placeControl(self._preset_list, 1, 0, rowspan=num_list_rows, columnspan=4)
+        self.connect(self._preset_list, self._ok_clicked)
+
+        self._colour_squares = []
+        for index, field in enumerate(colour_fields):
+            colour_square = _ColourSquare("0xFFFFFFFF")
+            row, column = divmod(index, _NUM_COLOUR_COLUMNS)
+            self.placeControl(colour_square, 1 + row, 4 + column)
+            self._colour_squares.append((field, colour_square))
+
+        ok_button = controls.ButtonWithIcon("Load Preset", "file_arrow_up.png")
+        self.placeControl(ok_button, num_rows - 1, 0, columnspan=num_columns // 2)
+        self.connect(ok_button, self._ok_clicked)
+
+        cancel_button = controls.ButtonWithIcon("Cancel", "close.png")
+        self.placeControl(
+            cancel_button,
+            num_rows - 1,
+            num_columns // 2,
+            columnspan=num_columns - num_columns // 2,
+        )
+        self.connect(cancel_button, self.close)
+
+        self._show_directory(directory)
+        self.setFocus(self._preset_list if self._filenames else directory_input)
+        self.autoNavigation()
+
+        self.connect(pyxbmct.ACTION_NAV_BACK, self.close)
+
+    def onAction(self, action):
+        """Override of the xbmcgui method (hence the camelCase) so that the
+        preview follows the highlighted preset
+        """
+        super(PresetPicker, self).onAction(action)
+        self._show_preview()
+
+    def _show_directory(self, directory):
+        """List the presets in a directory"""
+        # type: (str) -> None
+        if os.path.isdir(directory):
+            self._filenames = self._preset_browser.list_presets(directory)
+        else:
+            self._filenames = []
+        self._preset_list.reset()
+        self._preset_list.addItems(
+            [os.path.basename(filename) for filename in self._filenames]
+        )
+        self._previewed_index = None
+        self._show_preview()
+
+    def _get_selected_filename(self):
+        """:returns: the filename of the highlighted preset or None if there\
+                are no presets
+        """
+        # type: () -> Optional[str]
+        index = self._preset_list.getSelectedPosition()
+        if 0 <= index < len(self._filenames):
+            return self._filenames[index]
+        return None
+
+    def _show_preview(self):
+        """Show the colours in the highlighted preset, if it has changed"""
+        # type: () -> None
+        index = self._preset_list.getSelectedPosition()
+        if index == self._previewed_index:
+            return
+        self._previewed_index = index
+
+        filename = self._get_selected_filename()
+        colours = (
+            None if filename is None else self._preset_browser.get_colours(filename)
+        )
+        for field, colour_square in self._colour_squares:
+            colour_square.setVisible(colours is not None)
+            if colours is not None:
+                colour_square.setColorDiffuse(colours[field])
+
+    def _ok_clicked(self):
+        # type: () -> None
+        filename = self._get_selected_filename()
+        if filename is None:
+            return
+        if self._preset_chosen_callback:
+            self._preset_chosen_callback(filename)
+        self.close()
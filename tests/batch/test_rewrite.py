@@ -0,0 +1,104 @@
+"""Tests for batch.rewrite"""
+import os
+
+import pytest
+
+from lib.batch import load_assignments, rewrite_config_file, rewrite_config_files
+from lib.configs import ConfigError
+
+_ORIGINAL = "AVCHECK=0\t;Check for AV Pack\r\n\r\nFANSPEED=20\r\n"
+
+
+def test_load_assignments():
+    """Ensures that values are read in Python format, in order, and that
+    fields can be picked out
+    """
+    lines = ["fanspeed=20\n", "AVCHECK=0 ;comment\n", "FANSPEED=30\n"]
+    assert load_assignments(lines) == (("FANSPEED", 30), ("AVCHECK", False))
+    assert load_assignments(lines, fields=["avcheck"]) == (("AVCHECK", False),)
+
+
+@pytest.mark.parametrize("lines", (["AVCHECK=2\n"], ["NOTAFIELD=1\n"], ["garbage"]))
+def test_load_assignments_invalid(lines):
+    """Ensures that invalid assignments are rejected"""
+    with pytest.raises(ConfigError):
+        load_assignments(lines)
+
+
+@pytest.mark.parametrize("processes", (1, 2))
+def test_rewrite_config_files(tmpdir, processes):
+    """Ensures that only the files that need to change are rewritten, and
+    only the changed lines are modified
+    """
+    changed_file = tmpdir.join("changed.cfg")
+    changed_file.write(_ORIGINAL, mode="wb")
+    unchanged_file = tmpdir.join("unchanged.cfg")
+    unchanged_file.write("FANSPEED=50\n", mode="wb")
+    # So that it can be detected if the file is rewritten
+    os.utime(str(unchanged_file), (0, 0))
+
+    changed_report, unchanged_report = rewrite_config_files(
+        [str(changed_file), str(unchanged_file)],
+        (("FANSPEED", 50),),
+        processes=processes,
+    )
+
+    assert changed_report["changed"]
+    assert changed_file.read(mode="rb") == _ORIGINAL.replace("20", "50")
+    assert not unchanged_report["changed"]
+    assert unchanged_file.mtime() == 0
+    assert tmpdir.listdir() == [changed_file, unchanged_file]
+
+
+def test_rewrite_config_file_error(tmpdir):
+    """Ensures that errors are reported rather than raised"""
+    report = rewrite_config_file(str(tmpdir.join("missing.cfg")), ())
+    assert not report["changed"]
+    assert report["error"] is not None
+
+
+def test_rewrite_config_files_invalid_assignment(tmpdir):
+    """Ensures that no files are changed if an assignment is invalid"""
+    config_file = tmpdir.join("config.cfg")
+    config_file.write(_ORIGINAL, mode="wb")
+    with pytest.raises(ConfigError):
+        rewrite_config_files([str(config_file)], (("FANSPEED", 51),))
+    assert config_file.read(mode="rb") == _ORIGINAL
+
+
+def test_rewrite_config_file_with_invalid_field(tmpdir):
+    """Ensures that a file with an invalid field (that isn't being set) is
+    reported and left alone, unless it is asked to be fixed
+    """
+    config_file = tmpdir.join("config.cfg")
+    original = "AVCHECK=2\r\nFANSPEED=20\r\n"
+    config_file.write(original, mode="wb")
+
+    report = rewrite_config_file(str(config_file), (("FANSPEED", 50),))
+    assert not report["changed"]
+    assert list(report["invalid_fields"]) == ["AVCHECK"]
+    assert report["error"] is not None
+    assert config_file.read(mode="rb") == original
+
+    report = rewrite_config_file(
+        str(config_file), (("FANSPEED", 50),), fix_invalid=True
+    )
+    assert report["changed"]
+    assert list(report["invalid_fields"]) == ["AVCHECK"]
+    assert report["error"] is None
+    assert config_file.read(mode="rb") == "AVCHECK=1\r\nFANSPEED=50\r\n"
+
+
+def test_rewrite_config_file_with_malformed_line(tmpdir):
+    """Ensures that a file with a line that isn't of the form KEY=value is
+    reported and left alone
+    """
+    config_file = tmpdir.join("config.cfg")
+    original = "FANSPEED=20\r\ngarbage\r\n"
+    config_file.write(original, mode="wb")
+
+    report = rewrite_config_file(str(config_file), (("FANSPEED", 50),))
+    assert not report["changed"]
+    assert report["malformed_lines"] == [{"line": 2, "text": "garbage"}]
+    assert report["error"] is not None
+    assert config_file.read(mode="rb") == original
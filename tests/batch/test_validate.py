@@ -0,0 +1,61 @@
+"""Tests for batch.validate"""
+import pytest
+
+from lib.batch import find_config_files, validate_config_files
+
+
+@pytest.fixture
+def config_directory(tmpdir):
+    """A directory tree containing valid and invalid config files"""
+    tmpdir.join("valid.cfg").write("AVCHECK=0\n")
+    tmpdir.mkdir("console2").join("invalid.CFG").write("AVCHECK=2\nFANSPEED=9\n")
+    tmpdir.join("notes.txt").write("garbage\n")
+    return tmpdir
+
+
+def test_find_config_files(config_directory):
+    """Ensures that only config files are found, in a consistent order"""
+    assert list(find_config_files(str(config_directory))) == [
+        str(config_directory.join("valid.cfg")),
+        str(config_directory.join("console2", "invalid.CFG")),
+    ]
+
+
+@pytest.mark.parametrize("processes", (1, 2))
+def test_validate_config_files(config_directory, processes):
+    """Ensures that each file gets a report listing its invalid fields, in
+    the same order as the files were given
+    """
+    filenames = list(find_config_files(str(config_directory)))
+    filenames.append(str(config_directory.join("missing.cfg")))
+    valid_report, invalid_report, missing_report = validate_config_files(
+        filenames, processes=processes
+    )
+
+    assert valid_report["valid"]
+    assert valid_report["invalid_fields"] == {}
+    assert valid_report["malformed_lines"] == []
+
+    assert not invalid_report["valid"]
+    assert invalid_report["filename"] == filenames[1]
+    assert sorted(invalid_report["invalid_fields"]) == ["AVCHECK", "FANSPEED"]
+    assert invalid_report["error"] is None
+
+    assert not missing_report["valid"]
+    assert missing_report["error"] is not None
+
+
+def test_malformed_lines_make_file_invalid(tmpdir):
+    """Ensures that lines that are not of the form KEY=value are reported
+    rather than silently skipped
+    """
+    config_file = tmpdir.join("malformed.cfg")
+    config_file.write("AVCHECK=0\nDASH1 C:\\evoxdash.xbe\nGARBAGE LINE\nFANSPEED=9\n")
+    (report,) = validate_config_files([str(config_file)], processes=1)
+    assert not report["valid"]
+    assert report["malformed_lines"] == [
+        {"line": 2, "text": "DASH1 C:\\evoxdash.xbe"},
+        {"line": 3, "text": "GARBAGE LINE"},
+    ]
+    assert list(report["invalid_fields"]) == ["FANSPEED"]
+    assert report["error"] is None
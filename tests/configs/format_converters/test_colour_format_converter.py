@@ -0,0 +1,37 @@
+"""Tests for configs.format_converters.ColourFormatConverter"""
+import pytest
+
+from lib.configs.format_converters import ColourFormatConverter
+
+
+@pytest.mark.parametrize(
+    "with_alpha_channel, config_value, python_value",
+    (
+        (False, "0x00FF00", 0xFF00FF00),
+        (False, "0xa0ff40", 0xFFA0FF40),
+        (True, "0x8000FF00", 0x8000FF00),
+        (True, "0xff000000", 0xFF000000),
+    ),
+)
+def test_convert_to_python_format(with_alpha_channel, config_value, python_value):
+    """Ensures that hex strings are converted to ARGB ints, and that colours
+    without an alpha channel are fully opaque
+    """
+    format_converter = ColourFormatConverter(with_alpha_channel)
+    assert format_converter.convert_to_python_format(config_value) == python_value
+
+
+@pytest.mark.parametrize(
+    "with_alpha_channel, python_value, config_value",
+    (
+        (False, 0xFF00FF00, "0x00FF00"),
+        (True, 0x8000FF00, "0x8000FF00"),
+        (True, 0x00000000, "0x00000000"),
+    ),
+)
+def test_convert_to_config_file_format(with_alpha_channel, python_value, config_value):
+    """Ensures that ARGB ints are converted to hex strings, only including
+    the alpha channel if there is one
+    """
+    format_converter = ColourFormatConverter(with_alpha_channel)
+    assert format_converter.convert_to_config_file_format(python_value) == config_value
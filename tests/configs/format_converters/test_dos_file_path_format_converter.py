@@ -1,7 +1,6 @@
 """Tests for configs.format_converters.DOSFilePathFormatConverter abd
 configs.format_converters.OptionalDOSFilePathFormatConverter
 """
-from itertools import product
 
 import pytest
 
@@ -18,6 +17,7 @@ _CONFIG_AND_PYTHON_PATHS = (
         "\\Device\\Harddisk0\\Partition7\\asdasd\\default1.xbe",
         "G:\\asdasd\\default1.xbe",
     ),
+    ("\\Device\\CdRom0\\default.xbe", "D:\\default.xbe"),
 )
 
 _CONVERTERS_AND_PATHS = tuple(
@@ -0,0 +1,44 @@
+"""Tests for configs.colour"""
+import pytest
+
+from lib.configs.colour import argb_to_hex_colour, colour_to_argb, hex_colour_to_argb
+
+
+@pytest.mark.parametrize(
+    "colour, argb",
+    (
+        ("0x00FF00", 0xFF00FF00),
+        ("0x8000FF00", 0x8000FF00),
+        ("0xa0ff40", 0xFFA0FF40),
+        ("8000FF00", 0x8000FF00),
+        ("00FF00", 0xFF00FF00),
+    ),
+)
+def test_hex_colour_to_argb(colour, argb):
+    """Ensures that colours without an alpha channel are fully opaque"""
+    assert hex_colour_to_argb(colour) == argb
+
+
+@pytest.mark.parametrize(
+    "colour, with_alpha_channel, argb",
+    (
+        ("0x8000FF00", True, 0x8000FF00),
+        ("0x8000FF00", False, 0xFF00FF00),
+        (0x8000FF00, True, 0x8000FF00),
+        (0x8000FF00, False, 0xFF00FF00),
+    ),
+)
+def test_colour_to_argb(colour, with_alpha_channel, argb):
+    """Ensures that colours are made fully opaque if there is no alpha
+    channel
+    """
+    assert colour_to_argb(colour, with_alpha_channel) == argb
+
+
+@pytest.mark.parametrize(
+    "argb, with_alpha_channel, colour",
+    ((0x8000FF00, True, "0x8000FF00"), (0x8000FF00, False, "0x00FF00")),
+)
+def test_argb_to_hex_colour(argb, with_alpha_channel, colour):
+    """Ensures that the alpha channel is only included if asked for"""
+    assert argb_to_hex_colour(argb, with_alpha_channel) == colour
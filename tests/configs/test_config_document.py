@@ -0,0 +1,73 @@
+"""Tests for configs.config_document.ConfigDocument"""
+from StringIO import StringIO
+
+import pytest
+
+from lib.configs import ConfigSyntaxError
+from lib.configs.config_document import ConfigDocument
+
+_FILE = (
+    "; My config\r\n"
+    "\r\n"
+    "fanspeed=20\t\t;Fan Speed   10-50\r\n"
+    "AVCHECK=0 ;Check for AV Pack\r\n"
+    "garbage\r\n"
+    "FANSPEED=30\r\n"
+)
+
+
+def _read(text):
+    document = ConfigDocument()
+    values = document.read(
+        StringIO(text), format_option_name=str.upper, ignore_syntax_errors=True
+    )
+    return document, values
+
+
+def _write(document):
+    output = StringIO()
+    document.write(output)
+    return output.getvalue()
+
+
+def test_round_trip_unchanged():
+    """Ensures that a document is written back out exactly as it was read"""
+    document, values = _read(_FILE)
+    assert values == {"FANSPEED": "30", "AVCHECK": "0"}
+    assert _write(document) == _FILE
+
+
+def test_set_existing_option():
+    """Ensures that setting an option changes every line it is on and
+    nothing else
+    """
+    document, _ = _read(_FILE)
+    document.set("FANSPEED", "40")
+    assert _write(document) == _FILE.replace("=20", "=40").replace("=30", "=40")
+
+
+@pytest.mark.parametrize(
+    "text, expected_text",
+    (
+        ("", "DASH1=C:\\a.xbe\n"),
+        ("AVCHECK=0", "AVCHECK=0\nDASH1=C:\\a.xbe\n"),
+        ("AVCHECK=0\r\n", "AVCHECK=0\r\nDASH1=C:\\a.xbe\r\n"),
+    ),
+)
+def test_set_new_option(text, expected_text):
+    """Ensures that options not in the document are added on a new line,
+    using the same line endings as the rest of the document
+    """
+    document, _ = _read(text)
+    assert "DASH1" not in document
+    document.set("DASH1", "C:\\a.xbe")
+    assert "DASH1" in document
+    assert _write(document) == expected_text
+
+
+def test_read_error_leaves_document_unchanged():
+    """Ensures that nothing is changed if a file can't be read"""
+    document, _ = _read(_FILE)
+    with pytest.raises(ConfigSyntaxError):
+        document.read(StringIO("garbage\n"))
+    assert _write(document) == _FILE
@@ -0,0 +1,126 @@
+"""Tests for configs.config_file_tokenizer"""
+import pytest
+
+from lib.configs import ConfigSyntaxError
+from lib.configs.config_file_tokenizer import (
+    find_malformed_lines,
+    replace_value,
+    tokenize_config_file,
+    tokenize_line,
+)
+
+
+@pytest.mark.parametrize(
+    "line, expected_token",
+    (
+        ("AVCHECK=1", ("AVCHECK", "1")),
+        ("AVCHECK=1\r\n", ("AVCHECK", "1")),
+        ("AVCHECK = 1", ("AVCHECK", "1")),
+        ("AVCHECK=0\t     \t;Check for AV Pack\tDefault=1", ("AVCHECK", "0")),
+        ("MACADDR=00:00:00:00:00:00\t;Change MAC", ("MACADDR", "00:00:00:00:00:00")),
+        ("FOG1COLOR=0\t\t;0xAARRGGBB Fog 1 Color", ("FOG1COLOR", "0")),
+        ("KEY=a;b", ("KEY", "a;b")),
+        ("KEY=;comment", ("KEY", "")),
+        ("KEY=", ("KEY", "")),
+        ('DASH1="C:\\my dash.xbe"', ("DASH1", "C:\\my dash.xbe")),
+        ('DASH1="C:\\my dash.xbe" ;comment', ("DASH1", "C:\\my dash.xbe")),
+        ('KEY=""', ("KEY", "")),
+        ('KEY="', ("KEY", '"')),
+    ),
+)
+def test_tokenize_line(line, expected_token):
+    """Ensures that lines are split into names and values, with comments and
+    quote characters removed
+    """
+    assert tokenize_line(line, '"') == expected_token
+
+
+@pytest.mark.parametrize("line", ("", "\t", "   \r\n", ";comment", "# comment"))
+def test_tokenize_line_no_option(line):
+    """Ensures that blank lines and comments do not produce a token"""
+    assert tokenize_line(line) is None
+
+
+@pytest.mark.parametrize("line", ("AVCHECK", "=1", " = 1", "garbage ;comment"))
+def test_tokenize_line_invalid(line):
+    """Ensures that an error is raised for lines that are not KEY=value"""
+    with pytest.raises(ConfigSyntaxError):
+        tokenize_line(line)
+
+
+def test_quote_char_not_removed_if_not_supplied():
+    """Ensures that quote characters are only removed if asked to"""
+    assert tokenize_line('KEY="value"') == ("KEY", '"value"')
+
+
+def test_tokenize_config_file():
+    """Ensures that every option in a file is returned in order, with names
+    formatted
+    """
+    lines = ["480P=1\t;comment\n", "\n", "\t\n", "xSKEWLOGO=0\n", "480P=0\n"]
+    tokens = list(tokenize_config_file(lines, format_option_name=str.upper))
+    assert tokens == [("480P", "1"), ("XSKEWLOGO", "0"), ("480P", "0")]
+
+
+def test_tokenize_config_file_syntax_error():
+    """Ensures that the line number is reported for invalid lines"""
+    with pytest.raises(ConfigSyntaxError) as excinfo:
+        list(tokenize_config_file(["AVCHECK=1\n", "\n", "garbage\n"]))
+    assert "Line 3" in str(excinfo.value)
+
+
+def test_tokenize_config_file_ignore_syntax_errors():
+    """Ensures that invalid lines can be skipped"""
+    tokens = list(
+        tokenize_config_file(["garbage\n", "AVCHECK=1\n"], ignore_syntax_errors=True)
+    )
+    assert tokens == [("AVCHECK", "1")]
+
+
+@pytest.mark.parametrize(
+    "line, value, expected_line",
+    (
+        ("AVCHECK=1", "0", "AVCHECK=0"),
+        ("AVCHECK=1\r\n", "0", "AVCHECK=0\r\n"),
+        ("AVCHECK = 1\t;Check for AV Pack\n", "0", "AVCHECK = 0\t;Check for AV Pack\n"),
+        ("KEY=a;b ;comment\n", "c", "KEY=c ;comment\n"),
+        ("KEY=\n", "value", "KEY=value\n"),
+        ("KEY=;comment", "value", "KEY=value ;comment"),
+        ('DASH1="C:\\my dash.xbe" ;dash\n', "C:\\a.xbe", "DASH1=C:\\a.xbe ;dash\n"),
+    ),
+)
+def test_replace_value(line, value, expected_line):
+    """Ensures that only the value in a line is replaced"""
+    assert replace_value(line, value) == expected_line
+
+
+def test_tokenize_config_file_option_names():
+    """Ensures that only the requested options are returned and other lines
+    are not checked
+    """
+    lines = ["avcheck=1\n", "garbage\n", ";FANSPEED=1\n", "FANSPEED=20\n"]
+    tokens = list(
+        tokenize_config_file(
+            lines, format_option_name=str.upper, option_names={"AVCHECK", "FANSPEED"}
+        )
+    )
+    assert tokens == [("AVCHECK", "1"), ("FANSPEED", "20")]
+
+
+def test_find_malformed_lines():
+    """Ensures that every line that isn't blank, a comment or KEY=value is
+    found along with its line number
+    """
+    lines = [
+        "AVCHECK=1\n",
+        "DASH1 C:\\evoxdash.xbe\r\n",
+        "\n",
+        ";GARBAGE\n",
+        "GARBAGE LINE\n",
+        "=1\n",
+    ]
+    assert find_malformed_lines(lines) == [
+        (2, "DASH1 C:\\evoxdash.xbe"),
+        (5, "GARBAGE LINE"),
+        (6, "=1"),
+    ]
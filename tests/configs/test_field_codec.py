@@ -0,0 +1,96 @@
+"""Tests for configs.field_codec.FieldCodec"""
+import pytest
+
+from lib.configs import ConfigFieldValueError
+from lib.configs.config_field import BooleanField, HDDFilePathField, IntegerField
+from lib.configs.factories import compile_field_codecs, field_codec_factory
+
+_FANSPEED = IntegerField("FANSPEED", 10, 10, 50)
+_DASH1 = HDDFilePathField("DASH1", "C:\\evoxdash.xbe", "xbe")
+
+
+@pytest.mark.parametrize(
+    "config_field, python_value, config_value",
+    (
+        (_FANSPEED, 20, "20"),
+        (BooleanField("AVCHECK", True), False, "0"),
+        (_DASH1, "E:\\dash.xbe", "\\Device\\Harddisk0\\Partition1\\dash.xbe"),
+    ),
+)
+def test_round_trip(config_field, python_value, config_value):
+    """Ensures that values are converted in both directions"""
+    codec = field_codec_factory(config_field)
+    assert codec.convert_to_config_file_format(python_value) == config_value
+    assert codec.config_file_to_python_format(config_value) == python_value
+
+
+@pytest.mark.parametrize("value", (9, 51, "20", None))
+def test_validate_in_python_format_invalid(value):
+    """Ensures that values of the wrong type or out of range are rejected"""
+    codec = field_codec_factory(_FANSPEED)
+    with pytest.raises(ConfigFieldValueError):
+        codec.validate_in_python_format(value)
+
+
+@pytest.mark.parametrize("value", ("9", "51", "ten", ""))
+def test_config_file_to_python_format_invalid(value):
+    """Ensures that values are validated before they are converted"""
+    codec = field_codec_factory(_FANSPEED)
+    with pytest.raises(ConfigFieldValueError):
+        codec.config_file_to_python_format(value)
+
+
+@pytest.mark.parametrize(
+    "python_value, quote_char_if_whitespace, valid",
+    (
+        ("C:\\" + "a" * 29 + ".xbe", None, True),
+        ("C:\\" + "a" * 30 + ".xbe", None, False),
+        ("C:\\" + "a" * 27 + " .xbe", '"', False),
+        ("C:\\" + "a" * 26 + " .xbe", '"', True),
+    ),
+)
+def test_line_length(python_value, quote_char_if_whitespace, valid):
+    """Ensures that values that would make a line in the config file too long
+    are rejected
+
+    With a max line length of 70 values for DASH1 can be at most 62
+    characters long in config file format
+    """
+    codec = field_codec_factory(
+        _DASH1, max_line_length=70, quote_char_if_whitespace=quote_char_if_whitespace
+    )
+    if valid:
+        codec.validate_in_python_format(python_value)
+    else:
+        with pytest.raises(ConfigFieldValueError):
+            codec.validate_in_python_format(python_value)
+
+
+def test_compile_field_codecs_keeps_order():
+    """Ensures that codecs are keyed by field name in the same order as the
+    fields
+    """
+    codecs = compile_field_codecs((_FANSPEED, _DASH1))
+    assert list(codecs.keys()) == ["FANSPEED", "DASH1"]
+    assert codecs["DASH1"].default_value == _DASH1.default_value
+
+
+@pytest.mark.parametrize(
+    "config_field, value, valid",
+    (
+        (_FANSPEED, 50, True),
+        (_FANSPEED, 51, False),
+        (_DASH1, "C:\\" + "a" * 29 + ".xbe", True),
+        (_DASH1, "C:\\" + "a" * 30 + ".xbe", False),
+    ),
+)
+def test_validate_in_python_format(config_field, value, valid):
+    """Ensures that values are validated, including the line length, without
+    needing to be converted first
+    """
+    codec = field_codec_factory(config_field, max_line_length=70)
+    if valid:
+        codec.validate_in_python_format(value)
+    else:
+        with pytest.raises(ConfigFieldValueError):
+            codec.validate_in_python_format(value)
@@ -4,6 +4,7 @@ import sys
 import os
 import pytest
 import tempfile
+from StringIO import StringIO
 from lib.configs import (
     IndBiosConfig,
     ConfigFieldValueError,
@@ -238,3 +239,195 @@ def test_load_preset(preset_filename, preset_config, apply_to_fields):
             )
         else:
             assert new_field_value == CONFIG_DEFAULTS[field], field + " value unchanged"
+
+
+def test_instances_do_not_share_values():
+    """Ensures that changing a value in one config does not affect any other
+    config, even though they share the same schema
+    """
+    config = IndBiosConfig()
+    other_config = IndBiosConfig()
+    config.set("FANSPEED", 50)
+    assert other_config.get("FANSPEED") == CONFIG_DEFAULTS["FANSPEED"]
+    assert IndBiosConfig().get("FANSPEED") == CONFIG_DEFAULTS["FANSPEED"]
+
+
+def test_defaults_cannot_be_modified():
+    """Ensures that modifying the dictionary returned by defaults does not
+    change the defaults used by other configs
+    """
+    IndBiosConfig().defaults()["FANSPEED"] = 50
+    config = IndBiosConfig()
+    assert config.defaults()["FANSPEED"] == CONFIG_DEFAULTS["FANSPEED"]
+    config.set("FANSPEED", 20)
+    config.set_to_default("FANSPEED")
+    assert config.get("FANSPEED") == CONFIG_DEFAULTS["FANSPEED"]
+
+
+def test_config_has_no_instance_dict():
+    """Ensures that configs don't carry a per instance dictionary, as many of
+    them may be alive at once
+    """
+    assert not hasattr(IndBiosConfig(), "__dict__")
+
+
+def test_unrecognised_fields_written_back():
+    """Ensures that fields that are not part of the iND-BiOS survive a read
+    and write
+    """
+    config = IndBiosConfig()
+    config.readfp(StringIO("UNKNOWN=some value\nFANSPEED=20\n"))
+    output = StringIO()
+    config.write(output)
+    assert output.getvalue() == "UNKNOWN=some value\nFANSPEED=20\n"
+
+
+def test_write_only_changes_modified_lines():
+    """Ensures that comments, blank lines and the values of fields that have
+    not changed are written back exactly as they were read
+    """
+    original = (
+        "; My config\r\n"
+        "\r\n"
+        "FANSPEED=20\t\t;Fan Speed   10-50\r\n"
+        "AVCHECK=0 ;Check for AV Pack\r\n"
+        "garbage\r\n"
+        "FANSPEED=30\r\n"
+    )
+    config = IndBiosConfig()
+    config.readfp(StringIO(original))
+    config.set("AVCHECK", True)
+    config.set("FANSPEED", 40)
+    config.set("DASH1", "E:\\my dash.xbe")
+    output = StringIO()
+    config.write(output)
+    assert output.getvalue() == (
+        "; My config\r\n"
+        "\r\n"
+        "FANSPEED=40\t\t;Fan Speed   10-50\r\n"
+        "AVCHECK=1 ;Check for AV Pack\r\n"
+        "garbage\r\n"
+        "FANSPEED=40\r\n"
+        'DASH1="\\Device\\Harddisk0\\Partition1\\my dash.xbe"\r\n'
+    )
+
+
+def test_write_replaces_invalid_values():
+    """Ensures that values that were reset to default when they were read are
+    corrected in the file
+    """
+    config = IndBiosConfig()
+    config.readfp(StringIO("AVCHECK=2 ;comment\n"))
+    output = StringIO()
+    config.write(output)
+    assert output.getvalue() == "AVCHECK=1 ;comment\n"
+
+
+def test_write_all_fields_when_defaults_are_written():
+    """Ensures that fields missing from a file that was read are added when
+    default values are written too
+    """
+    config = IndBiosConfig()
+    config.readfp(StringIO("FANSPEED=20\n"))
+    output = StringIO()
+    config.write(output, dont_write_option_if_value_default=False)
+    output.seek(0)
+    written_config = IndBiosConfig()
+    written_config.readfp(output, set_invalid_fields_to_default=False)
+    assert written_config.get("FANSPEED") == 20
+    assert output.getvalue().count("\n") == len(CONFIG_OPTIONS)
+
+
+def test_read_returns_invalid_fields():
+    """Ensures that reading a file reports the fields that were reset to
+    their default values
+    """
+    config = IndBiosConfig()
+    invalid_fields = config.readfp(StringIO("AVCHECK=2\nFANSPEED=20\n"))
+    assert list(invalid_fields.keys()) == ["AVCHECK"]
+
+
+def test_read_only_some_fields():
+    """Ensures that only the requested fields are read and validated when
+    fields are given
+    """
+    config = IndBiosConfig()
+    invalid_fields = config.readfp(
+        StringIO("AVCHECK=2\ngarbage\nFANSPEED=20\nIGRMODE=1\n"),
+        set_invalid_fields_to_default=False,
+        fields=("fanspeed", "AUTOLOADDVD"),
+    )
+    assert invalid_fields == {}
+    assert config.get("FANSPEED") == 20
+    assert config.get("IGRMODE") == CONFIG_DEFAULTS["IGRMODE"]
+
+
+def test_read_only_some_fields_invalid_name():
+    """Ensures that an error is raised if a requested field does not exist"""
+    with pytest.raises(ConfigFieldNameError):
+        IndBiosConfig().readfp(StringIO("FANSPEED=20\n"), fields=("NOTAFIELD",))
+
+
+def test_set_many():
+    """Ensures that several fields can be set at once"""
+    config = IndBiosConfig()
+    config.set_many({"fanspeed": 20, "AVCHECK": False})
+    assert config.get("FANSPEED") == 20
+    assert config.get("AVCHECK") is False
+
+
+@pytest.mark.parametrize(
+    "values, error",
+    (
+        ({"FANSPEED": 20, "AVCHECK": 2}, ConfigFieldValueError),
+        ({"FANSPEED": 20, "NOTAFIELD": 1}, ConfigFieldNameError),
+    ),
+)
+def test_set_many_invalid_changes_nothing(values, error):
+    """Ensures that no fields are set if any of the names or values are
+    invalid
+    """
+    config = IndBiosConfig()
+    with pytest.raises(error):
+        config.set_many(values)
+    assert config.get("FANSPEED") == CONFIG_DEFAULTS["FANSPEED"]
+
+
+def test_set_many_pairs_last_value_used():
+    """Ensures that the last value is used if a field is given more than once"""
+    config = IndBiosConfig()
+    config.set_many((("FANSPEED", 20), ("fanspeed", 30)))
+    assert config.get("FANSPEED") == 30
+
+
+def test_set_many_rolled_back_on_error():
+    """Ensures that every field and the file contents are restored if an
+    error is raised part way through setting unvalidated values
+    """
+    original = "FANSPEED=20\nDASH1=\\Device\\Harddisk0\\Partition2\\a.xbe\n"
+    config = IndBiosConfig()
+    config.readfp(StringIO(original))
+    with pytest.raises(TypeError):
+        config.set_many(
+            (("FANSPEED", 30), ("AVCHECK", False), ("DASH1", 5)),
+            validate_option_names_and_values=False,
+        )
+    assert config.get_many(("FANSPEED", "AVCHECK")) == {
+        "FANSPEED": 20,
+        "AVCHECK": CONFIG_DEFAULTS["AVCHECK"],
+    }
+    output = StringIO()
+    config.write(output)
+    assert output.getvalue() == original
+
+
+def test_get_many():
+    """Ensures that several fields can be read at once"""
+    config = IndBiosConfig()
+    config.set("FANSPEED", 20)
+    assert config.get_many(("fanspeed", "AVCHECK")) == {
+        "fanspeed": 20,
+        "AVCHECK": CONFIG_DEFAULTS["AVCHECK"],
+    }
+    with pytest.raises(ConfigFieldNameError):
+        config.get_many(("NOTAFIELD",))
@@ -0,0 +1,52 @@
+"""Tests for configs.preset_browser.PresetBrowser"""
+import pytest
+
+from lib.configs import IndBiosConfig, PresetBrowser, PresetLibrary, PresetSwatches
+
+_COLOUR_FIELDS = ("GLOWCOLOR", "SCENECOLOR1")
+
+
+@pytest.fixture
+def preset_directory(tmpdir):
+    """A directory containing two presets"""
+    presets = tmpdir.mkdir("presets")
+    presets.join("green.cfg").write("GLOWCOLOR=0x00FF00\n")
+    presets.join("default.cfg").write("")
+    return presets
+
+
+def _create_browser(tmpdir):
+    library = PresetLibrary(str(tmpdir.join("index.json")), IndBiosConfig)
+    return PresetBrowser(
+        library, str(tmpdir.join("profile", "swatches.bin")), _COLOUR_FIELDS
+    )
+
+
+def test_list_presets(tmpdir, preset_directory):
+    """Ensures that the presets in a directory are listed with their colours"""
+    browser = _create_browser(tmpdir)
+    assert browser.get_colour_fields() == _COLOUR_FIELDS
+
+    default = str(preset_directory.join("default.cfg"))
+    green = str(preset_directory.join("green.cfg"))
+    assert browser.list_presets(str(preset_directory)) == [default, green]
+    assert browser.get_colours(green) == {
+        "GLOWCOLOR": "0xFF00FF00",
+        "SCENECOLOR1": "0xFF35FF1A",
+    }
+    assert browser.get_colours(str(preset_directory.join("missing.cfg"))) is None
+
+
+def test_swatches_saved(tmpdir, preset_directory, mocker):
+    """Ensures that the swatch file is created and that a new browser shows
+    the same colours without writing it again
+    """
+    green = str(preset_directory.join("green.cfg"))
+    _create_browser(tmpdir).list_presets(str(preset_directory))
+    assert tmpdir.join("profile", "swatches.bin").check(file=1)
+
+    save = mocker.spy(PresetSwatches, "save")
+    browser = _create_browser(tmpdir)
+    assert browser.get_colours(green)["GLOWCOLOR"] == "0xFF00FF00"
+    browser.list_presets(str(preset_directory))
+    assert save.call_count == 0
@@ -0,0 +1,69 @@
+"""Tests for configs.preset_library.PresetLibrary"""
+import os
+
+import pytest
+
+from lib.configs import ConfigPresetDoesNotExistError, IndBiosConfig, PresetLibrary
+
+
+@pytest.fixture
+def preset_directory(tmpdir):
+    """A directory containing a valid and an invalid preset"""
+    presets = tmpdir.mkdir("presets")
+    presets.join("green.cfg").write("GLOWCOLOR=0x00FF00\nFANSPEED=20\n")
+    presets.join("invalid.cfg").write("GLOWCOLOR=green\n")
+    presets.join("readme.txt").write("Not a preset\n")
+    return presets
+
+
+def _create_library(tmpdir):
+    return PresetLibrary(str(tmpdir.join("index", "presets.json")), IndBiosConfig)
+
+
+def test_scan(tmpdir, preset_directory):
+    """Ensures that every preset is indexed along with its values and
+    whether it is valid
+    """
+    library = _create_library(tmpdir)
+    green, invalid = library.scan(str(preset_directory))
+    assert green == str(preset_directory.join("green.cfg"))
+
+    assert library.get(green)["valid"]
+    values = library.get_values(green)
+    assert values["GLOWCOLOR"] == 0xFF00FF00
+    assert values["FANSPEED"] == 20
+    assert values["AVCHECK"] == IndBiosConfig().get("AVCHECK")
+
+    assert not library.get(invalid)["valid"]
+    assert list(library.get(invalid)["invalid_fields"]) == ["GLOWCOLOR"]
+
+
+def test_only_changed_presets_read_again(tmpdir, preset_directory, mocker):
+    """Ensures that the index is persisted and presets are only read again
+    if they have changed
+    """
+    green = str(preset_directory.join("green.cfg"))
+    _create_library(tmpdir).scan(str(preset_directory))
+
+    read = mocker.spy(IndBiosConfig, "read")
+    library = _create_library(tmpdir)
+    library.scan(str(preset_directory))
+    assert read.call_count == 0
+    assert library.get_values(green)["FANSPEED"] == 20
+
+    preset_directory.join("green.cfg").write("FANSPEED=30\n")
+    os.utime(green, (0, 0))
+    assert library.get_values(green)["FANSPEED"] == 30
+    assert read.call_count == 1
+
+
+def test_deleted_presets_removed(tmpdir, preset_directory):
+    """Ensures that presets are forgotten once they are deleted"""
+    library = _create_library(tmpdir)
+    library.scan(str(preset_directory))
+    preset_directory.join("invalid.cfg").remove()
+    assert library.scan(str(preset_directory)) == [
+        str(preset_directory.join("green.cfg"))
+    ]
+    with pytest.raises(ConfigPresetDoesNotExistError):
+        library.get(str(preset_directory.join("invalid.cfg")))
@@ -0,0 +1,63 @@
+"""Tests for configs.preset_swatches.PresetSwatches"""
+import pytest
+
+from lib.configs import IndBiosConfig, PresetLibrary, PresetSwatches
+
+_COLOUR_FIELDS = ("GLOWCOLOR", "FOG1COLOR")
+
+
+def test_save_and_load(tmpdir):
+    """Ensures that swatches survive being saved and loaded"""
+    swatch_filename = str(tmpdir.join("swatches.bin"))
+    swatches = PresetSwatches(_COLOUR_FIELDS)
+    swatches.set("green.cfg", {"GLOWCOLOR": 0xFF00FF00, "FOG1COLOR": 0x8000FF00})
+    swatches.save(swatch_filename)
+
+    loaded_swatches = PresetSwatches.load(swatch_filename, _COLOUR_FIELDS)
+    assert loaded_swatches.filenames() == ["green.cfg"]
+    assert loaded_swatches.get("green.cfg") == (0xFF00FF00, 0x8000FF00)
+    assert loaded_swatches.get_hex_colours("green.cfg") == {
+        "GLOWCOLOR": "0xFF00FF00",
+        "FOG1COLOR": "0x8000FF00",
+    }
+    assert loaded_swatches.get("missing.cfg") is None
+
+
+@pytest.mark.parametrize("data", (None, "", "SWCH", "garbage" * 10))
+def test_load_invalid(tmpdir, data):
+    """Ensures that missing or corrupt files result in no swatches"""
+    swatch_filename = tmpdir.join("swatches.bin")
+    if data is not None:
+        swatch_filename.write(data, mode="wb")
+    assert PresetSwatches.load(str(swatch_filename), _COLOUR_FIELDS).filenames() == []
+
+
+def test_load_different_colour_fields(tmpdir):
+    """Ensures that swatches made for different fields are not used"""
+    swatch_filename = str(tmpdir.join("swatches.bin"))
+    swatches = PresetSwatches(_COLOUR_FIELDS)
+    swatches.set("green.cfg", {"GLOWCOLOR": 0xFF00FF00, "FOG1COLOR": 0x8000FF00})
+    swatches.save(swatch_filename)
+    loaded_swatches = PresetSwatches.load(swatch_filename, ("GLOWCOLOR",))
+    assert loaded_swatches.filenames() == []
+
+
+def test_update_from_library(tmpdir):
+    """Ensures that there is a swatch for each preset in a directory"""
+    presets = tmpdir.mkdir("presets")
+    presets.join("green.cfg").write("GLOWCOLOR=0x00FF00\n")
+    presets.join("default.cfg").write("")
+    library = PresetLibrary(str(tmpdir.join("index.json")), IndBiosConfig)
+
+    swatches = PresetSwatches(("GLOWCOLOR", "SCENECOLOR1"))
+    assert swatches.update_from_library(library, str(presets))
+    assert not swatches.update_from_library(library, str(presets))
+
+    green = swatches.get_hex_colours(str(presets.join("green.cfg")))
+    assert green["GLOWCOLOR"] == "0xFF00FF00"
+    default = swatches.get_hex_colours(str(presets.join("default.cfg")))
+    assert default["SCENECOLOR1"] == "0xFF35FF1A"
+
+    presets.join("green.cfg").remove()
+    assert swatches.update_from_library(library, str(presets))
+    assert swatches.filenames() == [str(presets.join("default.cfg"))]
@@ -1,11 +1,17 @@
-"""Tests for configs.validators.ColourValidator and
-configs.validators.ColourWithAlphaValidator
+"""Tests for configs.validators.ColourValidator,
+configs.validators.ColourWithAlphaValidator and
+configs.validators.ARGBColourValidator
 
-Note for colours the Python and config file formats are the same
+Note for ColourValidator and ColourWithAlphaValidator the Python and config
+file formats are the same
 """
 import pytest
 from lib.configs import ConfigFieldValueError
-from lib.configs.validators import ColourValidator, ColourWithAlphaValidator
+from lib.configs.validators import (
+    ARGBColourValidator,
+    ColourValidator,
+    ColourWithAlphaValidator,
+)
 
 _COLOUR_VALIDATOR = ColourValidator()
 _COLOUR_WITH_ALPHA_VALIDATOR = ColourWithAlphaValidator()
@@ -104,3 +110,53 @@ def test_validate_colour_in_config_format_invalid(value):
     with pytest.raises(ConfigFieldValueError) as excinfo:
         _COLOUR_WITH_ALPHA_VALIDATOR.validate_in_config_file_format(value)
     assert str(value) in str(excinfo.value)
+
+
+_VALID_ARGB_COLOURS_NO_ALPHA = (0xFFFFFFFF, 0xFF123456, 0xFF000000)
+_VALID_ARGB_COLOURS_WITH_ALPHA = _VALID_ARGB_COLOURS_NO_ALPHA + (
+    0x00000000,
+    0x12345678,
+)
+_INVALID_ARGB_COLOURS = (True, False, -1, 0x100000000, 4.5, "0xFFFFFFFF", None)
+
+
+@pytest.mark.parametrize(
+    "with_alpha_channel, value",
+    tuple((False, value) for value in _VALID_ARGB_COLOURS_NO_ALPHA)
+    + tuple((True, value) for value in _VALID_ARGB_COLOURS_WITH_ALPHA),
+)
+def test_validate_argb_colour_in_python_format_valid(with_alpha_channel, value):
+    """Ensures that no errors are thrown when validating valid ARGB ints"""
+    # No error thrown
+    ARGBColourValidator(with_alpha_channel).validate_in_python_format(value)
+
+
+@pytest.mark.parametrize(
+    "with_alpha_channel, value",
+    tuple((False, value) for value in _INVALID_ARGB_COLOURS + (0x00123456,))
+    + tuple((True, value) for value in _INVALID_ARGB_COLOURS),
+)
+def test_validate_argb_colour_in_python_format_invalid(with_alpha_channel, value):
+    """Ensures that a ConfigFieldValueError is raised when validating values
+    that aren't ARGB ints, or colours without an alpha channel that aren't
+    fully opaque
+    """
+    with pytest.raises(ConfigFieldValueError):
+        ARGBColourValidator(with_alpha_channel).validate_in_python_format(value)
+
+
+@pytest.mark.parametrize(
+    "with_alpha_channel, value, valid",
+    tuple((False, value, True) for value in _VALID_COLOURS_NO_ALPHA)
+    + tuple((False, value, False) for value in _VALID_COLOURS_WITH_ALPHA)
+    + tuple((True, value, True) for value in _VALID_COLOURS_WITH_ALPHA)
+    + tuple((True, value, False) for value in _VALID_COLOURS_NO_ALPHA),
+)
+def test_validate_argb_colour_in_config_format(with_alpha_channel, value, valid):
+    """Ensures that ARGB colours are hex strings in config file format"""
+    validator = ARGBColourValidator(with_alpha_channel)
+    if valid:
+        validator.validate_in_config_file_format(value)
+    else:
+        with pytest.raises(ConfigFieldValueError):
+            validator.validate_in_config_file_format(value)
@@ -3,6 +3,7 @@ import warnings
 
 import pytest
 
+from lib.configs.colour import argb_to_hex_colour
 from lib.controls import ColourPicker
 from .utils import create_window_place_control
 
@@ -37,11 +38,13 @@ def create_colour_picker(mocker, **kwargs):
 
 
 _TEST_PARAMS = (
-    ("FFFFFFFF", "FFFFFFFF", True),
-    ("000000", "000000", False),
-    ("0xAAFFAA", "0xAAFFAA", True),
-    ("0xAAAAFFBB", "0xAAAAFFBB", True),
-    ("0xAAAAFFBB", "0xAAFFBB", False),
+    ("FFFFFFFF", 0xFFFFFFFF, True),
+    ("000000", 0xFF000000, False),
+    ("0xAAFFAA", 0xFFAAFFAA, True),
+    ("0xAAAAFFBB", 0xAAAAFFBB, True),
+    ("0xAAAAFFBB", 0xFFAAFFBB, False),
+    (0xAAAAFFBB, 0xAAAAFFBB, True),
+    (0xAAAAFFBB, 0xFFAAFFBB, False),
 )
 
 
@@ -53,8 +56,7 @@ def test_colour_picker_initial_colour(
 ):
     """Ensure that the initial colour is set correctly
     
-    The alpha component should be removed from the colour if it is present and
-    alpha_selector is False
+    The colour should be made fully opaque if alpha_selector is False
     """
     colour_picker = create_colour_picker(
         mocker, default_colour=default_colour, alpha_selector=alpha_selector
@@ -64,7 +66,9 @@ def test_colour_picker_initial_colour(
 
     create_window_place_control(colour_picker)
 
-    button.setLabel.assert_called_with(colour_actually_used)
+    button.setLabel.assert_called_with(
+        argb_to_hex_colour(colour_actually_used, alpha_selector)
+    )
     icon.setColorDiffuse.assert_called_with(colour_actually_used)
 
     assert colour_picker.get_value() == colour_actually_used, "colour set correctly"
@@ -83,7 +87,38 @@ def test_colour_picker_set_colour(
     create_window_place_control(colour_picker)
     colour_picker.set_value(colour_to_set)
 
-    button.setLabel.assert_called_with(colour_actually_used)
+    button.setLabel.assert_called_with(
+        argb_to_hex_colour(colour_actually_used, alpha_selector)
+    )
     icon.setColorDiffuse.assert_called_with(colour_actually_used)
 
     assert colour_picker.get_value() == colour_actually_used, "colour set correctly"
+
+
+def test_colour_picker_windows_released(mocker):
+    """Ensures that the reused colour picker window doesn't keep the last
+    colour picker alive and that the windows can be destroyed
+    """
+    from lib.controls import colour_picker as colour_picker_module
+
+    window = mocker.Mock()
+    mocker.patch.object(
+        colour_picker_module, "_ColourPickerWindow", return_value=window
+    )
+    mocker.patch.dict(colour_picker_module._COLOUR_PICKER_WINDOWS, clear=True)
+
+    assert colour_picker_module._get_colour_picker_window(True) is window
+    assert colour_picker_module._get_colour_picker_window(True) is window
+    colour_picker_module.close_colour_picker_windows()
+    assert colour_picker_module._COLOUR_PICKER_WINDOWS == {}
+
+
+def test_pick_colour_forgets_callback(mocker):
+    """Ensures that the window forgets the callback once it has been closed"""
+    from lib.controls.colour_picker import _ColourPickerWindow
+
+    window = mocker.Mock()
+    # Called on a mock so that a real window isn't needed
+    _ColourPickerWindow.pick_colour.__func__(window, "title", 0xFFFFFFFF, mocker.Mock())
+    window.doModal.assert_called_once_with()
+    assert window._colour_chosen_callback is None
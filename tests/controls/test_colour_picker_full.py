@@ -21,10 +21,12 @@ def create_colour_picker(mocker, **kwargs):
 
 
 _TEST_PARAMS = (
-    ("FFFFFFFF", "FFFFFFFF", True),
-    ("000000", "000000", False),
-    ("0xAAAAFFBB", "0xAAAAFFBB", True),
-    ("0xAAAAFFBB", "0xAAFFBB", False),
+    ("FFFFFFFF", 0xFFFFFFFF, True),
+    ("000000", 0xFF000000, False),
+    ("0xAAAAFFBB", 0xAAAAFFBB, True),
+    ("0xAAAAFFBB", 0xFFAAFFBB, False),
+    (0xAAAAFFBB, 0xAAAAFFBB, True),
+    (0xAAAAFFBB, 0xFFAAFFBB, False),
 )
 
 
@@ -36,8 +38,7 @@ def test_colour_picker_initial_colour(
 ):
     """Ensure that the initial colour is set correctly
     
-    The alpha component should be removed from the colour if it is present and
-    alpha_selector is False
+    The colour should be made fully opaque if alpha_selector is False
     """
     colour_picker = create_colour_picker(
         mocker, default_colour=default_colour, alpha_selector=alpha_selector
@@ -55,16 +56,35 @@ def test_colour_picker_set_colour(
 ):
     colour_picker = create_colour_picker(mocker, alpha_selector=alpha_selector)
     create_window_place_control(colour_picker)
-
-    if colour_picker.get_value().startswith("0x") and not colour_to_set.startswith(
-        "0x"
-    ):
-        colour_actually_used = "0x" + colour_actually_used
-    elif not colour_picker.get_value().startswith("0x") and colour_to_set.startswith(
-        "0x"
-    ):
-        colour_actually_used = colour_actually_used[2:]
-
     colour_picker.set_value(colour_to_set)
 
     assert colour_picker.get_value() == colour_actually_used, "colour set correctly"
+
+
+@pytest.mark.parametrize(
+    "shift, value, expected_colour",
+    ((24, 0x80, 0x80AABBCC), (16, 0x00, 0xFF00BBCC), (0, 0x11, 0xFFAABB11)),
+)
+def test_colour_picker_modify_colour(mocker, shift, value, expected_colour):
+    """Ensures that moving a slider only changes its component of the colour"""
+    colour_picker = create_colour_picker(
+        mocker, default_colour=0xFFAABBCC, alpha_selector=True
+    )
+    create_window_place_control(colour_picker)
+    colour_picker._modify_colour(shift, value)
+    assert colour_picker.get_value() == expected_colour
+
+
+def test_colour_picker_set_colour_moves_sliders(mocker):
+    """Ensures that the sliders match the colour after it has been set, so
+    that the picker can be reused for a different colour
+    """
+    colour_picker = create_colour_picker(mocker, alpha_selector=True)
+    create_window_place_control(colour_picker)
+    colour_picker.set_value(0x80112233)
+    assert [slider.get_value() for _, slider in colour_picker._sliders] == [
+        0x80,
+        0x11,
+        0x22,
+        0x33,
+    ]
@@ -0,0 +1,105 @@
+"""Tests for :lib.controls._layout:"""
+from lib.controls._layout import Layout, measure, set_layout
+
+
+class _FakeControl(object):
+    def __init__(self, x, y, width, height):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.queries = 0
+
+    def getPosition(self):
+        self.queries += 1
+        return self.x, self.y
+
+    def getWidth(self):
+        self.queries += 1
+        return self.width
+
+    def getHeight(self):
+        self.queries += 1
+        return self.height
+
+
+class _FakeWindow(object):
+    pass
+
+
+def test_measure_without_layout():
+    """Ensures that controls are queried when the window has no layout"""
+    control = _FakeControl(1, 2, 3, 4)
+    assert measure(_FakeWindow(), control, (0, 0, 1, 1)) == (1, 2, 3, 4)
+    assert control.queries == 3
+
+
+def test_layout_recorded_and_replayed():
+    """Ensures that a layout records each measurement in order and that a
+    layout created from those measurements replays them without querying the
+    controls
+    """
+    window = _FakeWindow()
+    controls = [_FakeControl(10, 20, 30, 40), _FakeControl(50, 60, 70, 80)]
+    placements = [(0, 0, 1, 2), (1, 0, 1, 4)]
+
+    layout = Layout()
+    set_layout(window, layout)
+    assert [
+        measure(window, control, placement)
+        for control, placement in zip(controls, placements)
+    ] == [(10, 20, 30, 40), (50, 60, 70, 80)]
+    assert layout.get_measurements() == [
+        (("_FakeControl", 0, 0, 1, 2), (10, 20, 30, 40)),
+        (("_FakeControl", 1, 0, 1, 4), (50, 60, 70, 80)),
+    ]
+    assert not layout.used_cache()
+
+    new_controls = [_FakeControl(0, 0, 0, 0), _FakeControl(0, 0, 0, 0)]
+    layout = Layout(layout.get_measurements())
+    set_layout(window, layout)
+    assert [
+        measure(window, control, placement)
+        for control, placement in zip(new_controls, placements)
+    ] == [(10, 20, 30, 40), (50, 60, 70, 80)]
+    assert [control.queries for control in new_controls] == [0, 0]
+    assert layout.used_cache()
+
+    set_layout(window, None)
+    assert measure(window, new_controls[0], placements[0]) == (0, 0, 0, 0)
+
+
+def test_layout_with_more_controls_than_cached():
+    """Ensures that controls beyond the end of the cached layout are measured
+    and that the cache is then known to be out of date
+    """
+    layout = Layout([(("_FakeControl", 0, 0, 1, 1), (1, 1, 1, 1))])
+    assert layout.measure(_FakeControl(9, 9, 9, 9), (0, 0, 1, 1)) == (1, 1, 1, 1)
+    assert layout.measure(_FakeControl(2, 3, 4, 5), (1, 0, 1, 1)) == (2, 3, 4, 5)
+    assert not layout.used_cache()
+
+
+class _OtherControl(_FakeControl):
+    pass
+
+
+def test_mismatched_control_remeasured():
+    """Ensures that once a control doesn't match the cached layout, it and
+    every control after it are measured rather than replayed
+    """
+    cached = [
+        (("_FakeControl", 0, 0, 1, 1), (1, 1, 1, 1)),
+        (("_FakeControl", 1, 0, 1, 1), (2, 2, 2, 2)),
+        (("_FakeControl", 2, 0, 1, 1), (3, 3, 3, 3)),
+    ]
+    layout = Layout(cached)
+    assert layout.measure(_FakeControl(9, 9, 9, 9), (0, 0, 1, 1)) == (1, 1, 1, 1)
+    # Placed with a different span
+    assert layout.measure(_FakeControl(5, 5, 5, 5), (1, 0, 1, 2)) == (5, 5, 5, 5)
+    # Matches the cache, but the cache can no longer be trusted
+    assert layout.measure(_FakeControl(6, 6, 6, 6), (2, 0, 1, 1)) == (6, 6, 6, 6)
+    assert not layout.used_cache()
+
+    layout = Layout(cached)
+    assert layout.measure(_OtherControl(7, 7, 7, 7), (0, 0, 1, 1)) == (7, 7, 7, 7)
+    assert not layout.used_cache()
@@ -0,0 +1,108 @@
+"""Tests for :lib.controls._slider_dispatcher.SliderDispatcher:"""
+import pyxbmct
+
+from lib.controls._slider_dispatcher import SliderDispatcher
+
+
+class _FakeWindow(object):
+    def __init__(self):
+        self.focus_id = None
+        self.events = {}
+
+    def connectEventList(self, events, callback):
+        for event in events:
+            self.events[event] = callback
+
+    def getFocusId(self):
+        if self.focus_id is None:
+            raise RuntimeError("Nothing has focus")
+        return self.focus_id
+
+
+def test_one_dispatcher_per_window():
+    """Ensures that sliders in the same window share a dispatcher"""
+    window = _FakeWindow()
+    dispatcher = SliderDispatcher.for_window(window)
+    assert SliderDispatcher.for_window(window) is dispatcher
+    assert SliderDispatcher.for_window(_FakeWindow()) is not dispatcher
+
+
+def test_actions_routed_to_focussed_slider(mocker):
+    """Ensures that only the slider that has focus is moved"""
+    window = _FakeWindow()
+    dispatcher = SliderDispatcher.for_window(window)
+    sliders = {
+        control_id: (mocker.Mock(), mocker.Mock(), mocker.Mock())
+        for control_id in (1, 2, 3)
+    }
+    for control_id, (increase, decrease, flush) in sliders.items():
+        dispatcher.add(control_id, increase, decrease, flush)
+
+    window.focus_id = 2
+    window.events[pyxbmct.ACTION_MOVE_RIGHT]()
+    window.events[pyxbmct.ACTION_MOVE_LEFT]()
+    sliders[2][0].assert_called_once_with()
+    sliders[2][1].assert_called_once_with()
+    for control_id in (1, 3):
+        sliders[control_id][0].assert_not_called()
+        sliders[control_id][1].assert_not_called()
+
+    dispatcher.remove(2)
+    window.events[pyxbmct.ACTION_MOVE_RIGHT]()
+    sliders[2][0].assert_called_once_with()
+
+    # Nothing happens if nothing, or something that isn't a slider, has focus
+    window.focus_id = None
+    window.events[pyxbmct.ACTION_MOVE_RIGHT]()
+    window.focus_id = 10
+    window.events[pyxbmct.ACTION_MOUSE_WHEEL_DOWN]()
+
+
+class _FakeAction(object):
+    def __init__(self, action_id):
+        self._action_id = action_id
+
+    def getId(self):
+        return self._action_id
+
+
+def test_flush_window(mocker):
+    """Ensures that waiting slider updates are carried out before anything
+    else is handled, except for moves of the slider that has focus, and that
+    only the sliders with an update waiting are flushed
+    """
+    window = _FakeWindow()
+    # Nothing to do for a window without sliders
+    SliderDispatcher.flush_window(window)
+
+    dispatcher = SliderDispatcher.for_window(window)
+    flushes = {control_id: mocker.Mock() for control_id in (1, 2, 3)}
+    for control_id, flush in flushes.items():
+        # Moving slider 3 never leaves an update waiting
+        increase = mocker.Mock(return_value=control_id != 3)
+        dispatcher.add(control_id, increase, mocker.Mock(), flush)
+    SliderDispatcher.flush_window(window)
+    for flush in flushes.values():
+        flush.assert_not_called()
+
+    for control_id in (1, 2, 3):
+        window.focus_id = control_id
+        window.events[pyxbmct.ACTION_MOVE_RIGHT]()
+
+    window.focus_id = 1
+    SliderDispatcher.flush_window(window, _FakeAction(pyxbmct.ACTION_MOVE_RIGHT))
+    flushes[1].assert_not_called()
+    flushes[2].assert_called_once_with()
+
+    SliderDispatcher.flush_window(window, _FakeAction(pyxbmct.ACTION_MOVE_DOWN))
+    flushes[1].assert_called_once_with()
+
+    SliderDispatcher.flush_window(window)
+    flushes[1].assert_called_once_with()
+    flushes[2].assert_called_once_with()
+    flushes[3].assert_not_called()
+
+    window.focus_id = 2
+    window.events[pyxbmct.ACTION_MOVE_RIGHT]()
+    SliderDispatcher.flush_window(window)
+    assert flushes[2].call_count == 2
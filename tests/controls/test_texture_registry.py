@@ -0,0 +1,75 @@
+"""Tests for :lib.controls._texture_registry:"""
+import os
+
+import pytest
+
+from lib.controls import _texture_registry
+from lib.controls._texture_registry import (
+    count_textures_used,
+    get_texture,
+    get_textures_used,
+    record_texture_used,
+)
+
+
+class _FakeWindow(object):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def empty_registry(mocker):
+    mocker.patch.dict(_texture_registry._MEDIA_TEXTURES, clear=True)
+    mocker.patch.dict(_texture_registry._CHECKED_TEXTURES, clear=True)
+
+
+def test_media_texture_resolved_once(mocker):
+    """Ensures that each media filename is only resolved and checked once and
+    the same path is returned every time
+    """
+    get_media_filename = mocker.patch.object(
+        _texture_registry,
+        "get_media_filename",
+        side_effect=lambda filename: os.path.join("media", filename),
+    )
+    isfile = mocker.patch("os.path.isfile", return_value=True)
+
+    texture = get_texture("folder.png")
+    assert texture == os.path.join("media", "folder.png")
+    for _ in range(5):
+        assert get_texture("folder.png") is texture
+    get_media_filename.assert_called_once_with("folder.png")
+    isfile.assert_called_once_with(texture)
+
+
+def test_full_path_texture_shared(mocker):
+    """Ensures that textures given as full paths are only checked once and
+    equal paths are turned into the same string
+    """
+    isfile = mocker.patch("os.path.isfile", return_value=True)
+    texture = get_texture("".join(["skin", "/slider.png"]), full_path=True)
+    assert get_texture("skin/slider.png", full_path=True) is texture
+    isfile.assert_called_once_with("skin/slider.png")
+
+
+def test_missing_texture_logged(mocker):
+    """Ensures that a warning is logged (once) for textures that don't exist"""
+    mocker.patch("os.path.isfile", return_value=False)
+    log = mocker.patch("xbmc.log")
+    assert get_texture("missing.png", full_path=True) == "missing.png"
+    get_texture("missing.png", full_path=True)
+    assert log.call_count == 1
+
+
+def test_textures_counted_per_window():
+    """Ensures that each distinct texture used in a window is counted once"""
+    window = _FakeWindow()
+    other_window = _FakeWindow()
+    assert count_textures_used(window) == 0
+
+    for texture in ("a.png", "b.png", "a.png", "a.png"):
+        record_texture_used(window, texture)
+    record_texture_used(other_window, "c.png")
+
+    assert count_textures_used(window) == 2
+    assert get_textures_used(window) == frozenset(("a.png", "b.png"))
+    assert get_textures_used(other_window) == frozenset(("c.png",))
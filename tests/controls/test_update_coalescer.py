@@ -0,0 +1,135 @@
+"""Tests for :lib.controls._update_coalescer.UpdateCoalescer:"""
+import threading
+
+import pytest
+
+from lib.controls._update_coalescer import UpdateCoalescer
+
+
+class _FakeClock(object):
+    def __init__(self):
+        self.time = 100.0
+
+    def __call__(self):
+        return self.time
+
+
+class _FakeScheduler(object):
+    """Records the scheduled calls instead of making them"""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def __call__(self, delay, callback):
+        self.scheduled.append((delay, callback))
+
+    def run(self):
+        scheduled, self.scheduled = self.scheduled, []
+        for _, callback in scheduled:
+            callback()
+
+
+@pytest.fixture
+def scheduler():
+    return _FakeScheduler()
+
+
+@pytest.fixture
+def coalescer(scheduler):
+    updates = []
+    clock = _FakeClock()
+    coalescer = UpdateCoalescer(
+        lambda: updates.append(clock.time),
+        interval=0.1,
+        clock=clock,
+        schedule=scheduler,
+    )
+    return coalescer, clock, updates
+
+
+def test_first_request_is_immediate(coalescer):
+    """Ensures that an update happens straight away after a quiet period"""
+    coalescer, clock, updates = coalescer
+    coalescer.request()
+    assert updates == [100.0]
+    assert not coalescer.is_pending()
+
+
+def test_burst_is_coalesced(coalescer):
+    """Ensures that requests made too soon after an update wait, and are
+    carried out by the first request once the interval has passed
+    """
+    coalescer, clock, updates = coalescer
+    coalescer.request()
+    clock.time += 0.03
+    for _ in range(10):
+        coalescer.request()
+    assert updates == [100.0]
+    assert coalescer.is_pending()
+
+    clock.time += 0.08
+    coalescer.request()
+    assert updates == [100.0, pytest.approx(100.11)]
+    assert not coalescer.is_pending()
+
+
+def test_trailing_flush(coalescer, scheduler):
+    """Ensures that the last request of a burst is carried out once the
+    interval has passed, without any further requests
+    """
+    coalescer, clock, updates = coalescer
+    coalescer.request()
+    assert scheduler.scheduled == []
+    clock.time += 0.03
+    for _ in range(10):
+        coalescer.request()
+    assert len(scheduler.scheduled) == 1
+    assert scheduler.scheduled[0][0] == pytest.approx(0.07)
+
+    clock.time += 0.07
+    scheduler.run()
+    assert updates == [100.0, pytest.approx(100.1)]
+    assert not coalescer.is_pending()
+
+    # Nothing is left to do if the update has already happened
+    coalescer.request()
+    coalescer.flush()
+    scheduler.run()
+    assert updates == [100.0, pytest.approx(100.1), pytest.approx(100.1)]
+
+
+def test_trailing_flush_timer():
+    """Ensures that the default timer carries out the last request"""
+    updated = threading.Event()
+    coalescer = UpdateCoalescer(updated.set, interval=0.5)
+    coalescer.request()
+    updated.clear()
+    coalescer.request()
+    assert coalescer.is_pending()
+    assert updated.wait(5)
+    assert not coalescer.is_pending()
+
+
+def test_cancel(coalescer):
+    """Ensures that cancelled requests never result in an update"""
+    coalescer, clock, updates = coalescer
+    coalescer.request()
+    coalescer.request()
+    coalescer.cancel()
+    coalescer.flush()
+    assert updates == [100.0]
+
+
+def test_flush(coalescer):
+    """Ensures that flush carries out a waiting update straight away, and
+    does nothing if there isn't one
+    """
+    coalescer, clock, updates = coalescer
+    coalescer.flush()
+    assert updates == []
+    coalescer.request()
+    coalescer.request()
+    coalescer.flush()
+    assert updates == [100.0, 100.0]
+    coalescer.flush()
+    assert updates == [100.0, 100.0]
@@ -0,0 +1,48 @@
+"""Tests for lib._lazy_module"""
+import sys
+
+import pytest
+
+from lib._lazy_module import make_module_lazy
+
+
+@pytest.fixture
+def lazy_package(tmpdir, monkeypatch):
+    """A package with two modules, that imports them lazily"""
+    package = tmpdir.mkdir("lazy_test_package")
+    package.join("__init__.py").write(
+        "from lib._lazy_module import make_module_lazy\n"
+        "make_module_lazy(__name__, {'One': '.one', 'Two': '.two'})\n"
+    )
+    package.join("one.py").write("class One(object):\n    pass\n")
+    package.join("two.py").write("from .one import One\n\nclass Two(One):\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmpdir))
+    yield
+    for module_name in list(sys.modules):
+        if module_name.startswith("lazy_test_package"):
+            del sys.modules[module_name]
+
+
+def test_modules_imported_when_used(lazy_package):
+    """Ensures that a module is only imported once something from it is used"""
+    import lazy_test_package
+
+    assert "lazy_test_package.one" not in sys.modules
+    assert lazy_test_package.One.__name__ == "One"
+    assert "lazy_test_package.one" in sys.modules
+    assert "lazy_test_package.two" not in sys.modules
+
+    from lazy_test_package import Two
+
+    assert issubclass(Two, lazy_test_package.One)
+    assert lazy_test_package.__all__ == ["One", "Two"]
+
+
+def test_unknown_attribute(lazy_package):
+    """Ensures that using something that doesn't exist still fails"""
+    import lazy_test_package
+
+    with pytest.raises(AttributeError):
+        lazy_test_package.Three
+    with pytest.raises(ImportError):
+        from lazy_test_package import Three
@@ -0,0 +1,90 @@
+"""Tests for :lib.tracing:"""
+import pytest
+
+from lib import tracing
+
+
+@pytest.fixture(autouse=True)
+def empty_ring_buffer():
+    tracing.clear()
+    tracing.set_enabled(True)
+    yield
+    tracing.clear()
+    # Off unless the addon turns it on
+    tracing.set_enabled(False)
+
+
+def test_nested_spans():
+    """Ensures that nested spans are recorded in the order that they started
+    along with how deeply they are nested
+    """
+
+    @tracing.traced("inner")
+    def inner():
+        return 5
+
+    with tracing.span("outer"):
+        assert inner() == 5
+        with tracing.span("middle"):
+            inner()
+    inner()
+
+    spans = tracing.get_spans()
+    assert [(span.name, span.depth) for span in spans] == [
+        ("outer", 0),
+        ("inner", 1),
+        ("middle", 1),
+        ("inner", 2),
+        ("inner", 0),
+    ]
+    assert all(span.duration >= 0 for span in spans)
+    assert spans[0].duration >= spans[2].duration
+
+
+def test_span_recorded_on_exception():
+    """Ensures that a span is still recorded (and the nesting is undone) if
+    its body raises an exception
+    """
+
+    @tracing.traced("fails")
+    def fails():
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        fails()
+    with tracing.span("after"):
+        pass
+    assert [(span.name, span.depth) for span in tracing.get_spans()] == [
+        ("fails", 0),
+        ("after", 0),
+    ]
+
+
+def test_disabled():
+    """Ensures that nothing is recorded whilst tracing is disabled"""
+    tracing.set_enabled(False)
+    with tracing.span("not recorded"):
+        tracing.traced("not recorded either")(lambda: None)()
+    assert tracing.get_spans() == []
+
+
+def test_ring_buffer_keeps_most_recent_spans():
+    """Ensures that only the most recent spans are kept"""
+    for index in range(tracing.MAX_SPANS + 10):
+        with tracing.span(str(index)):
+            pass
+    spans = tracing.get_spans()
+    assert len(spans) == tracing.MAX_SPANS
+    assert spans[0].name == "10"
+
+
+def test_dump():
+    """Ensures that each span is written out, indented by its depth"""
+    lines = []
+    with tracing.span("outer"):
+        with tracing.span("inner"):
+            pass
+    tracing.dump(lines.append)
+    assert len(lines) == 2
+    assert lines[0].startswith("outer: ") and lines[0].endswith("ms")
+    assert lines[1].startswith("  inner: ")
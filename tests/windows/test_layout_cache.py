@@ -0,0 +1,31 @@
+"""Tests for :lib.windows.config_editors._layout_cache.LayoutCache:"""
+from lib.windows.config_editors._layout_cache import LayoutCache
+
+
+def test_layout_saved_between_sessions(tmpdir):
+    """Ensures that a layout stored by one cache can be read by another that
+    uses the same file
+    """
+    filename = str(tmpdir.join("profile", "layout_cache.json"))
+    cache = LayoutCache(filename)
+    assert cache.get("tab") is None
+    measurements = [
+        (("Button", 0, 0, 1, 2), (1, 2, 3, 4)),
+        (("Image", 0, 1, 1, 1), (5, 6, 7, 8)),
+    ]
+    cache.set("tab", measurements)
+    assert LayoutCache(filename).get("tab") == measurements
+    assert LayoutCache(filename).get("other tab") is None
+
+
+def test_corrupt_file_ignored(tmpdir):
+    """Ensures that a corrupt file or layout is treated as missing"""
+    cache_file = tmpdir.join("layout_cache.json")
+    cache_file.write('{"tab": [[["Button"], [1, 2, 3, 4]]], "other tab": 7')
+    assert LayoutCache(str(cache_file)).get("tab") is None
+    cache_file.write(
+        '{"tab": [[["Button", 0], [1, 2, 3]]], "other tab": 7,'
+        ' "old tab": [[1, 2, 3, 4]], "empty identity": [[[], [1, 2, 3, 4]]]}'
+    )
+    for key in ("tab", "other tab", "old tab", "empty identity"):
+        assert LayoutCache(str(cache_file)).get(key) is None
@@ -0,0 +1,37 @@
+"""Tests for :lib.windows.config_editors._navigation_cache.NavigationCache:"""
+from lib.windows.config_editors._navigation_cache import NavigationCache
+
+_PLACEMENTS = [("Button", 0, 0, 1, 2, 5, 5), ("FakeSlider", 1, 0, 1, 3, 5, 5)]
+_EDGES = [(0, "controlDown", 1), (1, "controlUp", 0)]
+
+
+def test_graph_saved_between_sessions(tmpdir):
+    """Ensures that a graph stored by one cache can be read by another that
+    uses the same file
+    """
+    filename = str(tmpdir.join("profile", "navigation_cache.json"))
+    cache = NavigationCache(filename)
+    assert cache.get("tab", 2, _PLACEMENTS) is None
+    cache.set("tab", 2, _PLACEMENTS, _EDGES)
+    assert NavigationCache(filename).get("tab", 2, _PLACEMENTS) == _EDGES
+    assert NavigationCache(filename).get("other tab", 2, _PLACEMENTS) is None
+
+
+def test_graph_for_different_controls_ignored(tmpdir):
+    """Ensures that a graph isn't used for a different number of controls or
+    for controls that have been placed differently
+    """
+    cache = NavigationCache(str(tmpdir.join("navigation_cache.json")))
+    cache.set("tab", 2, _PLACEMENTS, _EDGES)
+    assert cache.get("tab", 3, _PLACEMENTS) is None
+    moved = [_PLACEMENTS[0], ("FakeSlider", 2, 0, 1, 3, 5, 5)]
+    assert cache.get("tab", 2, moved) is None
+    replaced = [_PLACEMENTS[0], ("SelectBox", 1, 0, 1, 3, 5, 5)]
+    assert cache.get("tab", 2, replaced) is None
+
+
+def test_graph_without_placements_ignored(tmpdir):
+    """Ensures that graphs saved before placements were recorded aren't used"""
+    cache_file = tmpdir.join("navigation_cache.json")
+    cache_file.write('{"tab": {"num_controls": 2, "edges": [[0, "controlUp", 1]]}}')
+    assert NavigationCache(str(cache_file)).get("tab", 2, _PLACEMENTS) is None